@@ -0,0 +1,114 @@
+"""Benchmarks of the public checks in the format used by airspeed velocity (asv).
+
+Each `time_*` method is timed and each `peakmem_*` method has its peak memory recorded for
+every combination of `params`. Run them with `asv run` from the root of the repository, or run
+`python -m benchmarks.scaling` for scaling curves without installing asv.
+"""
+# local imports
+from datasurveyor import CategoricalFeatures, GeneralFeatures, Survey, UniqueFeatures
+from .cases import CASES
+from .generators import make_frame
+
+
+class Checks:
+    """Scaling of every public check with the number of rows and columns."""
+
+    params = ([10_000, 100_000, 1_000_000], [1, 10], list(CASES))
+    param_names = ['n_rows', 'n_cols', 'check']
+    timeout = 120
+
+    def setup(self, n_rows, n_cols, check):
+        case = CASES[check]
+        self.data = make_frame(n_rows, n_cols, case.kind, null_density=0.0)
+        self.func, self.kwargs = case.func, case.kwargs
+
+    def time_check(self, n_rows, n_cols, check):
+        self.func(self.data, **self.kwargs)
+
+    def peakmem_check(self, n_rows, n_cols, check):
+        self.func(self.data, **self.kwargs)
+
+
+class Cardinality:
+    """Scaling of the checks that count distinct values with the number of distinct values."""
+
+    params = ([10, 1_000, 100_000], ['exact', 'approx'])
+    param_names = ['cardinality', 'mode']
+
+    def setup(self, cardinality, mode):
+        self.data = make_frame(1_000_000, 1, 'categorical', cardinality=cardinality)
+        self.approx = mode == 'approx'
+
+    def time_n_categories(self, cardinality, mode):
+        CategoricalFeatures.check_n_categories(self.data, approx=self.approx)
+
+    def peakmem_n_categories(self, cardinality, mode):
+        CategoricalFeatures.check_n_categories(self.data, approx=self.approx)
+
+    def time_mostly_same(self, cardinality, mode):
+        CategoricalFeatures.check_mostly_same(self.data, thresh=0.95, heavy_hitters=self.approx)
+
+    def peakmem_mostly_same(self, cardinality, mode):
+        CategoricalFeatures.check_mostly_same(self.data, thresh=0.95, heavy_hitters=self.approx)
+
+
+class NullDensity:
+    """Scaling of the null checks with the proportion of nulls."""
+
+    params = [0.0, 0.1, 0.5]
+    param_names = ['null_density']
+
+    def setup(self, null_density):
+        self.numeric = make_frame(1_000_000, 5, 'float', null_density=null_density)
+        self.strings = make_frame(1_000_000, 5, 'categorical', null_density=null_density)
+
+    def time_nulls(self, null_density):
+        GeneralFeatures.check_nulls(self.numeric)
+
+    def time_fuzzy_nulls(self, null_density):
+        GeneralFeatures.check_fuzzy_nulls(self.strings)
+
+    def time_fuzzy_nulls_normalized(self, null_density):
+        GeneralFeatures.check_fuzzy_nulls(self.strings, patterns=[r'n/?a'], normalize=True)
+
+
+class Uniqueness:
+    """Exact versus approximate uniqueness checks on wide unique data."""
+
+    params = ['exact', 'approx']
+    param_names = ['mode']
+
+    def setup(self, mode):
+        self.data = make_frame(1_000_000, 5, 'unique')
+        self.approx = mode == 'approx'
+
+    def time_uniqueness(self, mode):
+        UniqueFeatures.check_uniqueness(self.data, approx=self.approx)
+
+    def peakmem_uniqueness(self, mode):
+        UniqueFeatures.check_uniqueness(self.data, approx=self.approx)
+
+
+class Surveys:
+    """A survey of several checks against calling each of the checks separately."""
+
+    params = [100_000, 1_000_000]
+    param_names = ['n_rows']
+
+    def setup(self, n_rows):
+        self.data = make_frame(n_rows, 10, 'categorical')
+        self.checks = [
+            (CategoricalFeatures.check_mostly_same, {'thresh': 0.95}),
+            CategoricalFeatures.check_n_categories,
+            GeneralFeatures.check_nulls,
+            GeneralFeatures.check_fuzzy_nulls,
+        ]
+
+    def time_survey(self, n_rows):
+        Survey(self.data, self.checks).run()
+
+    def time_separate_checks(self, n_rows):
+        CategoricalFeatures.check_mostly_same(self.data, thresh=0.95)
+        CategoricalFeatures.check_n_categories(self.data)
+        GeneralFeatures.check_nulls(self.data)
+        GeneralFeatures.check_fuzzy_nulls(self.data)
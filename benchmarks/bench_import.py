@@ -0,0 +1,63 @@
+"""Benchmarks of the time taken to import datasurveyor in a fresh interpreter.
+
+The `timeraw_*` methods are run by airspeed velocity in a new process each time, so modules
+already imported by the benchmark runner do not hide the import cost. Run this module directly
+to print the same timings without installing asv:
+
+    python -m benchmarks.bench_import
+"""
+# standard library imports
+import statistics
+import subprocess
+import sys
+from typing import Dict
+
+
+# statements timed in a fresh interpreter, from the bare package to a fully loaded one
+STATEMENTS = {
+    'package': 'import datasurveyor',
+    'feature_class': 'from datasurveyor import GeneralFeatures',
+    'all': 'from datasurveyor import *',
+}
+
+
+class ImportTime:
+    """Import time of the package and of its public classes."""
+
+    def timeraw_import_package(self):
+        return STATEMENTS['package']
+
+    def timeraw_import_feature_class(self):
+        return STATEMENTS['feature_class']
+
+    def timeraw_import_all(self):
+        return STATEMENTS['all']
+
+
+def measure(statement: str, repeat: int = 5) -> float:
+    """Measures the time taken to run a statement in a fresh interpreter.
+
+    Args:
+        statement: Statement to be run (e.g. an import).
+        repeat: Number of interpreters started (the median is kept).
+
+    Returns:
+        Median wall time in seconds, excluding the start-up time of the interpreter itself.
+    """
+    code = f'import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)'
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True)
+        times.append(float(output.stdout))
+    return statistics.median(times)
+
+
+def main() -> Dict[str, float]:
+    results = {name: measure(statement) for name, statement in STATEMENTS.items()}
+    for name, seconds in results.items():
+        print(f'{name:<15}{seconds * 1000:>10.1f} ms')
+    return results
+
+
+if __name__ == '__main__':
+    main()
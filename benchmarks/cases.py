@@ -0,0 +1,32 @@
+# standard library imports
+from typing import Any, Callable, Dict, NamedTuple
+# local imports
+from datasurveyor import BinaryFeatures, CategoricalFeatures, GeneralFeatures, UniqueFeatures
+
+
+class Case(NamedTuple):
+    """Describes how a public check is benchmarked.
+
+    Attributes:
+        kind: Kind of synthetic columns the check is run on (see `generators.KINDS`).
+        func: Check to be benchmarked.
+        kwargs: Arguments passed to the check.
+    """
+    kind: str
+    func: Callable
+    kwargs: Dict[str, Any]
+
+
+CASES = {
+    'BinaryFeatures.check_all_same': Case('binary', BinaryFeatures.check_all_same, {}),
+    'BinaryFeatures.check_mostly_same': Case('binary', BinaryFeatures.check_mostly_same, {'thresh': 0.95}),
+    'BinaryFeatures.check_outside_range': Case('binary', BinaryFeatures.check_outside_range, {}),
+    'CategoricalFeatures.check_mostly_same': Case(
+        'categorical', CategoricalFeatures.check_mostly_same, {'thresh': 0.95},
+    ),
+    'CategoricalFeatures.check_n_categories': Case('categorical', CategoricalFeatures.check_n_categories, {}),
+    'GeneralFeatures.check_nulls': Case('float', GeneralFeatures.check_nulls, {}),
+    'GeneralFeatures.check_fuzzy_nulls': Case('categorical', GeneralFeatures.check_fuzzy_nulls, {}),
+    'UniqueFeatures.check_uniqueness': Case('unique', UniqueFeatures.check_uniqueness, {}),
+    'UniqueFeatures.find_duplicates': Case('unique', UniqueFeatures.find_duplicates, {}),
+}
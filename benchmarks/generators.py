@@ -0,0 +1,85 @@
+# standard library imports
+from typing import Optional
+# third party imports
+import numpy as np
+import pandas as pd
+
+
+# kinds of synthetic columns, each suited to one of the feature classes
+KINDS = ('binary', 'bool', 'categorical', 'unique', 'float')
+
+
+def make_column(
+        kind: str,
+        n_rows: int,
+        cardinality: int = 10,
+        null_density: float = 0.0,
+        seed: Optional[int] = 0,
+) -> pd.Series:
+    """Generates a synthetic column.
+
+    Args:
+        kind: Kind of column, one of `KINDS`:
+            binary: int64 zeros and ones.
+            bool: True and False.
+            categorical: strings drawn from `cardinality` categories with a skewed distribution.
+            unique: distinct int64 identifiers.
+            float: standard normal float64 values.
+        n_rows: Number of rows.
+        cardinality: Number of categories of a categorical column.
+        null_density: Proportion of rows set to null (the column is upcast where needed, so
+            nulls are skipped for bool, binary, and unique columns).
+        seed: Seed of the random number generator.
+
+    Returns:
+        The generated column.
+
+    Raises:
+        ValueError: If `kind` is not recognized.
+    """
+    rng = np.random.default_rng(seed)
+    if kind == 'binary':
+        return pd.Series(rng.integers(0, 2, n_rows), dtype='int64')
+    if kind == 'bool':
+        return pd.Series(rng.random(n_rows) < 0.5)
+    if kind == 'unique':
+        return pd.Series(rng.permutation(n_rows), dtype='int64')
+    if kind == 'categorical':
+        # Zipf-like weights, so a few categories dominate as in most real categorical data
+        weights = 1 / np.arange(1, cardinality + 1)
+        codes = rng.choice(cardinality, size=n_rows, p=weights / weights.sum())
+        values = np.array([f'cat_{i}' for i in range(cardinality)], dtype=object)[codes]
+    elif kind == 'float':
+        values = rng.standard_normal(n_rows)
+    else:
+        raise ValueError(f'Unknown column kind: {kind}. Expected one of {KINDS}.')
+    if null_density:
+        values[rng.random(n_rows) < null_density] = np.nan
+    return pd.Series(values)
+
+
+def make_frame(
+        n_rows: int,
+        n_cols: int,
+        kind: str,
+        cardinality: int = 10,
+        null_density: float = 0.0,
+        seed: int = 0,
+) -> pd.DataFrame:
+    """Generates a synthetic DataFrame of columns of a single kind.
+
+    Args:
+        n_rows: Number of rows.
+        n_cols: Number of columns.
+        kind: Kind of columns, one of `KINDS`.
+        cardinality: Number of categories of categorical columns.
+        null_density: Proportion of rows set to null in each column that can hold nulls.
+        seed: Seed of the random number generator (each column uses a different seed).
+
+    Returns:
+        The generated DataFrame with columns named c0, c1, ...
+    """
+    return pd.DataFrame({
+        f'c{i}': make_column(kind, n_rows, cardinality, null_density, seed + i)
+        for i in range(n_cols)
+    })
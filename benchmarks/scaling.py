@@ -0,0 +1,153 @@
+"""Measures how the wall time and peak memory of each public check scale with the data.
+
+Usage (from the root of the repository):
+
+    python -m benchmarks.scaling --rows 10000 100000 1000000 --cols 1 10 --csv scaling.csv --plot scaling.png
+
+The measurements are printed along with the fitted scaling exponent of each check (the slope of
+log time against log rows, so 1.0 is linear). Plotting requires matplotlib.
+"""
+# standard library imports
+import argparse
+import gc
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence
+# third party imports
+import numpy as np
+import pandas as pd
+# local imports
+from .cases import CASES
+from .generators import make_frame
+
+
+def measure(func: Callable, data: pd.DataFrame, kwargs: Dict, repeat: int = 3) -> Dict[str, float]:
+    """Measures the wall time and peak memory of a single check.
+
+    Args:
+        func: Check to be measured.
+        data: Data passed to the check.
+        kwargs: Arguments passed to the check.
+        repeat: Number of timed runs (the fastest is kept).
+
+    Returns:
+        Dict with the wall time in seconds and the peak memory allocated in MiB.
+    """
+    gc.collect()
+    seconds = min(timeit.repeat(lambda: func(data, **kwargs), number=1, repeat=repeat))
+    # memory is traced in a separate run, since tracing slows the check down
+    tracemalloc.start()
+    try:
+        func(data, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': seconds, 'peak_mib': peak / 2 ** 20}
+
+
+def run(
+        rows: Sequence[int],
+        cols: Sequence[int],
+        checks: Optional[Sequence[str]] = None,
+        cardinality: int = 10,
+        null_density: float = 0.0,
+        repeat: int = 3,
+) -> pd.DataFrame:
+    """Measures every requested check over a grid of data sizes.
+
+    Args:
+        rows: Numbers of rows to measure.
+        cols: Numbers of columns to measure.
+        checks: Qualified names of the checks to measure (all public checks if None).
+        cardinality: Number of categories of categorical columns.
+        null_density: Proportion of nulls in columns that can hold nulls.
+        repeat: Number of timed runs per measurement (the fastest is kept).
+
+    Returns:
+        DataFrame with a row per check and data size.
+    """
+    records = []
+    for name in checks or list(CASES):
+        case = CASES[name]
+        for n_cols in cols:
+            for n_rows in rows:
+                data = make_frame(n_rows, n_cols, case.kind, cardinality, null_density)
+                result = measure(case.func, data, case.kwargs, repeat)
+                records.append({'check': name, 'n_rows': n_rows, 'n_cols': n_cols, **result})
+    results = pd.DataFrame.from_records(records)
+    results['rows_per_sec'] = results['n_rows'] * results['n_cols'] / results['seconds']
+    return results
+
+
+def scaling_exponents(results: pd.DataFrame) -> pd.Series:
+    """Fits the exponent of the growth of wall time with the number of rows.
+
+    Args:
+        results: Measurements, as returned by `run`.
+
+    Returns:
+        Slope of log time against log rows per check and number of columns.
+    """
+    def slope(group: pd.DataFrame) -> float:
+        if group['n_rows'].nunique() < 2:
+            return np.nan
+        return np.polyfit(np.log(group['n_rows']), np.log(group['seconds']), 1)[0]
+
+    return results.groupby(['check', 'n_cols']).apply(slope).rename('exponent')
+
+
+def plot(results: pd.DataFrame, path: str) -> None:
+    """Plots the scaling curves of wall time and peak memory.
+
+    Args:
+        results: Measurements, as returned by `run`.
+        path: Path of the image to be written.
+
+    Raises:
+        ImportError: If matplotlib is not installed.
+    """
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError as e:
+        raise ImportError('Plotting scaling curves requires matplotlib.') from e
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    for (name, n_cols), group in results.groupby(['check', 'n_cols']):
+        label = f'{name} ({n_cols} cols)'
+        axes[0].plot(group['n_rows'], group['seconds'], marker='o', label=label)
+        axes[1].plot(group['n_rows'], group['peak_mib'], marker='o', label=label)
+    for ax, ylabel in zip(axes, ('wall time (s)', 'peak memory (MiB)')):
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('rows')
+        ax.set_ylabel(ylabel)
+    axes[1].legend(fontsize='small', loc='upper left', bbox_to_anchor=(1.0, 1.0))
+    fig.tight_layout()
+    fig.savefig(path)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--cols', type=int, nargs='+', default=[1, 10])
+    parser.add_argument('--checks', nargs='+', choices=list(CASES), help='checks to measure (default: all)')
+    parser.add_argument('--cardinality', type=int, default=10)
+    parser.add_argument('--null-density', type=float, default=0.0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--csv', help='path of a CSV file to write the measurements to')
+    parser.add_argument('--plot', help='path of an image to plot the scaling curves to')
+    args = parser.parse_args(argv)
+    results = run(args.rows, args.cols, args.checks, args.cardinality, args.null_density, args.repeat)
+    with pd.option_context('display.width', 200, 'display.max_rows', None):
+        print(results.to_string(index=False, float_format='{:.4g}'.format))
+        print()
+        print(scaling_exponents(results).to_string(float_format='{:.2f}'.format))
+    if args.csv:
+        results.to_csv(args.csv, index=False)
+    if args.plot:
+        plot(results, args.plot)
+
+
+if __name__ == '__main__':
+    main()
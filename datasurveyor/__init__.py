@@ -1,16 +1,79 @@
 """Data exploration tools."""
+# standard library imports
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
 __version__ = '0.0.1'
 
 
-# Binary feature checks
-from datasurveyor._binary_features import BinaryFeatures
-# Categorical feature checks
-from datasurveyor._categorical_features import CategoricalFeatures
-# General feature checks
-from datasurveyor._general_features import GeneralFeatures
-# Unique feature checks
-from datasurveyor._unique_features import UniqueFeatures
+# public classes and the private modules defining them; modules are imported on first access,
+# so importing the package does not import pandas, numpy, or the checks that go unused
+_LAZY = {
+    # Binary feature checks
+    'BinaryFeatures': '_binary_features',
+    # Categorical feature checks
+    'CategoricalFeatures': '_categorical_features',
+    # General feature checks
+    'GeneralFeatures': '_general_features',
+    # Unique feature checks
+    'UniqueFeatures': '_unique_features',
+    # Fused survey of multiple checks
+    'Survey': '_survey',
+    # Chunked survey of data larger than memory
+    'StreamingSurvey': '_streaming',
+    # Mergeable per-column summaries
+    'ColumnSummary': '_summary',
+    # Cache of chunk summaries for incremental surveys
+    'SummaryCache': '_cache',
+    # Row sampling for estimated checks
+    'Sampler': '_sampling',
+    # Timing and memory instrumentation of checks
+    'Profiler': '_profiling',
+    # Survey of a database table compiled into aggregate queries
+    'SqlSurvey': '_sql',
+    # Bit-packed masks of null and fuzzy null cells
+    'NullMask': '_masks',
+}
 
+if TYPE_CHECKING:
+    from datasurveyor._binary_features import BinaryFeatures
+    from datasurveyor._cache import SummaryCache
+    from datasurveyor._categorical_features import CategoricalFeatures
+    from datasurveyor._general_features import GeneralFeatures
+    from datasurveyor._masks import NullMask
+    from datasurveyor._profiling import Profiler
+    from datasurveyor._sampling import Sampler
+    from datasurveyor._sql import SqlSurvey
+    from datasurveyor._streaming import StreamingSurvey
+    from datasurveyor._summary import ColumnSummary
+    from datasurveyor._survey import Survey
+    from datasurveyor._unique_features import UniqueFeatures
 
-__all__ = [_binary_features, _categorical_features, _general_features, _unique_features]
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'{__name__}.{_LAZY[name]}'), name)
+    # cache the class in the package namespace, so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__all__ = [
+    'BinaryFeatures',
+    'CategoricalFeatures',
+    'GeneralFeatures',
+    'UniqueFeatures',
+    'Survey',
+    'StreamingSurvey',
+    'ColumnSummary',
+    'SummaryCache',
+    'Sampler',
+    'Profiler',
+    'SqlSurvey',
+    'NullMask',
+]
@@ -0,0 +1,7 @@
+# standard library imports
+import sys
+# local imports
+from datasurveyor._cli import main
+
+
+sys.exit(main())
@@ -0,0 +1,197 @@
+# standard library imports
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Tuple, Union
+# third party imports
+import numpy as np
+import pandas as pd
+# local imports
+from datasurveyor import _dtypes, _grouped, _kernels, _sketches
+from datasurveyor._dtypes import _column_mode_count
+from datasurveyor._fuzzy_nulls import FuzzyNullMatcher
+from datasurveyor._survey import CHECKS, REDUCED_STATS, StatKey, parse_check
+
+
+def check_many(
+        feature_class: type,
+        data: Union[Mapping[Hashable, pd.Series], Iterable[pd.Series]],
+        check: Union[str, Callable],
+        **kwargs: Any,
+) -> pd.DataFrame:
+    """Runs a check of a feature class over many independent Series, building one output at the end.
+
+    Checking a Series directly validates it, computes its statistics, and builds a one row
+    DataFrame, and for small Series the fixed cost of building each DataFrame dominates. Here
+    the dtypes are validated once per distinct dtype, Series sharing a dtype are stacked so that
+    each statistic is computed for all of them in a single grouped pass, and a single output is
+    built from the statistics of every Series.
+    Each Series is checked like a column of a DataFrame (so e.g. nulls compete for the most
+    common category unless `dropna` is True). Heavy hitter checks are answered exactly, and
+    checks cannot be estimated with a sketch (`approx`).
+
+    Args:
+        feature_class: Feature class the check belongs to.
+        data: Series to be checked, as a dict mapping names to Series or an iterable of Series
+            (named after their `name`, or their position if unnamed).
+        check: Check to be run: its name (e.g. 'check_all_same') or the check itself.
+        **kwargs: Arguments of the check.
+
+    Returns:
+        DataFrame with a row per Series, as output by the check on a DataFrame with a column per
+        Series.
+
+    Raises:
+        TypeError: If an item is not a pandas Series or has a dtype the check does not accept.
+        ValueError: If the check is not a check of `feature_class` that can be run from statistics,
+            is estimated with a sketch, an argument is invalid, or a Series checked for uniqueness
+            contains nulls.
+    """
+    if isinstance(check, str) and '.' not in check:
+        check = f'{feature_class.__name__}.{check}'
+    parsed = parse_check((check, kwargs))
+    if not parsed.name.startswith(f'{feature_class.__name__}.'):
+        raise ValueError(f'{parsed.name} is not a check of {feature_class.__name__}.')
+    if parsed.kwargs.get('approx'):
+        raise ValueError('Approximate checks cannot be run on many Series. Call the check directly.')
+    names, series = _collect(data)
+    spec = CHECKS[parsed.name]
+    # validators only read dtypes, so each distinct dtype is validated once on an empty Series
+    for dtype in dict.fromkeys(column.dtype for column in series):
+        spec.validate(pd.Series([], dtype=dtype), parsed.kwargs)
+    index = pd.Index(names)
+    stats = _compute(spec.stats(parsed.kwargs), series)
+    n_rows = pd.Series([column.shape[0] for column in series], index=index, dtype='int64')
+    return spec.build(lambda key: _to_series(key, stats[key], index), n_rows, parsed.kwargs)
+
+
+def _collect(
+        data: Union[Mapping[Hashable, pd.Series], Iterable[pd.Series]],
+) -> Tuple[List[Hashable], List[pd.Series]]:
+    # a DataFrame or Series is rejected, since iterating over it yields column names or values
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        raise TypeError('Input data must be a dict or an iterable of pandas Series.')
+    if isinstance(data, Mapping):
+        names, series = list(data.keys()), list(data.values())
+    else:
+        series = list(data)
+        names = [getattr(column, 'name', None) for column in series]
+        names = [i if name is None else name for i, name in enumerate(names)]
+    if not all(isinstance(column, pd.Series) for column in series):
+        raise TypeError('Input data must be a dict or an iterable of pandas Series.')
+    return names, series
+
+
+def _compute(keys: List[StatKey], series: List[pd.Series]) -> Dict[StatKey, List[Any]]:
+    stats: Dict[StatKey, List[Any]] = {key: [None] * len(series) for key in keys}
+    # Series sharing a dtype are concatenated and computed together, while empty Series (which
+    # would form no group) and Series of a dtype no other Series shares are computed on their own
+    batches: Dict[Any, List[int]] = {}
+    alone = []
+    for i, column in enumerate(series):
+        if column.shape[0]:
+            batches.setdefault(column.dtype, []).append(i)
+        else:
+            alone.append(i)
+    for positions in batches.values():
+        if len(positions) == 1:
+            alone.extend(positions)
+        else:
+            _compute_batch(keys, series, positions, stats)
+    reduced = [key for key in keys if key in REDUCED_STATS]
+    matchers = {key: FuzzyNullMatcher(*key[1:]) for key in keys if key[0] == 'fuzzy_null_count'}
+    for i in alone:
+        column = series[i]
+        if reduced:
+            found = dict(zip(REDUCED_STATS, _min_max_mean(column)))
+            for key in reduced:
+                stats[key][i] = found[key]
+        for key in keys:
+            stat = key[0]
+            if stat == 'null_count':
+                stats[key][i] = _dtypes.count_nulls(column)
+            elif stat == 'nunique':
+                stats[key][i] = column.nunique(dropna=key[1])
+            elif stat == 'mode':
+                stats[key][i] = _column_mode_count(column, dropna=key[1])
+            elif stat == 'top':
+                stats[key][i] = _sketches.top_categories(column, k=key[3], dropna=key[1])
+            elif stat == 'fuzzy_null_count':
+                stats[key][i] = matchers[key].count(column)
+    return stats
+
+
+def _compute_batch(
+        keys: List[StatKey],
+        series: List[pd.Series],
+        positions: List[int],
+        stats: Dict[StatKey, List[Any]],
+) -> None:
+    # the Series are stacked and each row labelled with the position of its Series, so that each
+    # statistic is computed for all of them at once, as `_grouped` computes it for each group
+    values = pd.concat([series[i] for i in positions], ignore_index=True)
+    ids = np.repeat(np.arange(len(positions)), [series[i].shape[0] for i in positions])
+    batch = pd.RangeIndex(len(positions))
+    counts = None
+    for key in keys:
+        stat = key[0]
+        if stat == 'null_count':
+            found = np.bincount(ids, weights=values.isna().to_numpy(), minlength=len(batch)).astype(np.int64)
+        elif key in REDUCED_STATS:
+            found = values.groupby(ids).agg(_grouped.AGGREGATED_STATS[stat])
+        elif stat == 'fuzzy_null_count':
+            mask = FuzzyNullMatcher(*key[1:]).mask(values)
+            found = np.bincount(ids, weights=mask, minlength=len(batch)).astype(np.int64)
+        else:
+            if counts is None:
+                counts = _count_values(values, ids, len(batch))
+            if stat == 'nunique':
+                present = counts.index.get_level_values(0)
+                if key[1]:
+                    present = present[counts.index.codes[1] != -1]
+                found = np.bincount(present, minlength=len(batch))
+            elif stat == 'mode':
+                found = list(zip(*_grouped._modes(counts, batch, dropna=key[1])))
+            else:
+                found = _grouped._top(counts, batch, k=key[3], dropna=key[1])
+        for i, value in zip(positions, found):
+            stats[key][i] = value
+
+
+def _count_values(values: pd.Series, ids: np.ndarray, n_series: int) -> pd.Series:
+    # the values are factorized once, and each pair of a Series and a value code is then counted,
+    # giving the counts `groupby([series, value]).size()` would (with nulls under a null value)
+    codes, uniques = pd.factorize(values)
+    n_codes = len(uniques) + 1
+    pairs = ids * n_codes + (codes + 1)
+    if n_series * n_codes <= 2 * len(pairs):
+        # few distinct values, so every possible pair is counted directly, without hashing
+        n = np.bincount(pairs, minlength=n_series * n_codes)
+        pairs = np.flatnonzero(n)
+        n = n[pairs]
+    else:
+        pair_codes, pairs = pd.factorize(pairs)
+        n = np.bincount(pair_codes)
+    index = pd.MultiIndex(
+        levels=[pd.RangeIndex(n_series), uniques],
+        codes=[pairs // n_codes, pairs % n_codes - 1],
+        verify_integrity=False,
+    )
+    return pd.Series(n, index=index)
+
+
+def _min_max_mean(column: pd.Series) -> Tuple[Any, Any, float]:
+    # boolean and integer NumPy columns are reduced straight from their values, skipping pandas
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in _kernels.KERNEL_KINDS:
+        values = column.to_numpy()
+        if not values.size:
+            return np.nan, np.nan, np.nan
+        return values.min(), values.max(), values.mean(dtype=np.float64)
+    reduced = _kernels.min_max_sum(column.to_frame())
+    return reduced.min.iloc[0], reduced.max.iloc[0], reduced.mean.iloc[0]
+
+
+def _to_series(key: StatKey, values: List[Any], index: pd.Index) -> Any:
+    if key[0] == 'mode':
+        most_common = pd.Series([value for value, _ in values], index=index, dtype=object).infer_objects()
+        return most_common, pd.Series([count for _, count in values], index=index, dtype='int64')
+    if key[0] == 'top':
+        return pd.Series(values, index=index, dtype=object)
+    return pd.Series(values, index=index).infer_objects()
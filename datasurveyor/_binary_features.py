@@ -1,10 +1,10 @@
 # standard library imports
-from typing import Union
+from typing import Any, Callable, Hashable, Iterable, Mapping, Optional, Tuple, Union
 # third party imports
-import numpy as np
 import pandas as pd
 # local imports
-from datasurveyor import _utils
+from datasurveyor import _columnar, _dtypes, _kernels, _parallel, _partitioned, _profiling, _sampling, _utils
+from datasurveyor._sampling import Sampler
 
 
 class BinaryFeatures:
@@ -13,6 +13,9 @@ class BinaryFeatures:
     def _validate_binary_dtype(data: Union[pd.DataFrame, pd.Series]) -> None:
         """Validates that binary data contains only dtype bool or int.
 
+        Nullable (e.g. boolean or Int64) and pyarrow backed boolean and integer dtypes of any
+        width are accepted as they are, without conversion.
+
         Args:
             data: Binary data to be type validated.
 
@@ -23,77 +26,220 @@ class BinaryFeatures:
             TypeError: If `data` contains dtype other than bool or int.
         """
         is_df = _utils.check_if_df(data)
-        err_message = 'Binary feature columns should be of type bool or int64.'
-        types = (np.dtype(bool), np.dtype(int))
+        err_message = (
+            'Binary feature columns should be of type bool or int64 (or another boolean or integer dtype).'
+        )
         if is_df:
-            if not data.dtypes.isin(types).all():
+            if not all(_dtypes.has_kind(dtype, _dtypes.BINARY_KINDS) for dtype in data.dtypes):
                 raise TypeError(err_message)
         else:
-            if data.dtypes not in types:
+            if not _dtypes.has_kind(data.dtypes, _dtypes.BINARY_KINDS):
                 raise TypeError(err_message)
         return
 
     @staticmethod
-    def check_all_same(data: Union[pd.DataFrame, pd.Series]) -> Union[pd.DataFrame]:
+    @_profiling.profiled
+    def check_all_same(
+            data: Union[pd.DataFrame, pd.Series],
+            n_jobs: int = 1,
+    ) -> Union[pd.DataFrame]:
         """Checks if binary data contains all the same value.
 
         Args:
-            data: Binary data to be checked if all values are the same.
+            data: Binary data to be checked if all values are the same (a pandas, polars, or dask
+                DataFrame or Series, a pyarrow Table or RecordBatch, or a list of pandas
+                partitions).
+            n_jobs: Number of worker processes checking blocks of columns in parallel (-1 uses one per CPU).
 
         Returns:
             DataFrame with bool(s) indicating if data contains all the same value.
         """
+        if _columnar.is_columnar(data):
+            return _columnar.run_check(BinaryFeatures.check_all_same, data)
+        if _partitioned.is_partitioned(data):
+            return _partitioned.run_check(BinaryFeatures.check_all_same, data, n_jobs)
         is_df = _utils.check_if_df(data)
         BinaryFeatures._validate_binary_dtype(data)
-        if is_df:
-            result = data.min(axis=0).eq(data.max(axis=0))
-        else:
-            result = data.min() == data.max()
-        return _utils.result_to_df(result, title='all_same')
+        if is_df and n_jobs != 1:
+            return _parallel.run_in_blocks(BinaryFeatures.check_all_same, data, n_jobs)
+        min_, max_, _ = BinaryFeatures._reduce(data)
+        return BinaryFeatures._all_same_result(min_, max_)
 
     @staticmethod
+    @_profiling.profiled
     def check_mostly_same(
             data: Union[pd.DataFrame, pd.Series],
             thresh: float = 0.95,
+            sample: Optional[Union[int, float, Sampler]] = None,
+            confidence: float = 0.95,
+            n_jobs: int = 1,
     ) -> pd.DataFrame:
         """Checks if binary data contains almost all the same value.
 
         Args:
-            data: Binary data to be checked if almost all values are the same.
+            data: Binary data to be checked if almost all values are the same (a pandas, polars, or
+                dask DataFrame or Series, a pyarrow Table or RecordBatch, or a list of pandas
+                partitions).
             thresh: Threshold for what proportion of data must be the same to fail check.
+            sample: If set, the average value(s) are estimated from a sample of rows: a number of
+                rows, a proportion of rows, or a `Sampler` (e.g. for stratified sampling).
+            confidence: Confidence level of the Wilson intervals of the estimates when sampling.
+            n_jobs: Number of worker processes checking blocks of columns in parallel (-1 uses one per CPU).
+                Sampled checks run in a single process.
 
         Returns:
             DataFrame with bool(s) indicating if data contains all the same value, the
-            value of threshold used to determine if mostly same, and the average value(s).
+            value of threshold used to determine if mostly same, and the average value(s). When
+            sampling, the average(s) are estimates and the sample size, the bounds of the
+            intervals of the average(s), and bool(s) indicating if the intervals contain `thresh`
+            or 1 - `thresh` (so the check is uncertain) are added.
 
         Raises:
             ValueError: If `thresh` less than or equal to 0.0 or greater than or equal to 1.0.
         """
+        if _columnar.is_columnar(data):
+            return _columnar.run_check(
+                BinaryFeatures.check_mostly_same, data, thresh=thresh, sample=sample,
+            )
+        if _partitioned.is_partitioned(data):
+            return _partitioned.run_check(
+                BinaryFeatures.check_mostly_same, data, n_jobs, thresh=thresh, sample=sample,
+            )
         _utils.validate_thresh(thresh)
         is_df = _utils.check_if_df(data)
         BinaryFeatures._validate_binary_dtype(data)
-        if is_df:
-            mean = data.mean(axis=0)
-            result = (mean >= thresh) | (mean <= 1 - thresh)
-        else:
-            mean = data.mean()
-            result = mean >= thresh or mean <= 1 - thresh
-        return _utils.result_to_df(data=result, title='mostly_same', thresh=thresh, mean=mean)
+        if sample is not None:
+            _sampling.validate_confidence(confidence)
+            sampled, weights = _sampling.resolve_sampler(sample).draw(data)
+            mean, n_eff = _sampling.weighted_props(_sampling.to_indicators(sampled), weights)
+            if not is_df:
+                mean, n_eff = mean.iloc[0], n_eff.iloc[0]
+            lower, upper = _sampling.wilson_interval(mean, n_eff, confidence)
+            uncertain = (
+                _sampling.straddles(lower, upper, thresh) | _sampling.straddles(lower, upper, 1 - thresh)
+            )
+            result = BinaryFeatures._mostly_same_result(mean, thresh)
+            return _sampling.add_interval(result, 'mean', lower, upper, uncertain, sampled.shape[0])
+        if is_df and n_jobs != 1:
+            return _parallel.run_in_blocks(BinaryFeatures.check_mostly_same, data, n_jobs, thresh=thresh)
+        return BinaryFeatures._mostly_same_result(BinaryFeatures._reduce(data)[2], thresh)
 
     @staticmethod
-    def check_outside_range(data: Union[pd.DataFrame, pd.Series]) -> pd.DataFrame:
+    @_profiling.profiled
+    def check_outside_range(
+            data: Union[pd.DataFrame, pd.Series],
+            n_jobs: int = 1,
+    ) -> pd.DataFrame:
         """Checks if binary data contains columns where min is less than 0 or max is greater than 1.
 
         Args:
-            data: Binary data to be checked if any values are less than 0 or greater than 1.
+            data: Binary data to be checked if any values are less than 0 or greater than 1 (a
+                pandas, polars, or dask DataFrame or Series, a pyarrow Table or RecordBatch, or a
+                list of pandas partitions).
+            n_jobs: Number of worker processes checking blocks of columns in parallel (-1 uses one per CPU).
 
         Returns:
             DataFrame with bool(s) indicating if data contains any values outside of the expected range.
         """
+        if _columnar.is_columnar(data):
+            return _columnar.run_check(BinaryFeatures.check_outside_range, data)
+        if _partitioned.is_partitioned(data):
+            return _partitioned.run_check(BinaryFeatures.check_outside_range, data, n_jobs)
         is_df = _utils.check_if_df(data)
         BinaryFeatures._validate_binary_dtype(data)
-        if is_df:
-            result = (data.min(axis=0) < 0) | (data.max(axis=0) > 1)
-        else:
-            result = data.min() < 0 or data.max() > 1
-        return _utils.result_to_df(data=result, title='outside_range')
+        if is_df and n_jobs != 1:
+            return _parallel.run_in_blocks(BinaryFeatures.check_outside_range, data, n_jobs)
+        min_, max_, _ = BinaryFeatures._reduce(data)
+        return BinaryFeatures._outside_range_result(min_, max_)
+
+    @staticmethod
+    @_profiling.profiled
+    def check_many(
+            data: Union[Mapping[Hashable, pd.Series], Iterable[pd.Series]],
+            check: Union[str, Callable],
+            **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Runs a check over many independent Series, building a single output.
+
+        Dtypes are validated once per distinct dtype and the output is built once for all Series,
+        so each Series costs microseconds rather than the milliseconds of checking it directly.
+        Each Series is checked like a column of a DataFrame. Unlike the checks, a list of Series
+        is treated as separate Series rather than as partitions of a single Series.
+
+        Args:
+            data: Series to be checked, as a dict mapping names to Series or an iterable of Series
+                (named after their `name`, or their position if unnamed).
+            check: Check to be run: its name (e.g. 'check_all_same') or the check itself.
+            **kwargs: Arguments of the check (other than sampling arguments).
+
+        Returns:
+            DataFrame with a row per Series, as output by the check on a DataFrame with a column
+            per Series.
+        """
+        # imported here, since _batch imports this module
+        from datasurveyor._batch import check_many
+        return check_many(BinaryFeatures, data, check, **kwargs)
+
+    @staticmethod
+    def _reduce(data: Union[pd.DataFrame, pd.Series]) -> Tuple[Any, Any, Any]:
+        """Computes the minimum(s), maximum(s), and mean(s) of binary data in a single scan.
+
+        Args:
+            data: Binary data to be reduced.
+
+        Returns:
+            The minimum(s), maximum(s), and mean(s): Series indexed by column for a DataFrame, or
+            scalars for a Series.
+        """
+        if _utils.check_if_df(data):
+            reduced = _kernels.min_max_sum(data)
+            return reduced.min, reduced.max, reduced.mean
+        min_, max_, mean = BinaryFeatures._reduce(data.to_frame())
+        return min_.iloc[0], max_.iloc[0], mean.iloc[0]
+
+    @staticmethod
+    def _all_same_result(
+            min_: Union[pd.Series, bool, int],
+            max_: Union[pd.Series, bool, int],
+    ) -> pd.DataFrame:
+        """Builds the check_all_same output from precomputed minimum(s) and maximum(s).
+
+        Args:
+            min_: Minimum value(s) of the binary data.
+            max_: Maximum value(s) of the binary data.
+
+        Returns:
+            DataFrame with bool(s) indicating if data contains all the same value.
+        """
+        return _utils.result_to_df(data=min_ == max_, title='all_same')
+
+    @staticmethod
+    def _mostly_same_result(mean: Union[pd.Series, float], thresh: float) -> pd.DataFrame:
+        """Builds the check_mostly_same output from precomputed mean(s).
+
+        Args:
+            mean: Average value(s) of the binary data.
+            thresh: Threshold for what proportion of data must be the same to fail check.
+
+        Returns:
+            DataFrame with bool(s) indicating if data contains all the same value, the
+            value of threshold used to determine if mostly same, and the average value(s).
+        """
+        result = (mean >= thresh) | (mean <= 1 - thresh)
+        return _utils.result_to_df(data=result, title='mostly_same', thresh=thresh, mean=mean)
+
+    @staticmethod
+    def _outside_range_result(
+            min_: Union[pd.Series, bool, int],
+            max_: Union[pd.Series, bool, int],
+    ) -> pd.DataFrame:
+        """Builds the check_outside_range output from precomputed minimum(s) and maximum(s).
+
+        Args:
+            min_: Minimum value(s) of the binary data.
+            max_: Maximum value(s) of the binary data.
+
+        Returns:
+            DataFrame with bool(s) indicating if data contains any values outside of the expected range.
+        """
+        return _utils.result_to_df(data=(min_ < 0) | (max_ > 1), title='outside_range')
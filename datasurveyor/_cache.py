@@ -0,0 +1,191 @@
+# standard library imports
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Any, Optional, Union
+# third party imports
+import numpy as np
+import pandas as pd
+
+
+# dtype kinds whose buffers are hashed directly (bool, integer, float, timedelta, datetime)
+BUFFER_KINDS = 'biufmM'
+
+# suffix of the files holding cached entries on disk
+ENTRY_SUFFIX = '.summary'
+
+
+def column_fingerprint(column: pd.Series) -> str:
+    """Fingerprints the content of a column chunk.
+
+    The buffers of numeric and datetime columns are hashed directly. Other columns are hashed
+    row by row with `pd.util.hash_pandas_object`, and the values of object columns holding more
+    than strings through their type and representation, since values that compare equal (such
+    as 1, 1.0, and True) would otherwise hash alike.
+
+    Args:
+        column: Column chunk to be fingerprinted.
+
+    Returns:
+        Hex digest identifying the dtype and values of the chunk.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'{column.dtype}:{column.shape[0]}:'.encode())
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in BUFFER_KINDS:
+        values = np.ascontiguousarray(column.to_numpy())
+    else:
+        if column.dtype == object and pd.api.types.infer_dtype(column, skipna=False) != 'string':
+            column = column.map(lambda value: f'{type(value).__qualname__}:{value!r}')
+        values = pd.util.hash_pandas_object(column, index=False).to_numpy()
+    digest.update(values.view(np.uint8))
+    return digest.hexdigest()
+
+
+def cache_key(*parts: Any) -> str:
+    """Builds a cache key from the representation of its parts.
+
+    Args:
+        *parts: Values identifying the entry (e.g. a fingerprint and a summary configuration).
+
+    Returns:
+        Hex digest usable as a key and as a file name.
+    """
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+class SummaryCache:
+    """Size-bounded least recently used cache of serialized column summaries.
+
+    Entries are kept in memory, or in files within `directory` so they persist between runs.
+    Once the entries exceed `max_bytes`, the least recently used entries are evicted. On disk,
+    the recency of each entry is kept in the modification time of its file.
+
+    Note that entries are deserialized with pickle, so only directories written by trusted
+    processes should be used.
+
+    Args:
+        max_bytes: Maximum total size of the entries.
+        directory: Directory holding the entries on disk (entries are kept in memory if None).
+
+    Raises:
+        ValueError: If `max_bytes` is not a positive integer.
+    """
+
+    def __init__(
+            self,
+            max_bytes: int = 256 * 2 ** 20,
+            directory: Optional[Union[str, os.PathLike]] = None,
+    ) -> None:
+        if not isinstance(max_bytes, int) or max_bytes < 1:
+            raise ValueError('The max_bytes parameter must be a positive integer.')
+        self.max_bytes = max_bytes
+        self.directory = None if directory is None else os.fspath(directory)
+        self.hits = 0
+        self.misses = 0
+        # maps each key to its size (on disk) or its value (in memory), least recently used first
+        self._entries: OrderedDict = OrderedDict()
+        self._n_bytes = 0
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._load_index()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def n_bytes(self) -> int:
+        """Total size of the cached entries."""
+        return self._n_bytes
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Gets an entry, marking it as the most recently used.
+
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            The entry, or None if it is not cached.
+        """
+        if key not in self._entries:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        if self.directory is None:
+            return self._entries[key]
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            # removed by another process sharing the directory
+            self._n_bytes -= self._entries.pop(key)
+            self.hits -= 1
+            self.misses += 1
+            return None
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        """Stores an entry as the most recently used, evicting entries to stay within `max_bytes`.
+
+        Entries larger than `max_bytes` are not stored.
+
+        Args:
+            key: Key of the entry.
+            value: Entry to be stored.
+        """
+        if len(value) > self.max_bytes:
+            return
+        self._remove(key)
+        if self.directory is None:
+            self._entries[key] = value
+        else:
+            # write to a temporary file first, so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(value)
+            os.replace(tmp_path, self._path(key))
+            self._entries[key] = len(value)
+        self._n_bytes += len(value)
+        while self._n_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        for key in list(self._entries):
+            self._remove(key)
+
+    def _size(self, key: str) -> int:
+        entry = self._entries[key]
+        return entry if self.directory is not None else len(entry)
+
+    def _remove(self, key: str) -> None:
+        if key not in self._entries:
+            return
+        self._n_bytes -= self._size(key)
+        del self._entries[key]
+        if self.directory is not None:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    def _load_index(self) -> None:
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(ENTRY_SUFFIX):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime_ns, name[:-len(ENTRY_SUFFIX)], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._entries[key] = size
+            self._n_bytes += size
+        while self._n_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
@@ -1,10 +1,11 @@
 # standard library imports
-from typing import Union
+from typing import Any, Callable, Hashable, Iterable, List, Mapping, Optional, Tuple, Union
 # third party imports
 import numpy as np
 import pandas as pd
 # local imports
-from datasurveyor import _utils
+from datasurveyor import _columnar, _dtypes, _parallel, _partitioned, _profiling, _sampling, _sketches, _utils
+from datasurveyor._sampling import Sampler
 
 
 class CategoricalFeatures:
@@ -13,6 +14,9 @@ class CategoricalFeatures:
     def _validate_categorical_dtype(data: Union[pd.DataFrame, pd.Series]) -> None:
         """Validates that categorical data contains only dtype int or object (str).
 
+        Category, string (including string[pyarrow]), and nullable or pyarrow backed integer
+        dtypes of any width are accepted as they are, without conversion.
+
         Args:
             data: Categorical data to be type validated.
 
@@ -20,78 +24,253 @@ class CategoricalFeatures:
             None
 
         Raises:
-            TypeError: If `data` contains dtype other than bool or object (str).
+            TypeError: If `data` contains dtype other than int or object (str).
         """
         is_df = _utils.check_if_df(data)
-        err_message = 'Unique feature columns should be of type object or int64.'
-        types = (np.dtype('O'), np.dtype(int))
+        err_message = (
+            'Categorical feature columns should be of type object or int64 '
+            '(or another string, category, or integer dtype).'
+        )
         if is_df:
-            if not data.dtypes.isin(types).all():
+            if not all(_dtypes.has_kind(dtype, _dtypes.CATEGORICAL_KINDS) for dtype in data.dtypes):
                 raise TypeError(err_message)
         else:
-            if data.dtypes not in types:
+            if not _dtypes.has_kind(data.dtypes, _dtypes.CATEGORICAL_KINDS):
                 raise TypeError(err_message)
         return
 
     @staticmethod
+    @_profiling.profiled
     def check_mostly_same(
             data: Union[pd.DataFrame, pd.Series],
             thresh: float = 0.95,
             dropna: bool = False,
+            heavy_hitters: bool = False,
+            capacity: int = 100,
+            top_k: Optional[int] = None,
+            sample: Optional[Union[int, float, Sampler]] = None,
+            confidence: float = 0.95,
+            n_jobs: int = 1,
     ) -> pd.DataFrame:
         """Checks if categorical data contains almost all the same category.
 
         Args:
-            data: Categorical data to be checked if almost all the same category.
+            data: Categorical data to be checked if almost all the same category (a pandas, polars,
+                or dask DataFrame or Series, a pyarrow Table or RecordBatch, or a list of pandas
+                partitions).
             thresh: Threshold for what proportion of data must be the same category to fail check.
             dropna: If True: ignores nulls, if False: counts nulls as a category.
+            heavy_hitters: If True: finds the most common category in one pass with a Misra-Gries
+                sketch holding at most `capacity` candidate categories. Counts are then lower
+                bounds, which are exact for any category making up more than 1 / (`capacity` + 1)
+                of the data when fewer than `capacity` categories are present.
+            capacity: Maximum number of candidate categories kept when `heavy_hitters` is True.
+            top_k: Number of most common categories to list (not listed if None).
+            sample: If set, the most common categories and their proportions are estimated from a
+                sample of rows: a number of rows, a proportion of rows, or a `Sampler` (e.g. for
+                stratified sampling). Cannot be combined with `heavy_hitters` or `top_k`.
+            confidence: Confidence level of the Wilson intervals of the estimates when sampling.
+            n_jobs: Number of worker processes checking blocks of columns in parallel (-1 uses one per CPU).
+                Sampled checks run in a single process.
 
         Returns:
             DataFrame with bool(s) indicating if data contains almost all the same category, the
             value of threshold used to determine if mostly same, the most common category, the
-            count of the most common category, and the proportion of the most common category.
+            count of the most common category, the proportion of the most common category, and
+            lists of pairs of the `top_k` most common categories and their counts if `top_k` is set.
+            When sampling, the counts and proportions are estimates and the sample size, the
+            bounds of the intervals of the proportion(s), and bool(s) indicating if the intervals
+            contain `thresh` (so the check is uncertain) are added.
+
+        Raises:
+            ValueError: If `thresh` less than or equal to 0.0 or greater than or equal to 1.0, or
+                `sample` is combined with `heavy_hitters` or `top_k`.
         """
+        if _columnar.is_columnar(data):
+            return _columnar.run_check(
+                CategoricalFeatures.check_mostly_same, data, thresh=thresh, dropna=dropna,
+                heavy_hitters=heavy_hitters, capacity=capacity, top_k=top_k, sample=sample,
+            )
+        if _partitioned.is_partitioned(data):
+            return _partitioned.run_check(
+                CategoricalFeatures.check_mostly_same, data, n_jobs, thresh=thresh, dropna=dropna,
+                heavy_hitters=heavy_hitters, capacity=capacity, top_k=top_k, sample=sample,
+            )
         _utils.validate_thresh(thresh)
         CategoricalFeatures._validate_categorical_dtype(data)
         is_df = _utils.check_if_df(data)
-        if is_df:
-            most_common = data.mode(axis=0, dropna=dropna).loc[0, :]
-            count_common = data.eq(most_common).sum(axis=0)
-            prop_common = count_common.divide(data.shape[0])
-            mostly_same = prop_common.ge(thresh)
-        else:
-            most_common = data.mode()[0]
-            count_common = data.eq(most_common).sum()
-            prop_common = count_common / data.shape[0]
-            mostly_same = prop_common >= thresh
-        result = _utils.result_to_df(
-            mostly_same,
-            title='mostly_same',
-            thresh=thresh,
+        if sample is not None:
+            if heavy_hitters or top_k is not None:
+                raise ValueError('The sample parameter cannot be combined with heavy_hitters or top_k.')
+            _sampling.validate_confidence(confidence)
+            sampled, weights = _sampling.resolve_sampler(sample).draw(data)
+            if is_df:
+                modes = [_sampling.weighted_mode(sampled[column], weights, dropna) for column in data.columns]
+                most_common = pd.Series([mode for mode, _ in modes], index=data.columns).infer_objects()
+                prop = pd.Series([prop for _, prop in modes], index=data.columns)
+            else:
+                # like the unsampled check, a Series ignores nulls when finding the most common category
+                most_common, prop = _sampling.weighted_mode(sampled, weights, dropna=True)
+            lower, upper = _sampling.wilson_interval(prop, _sampling.effective_size(weights), confidence)
+            result = CategoricalFeatures._mostly_same_result(
+                most_common=most_common,
+                count_common=np.round(prop * data.shape[0]).astype('int64'),
+                n_rows=data.shape[0],
+                thresh=thresh,
+            )
+            uncertain = _sampling.straddles(lower, upper, thresh)
+            return _sampling.add_interval(result, 'prop', lower, upper, uncertain, sampled.shape[0])
+        if is_df and n_jobs != 1:
+            return _parallel.run_in_blocks(
+                CategoricalFeatures.check_mostly_same, data, n_jobs, thresh=thresh, dropna=dropna,
+                heavy_hitters=heavy_hitters, capacity=capacity, top_k=top_k,
+            )
+        if heavy_hitters or top_k is not None:
+            top = _sketches.top_categories(data, top_k or 1, dropna, capacity if heavy_hitters else None)
+            most_common, count_common = _sketches.leading_category(top)
+            return CategoricalFeatures._mostly_same_result(
+                most_common=most_common,
+                count_common=count_common,
+                n_rows=data.shape[0],
+                thresh=thresh,
+                top=None if top_k is None else top,
+            )
+        most_common, count_common = _dtypes.mode_count(data, dropna)
+        return CategoricalFeatures._mostly_same_result(
             most_common=most_common,
-            count=count_common,
-            prop=prop_common,
+            count_common=count_common,
+            n_rows=data.shape[0],
+            thresh=thresh,
         )
-        return result
 
     @staticmethod
+    @_profiling.profiled
     def check_n_categories(
             data: Union[pd.DataFrame, pd.Series],
             dropna: bool = False,
+            approx: bool = False,
+            precision: int = 14,
+            n_jobs: int = 1,
     ) -> pd.DataFrame:
         """Counts the number of categories.
 
         Args:
-            data: Data to count categories for.
+            data: Data to count categories for (a pandas, polars, or dask DataFrame or Series, a
+                pyarrow Table or RecordBatch, or a list of pandas partitions).
             dropna: If True: ignores nulls, if False: counts nulls as a category.
+            approx: If True: estimates the count(s) with a HyperLogLog sketch in constant memory.
+            precision: Precision of the sketch used when `approx` is True (4 to 18), where higher
+                precision uses more memory (2 ** `precision` bytes) and is more accurate.
+            n_jobs: Number of worker processes checking blocks of columns in parallel (-1 uses one per CPU).
 
         Returns:
-            DataFrame with count(s) of categories.
+            DataFrame with count(s) of categories, and the standard error(s) of the count(s) if
+            `approx` is True.
         """
+        if _columnar.is_columnar(data):
+            return _columnar.run_check(
+                CategoricalFeatures.check_n_categories, data, dropna=dropna, approx=approx,
+                precision=precision,
+            )
+        if _partitioned.is_partitioned(data):
+            return _partitioned.run_check(
+                CategoricalFeatures.check_n_categories, data, n_jobs, dropna=dropna, approx=approx,
+                precision=precision,
+            )
         CategoricalFeatures._validate_categorical_dtype(data)
         is_df = _utils.check_if_df(data)
+        if is_df and n_jobs != 1:
+            return _parallel.run_in_blocks(
+                CategoricalFeatures.check_n_categories, data, n_jobs, dropna=dropna, approx=approx,
+                precision=precision,
+            )
+        if approx:
+            n_categories, error = _sketches.approx_nunique(data, precision, dropna)
+            return CategoricalFeatures._n_categories_result(n_categories, error)
         if is_df:
             result = data.nunique(axis=0, dropna=dropna)
         else:
             result = data.nunique(dropna=dropna)
-        return _utils.result_to_df(result, title='n_categories')
+        return CategoricalFeatures._n_categories_result(result)
+
+    @staticmethod
+    @_profiling.profiled
+    def check_many(
+            data: Union[Mapping[Hashable, pd.Series], Iterable[pd.Series]],
+            check: Union[str, Callable],
+            **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Runs a check over many independent Series, building a single output.
+
+        Dtypes are validated once per distinct dtype and the output is built once for all Series,
+        so each Series costs microseconds rather than the milliseconds of checking it directly.
+        Each Series is checked like a column of a DataFrame. Unlike the checks, a list of Series
+        is treated as separate Series rather than as partitions of a single Series.
+
+        Args:
+            data: Series to be checked, as a dict mapping names to Series or an iterable of Series
+                (named after their `name`, or their position if unnamed).
+            check: Check to be run: its name (e.g. 'check_n_categories') or the check itself.
+            **kwargs: Arguments of the check (other than sampling arguments).
+
+        Returns:
+            DataFrame with a row per Series, as output by the check on a DataFrame with a column
+            per Series.
+        """
+        # imported here, since _batch imports this module
+        from datasurveyor._batch import check_many
+        return check_many(CategoricalFeatures, data, check, **kwargs)
+
+    @staticmethod
+    def _mostly_same_result(
+            most_common: Any,
+            count_common: Union[pd.Series, int],
+            n_rows: int,
+            thresh: float,
+            top: Optional[Union[pd.Series, List[Tuple[Any, int]]]] = None,
+    ) -> pd.DataFrame:
+        """Builds the check_mostly_same output from precomputed most common categories.
+
+        Args:
+            most_common: Most common category (or categories).
+            count_common: Count(s) of the most common category.
+            n_rows: Number of rows in the categorical data.
+            thresh: Threshold for what proportion of data must be the same category to fail check.
+            top: Pairs of the most common categories and their counts (omitted from the output if None).
+
+        Returns:
+            DataFrame with bool(s) indicating if data contains almost all the same category, the
+            value of threshold used to determine if mostly same, the most common category, the
+            count of the most common category, the proportion of the most common category, and
+            the most common categories if `top` is provided.
+        """
+        prop_common = count_common / n_rows
+        extra = {} if top is None else {'top_categories': top}
+        result = _utils.result_to_df(
+            prop_common >= thresh,
+            title='mostly_same',
+            thresh=thresh,
+            most_common=most_common,
+            count=count_common,
+            prop=prop_common,
+            **extra,
+        )
+        return result
+
+    @staticmethod
+    def _n_categories_result(
+            n_categories: Union[pd.Series, int],
+            error: Optional[Union[pd.Series, float]] = None,
+    ) -> pd.DataFrame:
+        """Builds the check_n_categories output from precomputed category count(s).
+
+        Args:
+            n_categories: Count(s) of categories.
+            error: Standard error(s) of estimated count(s) (omitted from the output if None).
+
+        Returns:
+            DataFrame with count(s) of categories.
+        """
+        if error is None:
+            return _utils.result_to_df(n_categories, title='n_categories')
+        return _utils.result_to_df(n_categories, title='n_categories', n_categories_error=error)
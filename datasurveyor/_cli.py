@@ -0,0 +1,294 @@
+"""Surveys CSV, Parquet, JSON lines, NumPy, and Arrow IPC files from the command line.
+
+Each file is read in chunks and every check relevant to the feature type of each column is run in
+a single scan. The report holds the output of each check for each file, as JSON or Parquet.
+
+Example:
+
+    datasurveyor 'data/*.csv' -t state=categorical -t id=unique -t lylty=binary -o report.json
+"""
+# standard library imports
+import argparse
+import glob
+import itertools
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional
+# third party imports
+import pandas as pd
+# local imports
+from datasurveyor import _inference
+from datasurveyor._parallel import resolve_n_jobs
+from datasurveyor._streaming import StreamingSurvey, iter_chunks
+
+
+REPORT_FORMATS = ('json', 'parquet')
+
+# nullable dtypes of the columns of Parquet reports by dtype kind (other columns are written as strings)
+NULLABLE_KINDS = {'b': 'boolean', 'i': 'Int64', 'u': 'Int64', 'f': 'Float64'}
+
+
+def parse_types(pairs: List[str], types_file: Optional[str] = None) -> Dict[str, str]:
+    """Parses the mapping of columns to feature types.
+
+    Args:
+        pairs: Column and feature type pairs, formatted as COLUMN=TYPE.
+        types_file: Path of a JSON file holding an object mapping columns to feature types.
+
+    Returns:
+        Dict mapping each column to its feature type, with pairs taking precedence over the file.
+
+    Raises:
+        ValueError: If a pair is malformed or a feature type is not recognized.
+    """
+    types = {}
+    if types_file is not None:
+        with open(types_file) as f:
+            types.update(json.load(f))
+    for pair in pairs:
+        column, sep, feature_type = pair.rpartition('=')
+        if not sep or not column:
+            raise ValueError(f'Unable to parse column type {pair!r}. Expected COLUMN=TYPE.')
+        types[column] = feature_type
+    _inference.validate_feature_types(types)
+    return types
+
+
+def expand_paths(patterns: List[str]) -> List[str]:
+    """Expands paths and glob patterns into the list of files to survey.
+
+    Args:
+        patterns: Paths or glob patterns (e.g. 'data/**/*.parquet').
+
+    Returns:
+        Matching paths in the order given, without duplicates.
+
+    Raises:
+        FileNotFoundError: If a pattern matches no files.
+    """
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        matches = [path for path in matches if os.path.isfile(path)]
+        if not matches:
+            raise FileNotFoundError(f'No files match {pattern!r}.')
+        paths.extend(path for path in matches if path not in paths)
+    return paths
+
+
+def survey_file(
+        path: str,
+        types: Dict[str, str],
+        chunksize: int,
+        infer: bool = False,
+        metadata: bool = False,
+) -> Dict[str, Any]:
+    """Surveys a single file in chunks.
+
+    Args:
+        path: Path of a CSV, Parquet, JSON lines, NumPy (.npy), or Arrow IPC file.
+        types: Dict mapping columns to feature types.
+        chunksize: Number of rows per chunk.
+        infer: If True: infers the feature type of the columns missing from `types` from the
+            first chunk, if False: only runs general checks on them (which run on every column).
+        metadata: If True: answers checks of Parquet files from their footer statistics where possible.
+
+    Returns:
+        Dict with the path and either the output of each check or the error raised by the survey.
+    """
+    try:
+        source = path
+        if infer:
+            chunks = iter_chunks(path, chunksize)
+            first = next(chunks, None)
+            if first is not None:
+                types = _inference.resolve_feature_types(first, types)
+                # footers are read from the file, so only the chunks of other files are reused
+                source = path if metadata else itertools.chain([first], chunks)
+        checks = _inference.build_checks(types)
+        survey = StreamingSurvey(source, checks, chunksize=chunksize, metadata=metadata)
+        return {'path': path, 'results': survey.run()}
+    except (ValueError, TypeError, KeyError, OSError, ImportError) as e:
+        return {'path': path, 'error': f'{type(e).__name__}: {e}'}
+
+
+def survey_files(
+        paths: List[str],
+        types: Dict[str, str],
+        chunksize: int = 100_000,
+        workers: int = 1,
+        infer: bool = False,
+        metadata: bool = False,
+) -> List[Dict[str, Any]]:
+    """Surveys files, several at a time in a process pool if `workers` is greater than 1.
+
+    Args:
+        paths: Paths of CSV, Parquet, JSON lines, NumPy (.npy), or Arrow IPC files.
+        types: Dict mapping columns to feature types.
+        chunksize: Number of rows per chunk.
+        workers: Number of worker processes, or -1 to use one per CPU.
+        infer: If True: infers the feature type of the columns missing from `types`.
+        metadata: If True: answers checks of Parquet files from their footer statistics where possible.
+
+    Returns:
+        The survey of each file, as returned by `survey_file`, in the order of `paths`.
+    """
+    workers = min(resolve_n_jobs(workers), len(paths))
+    if workers <= 1:
+        return [survey_file(path, types, chunksize, infer, metadata) for path in paths]
+    # imported here, since most runs survey files one at a time
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(survey_file, path, types, chunksize, infer, metadata) for path in paths]
+        return [future.result() for future in futures]
+
+
+def to_json(surveys: List[Dict[str, Any]]) -> str:
+    """Formats surveys as a JSON report.
+
+    Args:
+        surveys: Surveys of each file, as returned by `survey_files`.
+
+    Returns:
+        JSON array with an object per file, mapping each check to a list of records (one per column).
+    """
+    report = []
+    for survey in surveys:
+        entry = {'path': survey['path']}
+        if 'error' in survey:
+            entry['error'] = survey['error']
+        else:
+            entry['results'] = {
+                name: json.loads(result.to_json(orient='records'))
+                for name, result in survey['results'].items()
+            }
+        report.append(entry)
+    return json.dumps(report, indent=2)
+
+
+def to_frame(surveys: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Formats surveys as a single table, as written to a Parquet report.
+
+    Args:
+        surveys: Surveys of each file, as returned by `survey_files`.
+
+    Returns:
+        DataFrame with a row per file, check, and column, holding the union of the output columns
+        of the checks (null where a check has no such output), plus an error column.
+    """
+    frames = []
+    for survey in surveys:
+        if 'error' in survey:
+            error = {'path': [survey['path']], 'error': [survey['error']]}
+            frames.append(pd.DataFrame(error, dtype='string'))
+            continue
+        for name, result in survey['results'].items():
+            # nullable dtypes keep their type where other checks leave the column null
+            nullable = {
+                column: NULLABLE_KINDS.get(dtype.kind, 'string') for column, dtype in result.dtypes.items()
+            }
+            frames.append(result.astype(nullable).assign(path=survey['path'], check=name))
+    frame = pd.concat(frames, ignore_index=True)
+    leading = ['path', 'check', 'column']
+    trailing = ['error'] if 'error' in frame.columns else []
+    middle = [column for column in frame.columns if column not in leading + trailing]
+    return frame[leading + middle + trailing].astype({'path': 'string', 'check': 'string'})
+
+
+def write_report(surveys: List[Dict[str, Any]], output: Optional[str], report_format: str) -> None:
+    """Writes the report of the surveys.
+
+    Args:
+        surveys: Surveys of each file, as returned by `survey_files`.
+        output: Path of the report (JSON reports are printed to stdout if None).
+        report_format: Format of the report, one of `REPORT_FORMATS`.
+
+    Raises:
+        ValueError: If a Parquet report has no output path.
+        ImportError: If a Parquet report is written without pyarrow installed.
+    """
+    if report_format == 'json':
+        report = to_json(surveys)
+        if output is None:
+            print(report)
+        else:
+            with open(output, 'w') as f:
+                f.write(report + '\n')
+        return
+    if output is None:
+        raise ValueError('Parquet reports require an output path.')
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError('Writing Parquet reports requires pyarrow.') from e
+    import pyarrow as pa
+    pq.write_table(pa.Table.from_pandas(to_frame(surveys), preserve_index=False), output)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='datasurveyor',
+        description=__doc__.splitlines()[0],
+        epilog='Feature types: ' + '; '.join(
+            f'{feature_type}: {", ".join(names)}' for feature_type, names in _inference.FEATURE_CHECKS.items()
+        ),
+    )
+    parser.add_argument(
+        'paths', nargs='+',
+        help='paths or glob patterns of CSV, Parquet, JSON lines, NumPy (.npy), or Arrow IPC files',
+    )
+    parser.add_argument(
+        '-t', '--type', dest='types', action='append', default=[], metavar='COLUMN=TYPE',
+        help=f'feature type of a column, one of: {", ".join(_inference.FEATURE_TYPES)} (repeatable)',
+    )
+    parser.add_argument('--types-file', help='path of a JSON object mapping columns to feature types')
+    parser.add_argument(
+        '--infer', action='store_true',
+        help='infer the feature type of columns without one from the first chunk of each file',
+    )
+    parser.add_argument(
+        '--metadata', action='store_true',
+        help='answer checks of Parquet files from footer statistics, only reading what those cannot answer',
+    )
+    parser.add_argument('-o', '--output', help='path of the report (JSON is printed if omitted)')
+    parser.add_argument(
+        '-f', '--format', choices=REPORT_FORMATS,
+        help='format of the report (inferred from the output path, JSON by default)',
+    )
+    parser.add_argument('--chunksize', type=int, default=100_000, help='number of rows per chunk')
+    parser.add_argument(
+        '-w', '--workers', type=int, default=1,
+        help='number of files surveyed at once in separate processes, or -1 for one per CPU',
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Runs the command line tool.
+
+    Args:
+        argv: Command line arguments (those of the process if None).
+
+    Returns:
+        Exit status: 0 if every file was surveyed, 1 if surveying any file failed.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    report_format = args.format
+    if report_format is None:
+        is_parquet = args.output is not None and args.output.lower().endswith(('.parquet', '.pq'))
+        report_format = 'parquet' if is_parquet else 'json'
+    if args.chunksize < 1:
+        parser.error('--chunksize must be a positive integer')
+    try:
+        types = parse_types(args.types, args.types_file)
+        paths = expand_paths(args.paths)
+        surveys = survey_files(paths, types, args.chunksize, args.workers, args.infer, args.metadata)
+        write_report(surveys, args.output, report_format)
+    except (ValueError, OSError, ImportError) as e:
+        parser.error(str(e))
+    for survey in surveys:
+        if 'error' in survey:
+            print(f'datasurveyor: unable to survey {survey["path"]}: {survey["error"]}', file=sys.stderr)
+    return int(any('error' in survey for survey in surveys))
@@ -0,0 +1,314 @@
+# standard library imports
+from typing import Any, Callable, Hashable, List, Tuple, Union
+# third party imports
+import numpy as np
+import pandas as pd
+# local imports
+from datasurveyor import _partitioned, _sketches
+from datasurveyor._fuzzy_nulls import FuzzyNullMatcher
+
+
+# a pyarrow Table or RecordBatch, or a polars DataFrame or Series
+Columnar = Any
+
+
+def is_arrow(data: Any) -> bool:
+    """Checks if data is a pyarrow Table or RecordBatch (without importing pyarrow).
+
+    Args:
+        data: Data to be checked.
+
+    Returns:
+        True if `data` is a pyarrow Table or RecordBatch.
+    """
+    data_type = type(data)
+    return data_type.__module__.split('.')[0] == 'pyarrow' and data_type.__name__ in ('Table', 'RecordBatch')
+
+
+def is_polars(data: Any) -> bool:
+    """Checks if data is a polars DataFrame or Series (without importing polars).
+
+    Args:
+        data: Data to be checked.
+
+    Returns:
+        True if `data` is a polars DataFrame or Series.
+    """
+    data_type = type(data)
+    return data_type.__module__.split('.')[0] == 'polars' and data_type.__name__ in ('DataFrame', 'Series')
+
+
+def is_columnar(data: Any) -> bool:
+    """Checks if data is held in a columnar format the checks read natively.
+
+    Args:
+        data: Data to be checked.
+
+    Returns:
+        True if `data` is a pyarrow Table or RecordBatch, or a polars DataFrame or Series.
+    """
+    return is_arrow(data) or is_polars(data)
+
+
+def run_check(func: Callable, data: Columnar, **kwargs) -> pd.DataFrame:
+    """Runs a feature check on columnar data with the kernels of its library.
+
+    Null counts, minimums, maximums, sums, and the counts of distinct values are computed by
+    pyarrow or polars, so the data is never converted to pandas. Only the counts of distinct
+    values (used to find the most common values and fuzzy nulls) and the output are pandas objects.
+
+    Args:
+        func: Public check to be run (e.g. `GeneralFeatures.check_nulls`).
+        data: pyarrow Table or RecordBatch, or polars DataFrame or Series.
+        **kwargs: Additional arguments passed to the check.
+
+    Returns:
+        DataFrame with the output of the check.
+
+    Raises:
+        ValueError: If the check samples rows.
+    """
+    # imported here, since _survey imports the feature classes that call this function
+    from datasurveyor._streaming import new_summaries
+    from datasurveyor._survey import check_columns, parse_check
+    if kwargs.get('sample') is not None:
+        raise ValueError('Sampled checks require a pandas DataFrame or Series.')
+    check = parse_check((func.__qualname__, kwargs))
+    series = is_polars(data) and type(data).__name__ == 'Series'
+    _validate(data, check)
+    n_rows = _n_rows(data)
+    if check.kwargs.get('approx'):
+        columns = check_columns(check, _columns(data))
+        sketches, null_counts = [], []
+        for column in columns:
+            values = _column(data, column)
+            # the sketch of the distinct values is the sketch of all values
+            sketch = _sketches.HyperLogLog(check.kwargs['precision']).update(distinct_values(values))
+            sketches.append(sketch)
+            null_counts.append(null_count(values))
+        return _partitioned.approx_result(check, columns, sketches, null_counts, n_rows, series)
+    summaries = new_summaries([check], _columns(data))
+    for column, summary in summaries.items():
+        values = _column(data, column)
+        nulls = null_count(values)
+        counts = value_counts(values) if summary.track_counts or summary.fuzzy_nulls is not None else None
+        fuzzy_null_count = 0
+        if summary.fuzzy_nulls is not None:
+            matcher = FuzzyNullMatcher(summary.fuzzy_nulls, summary.fuzzy_patterns, summary.normalize_fuzzy)
+            fuzzy_null_count = count_fuzzy_nulls(matcher, counts, nulls)
+        min_, max_ = min_max(values) if summary.track_min_max and nulls < n_rows else (None, None)
+        summary.add_stats(
+            n_rows=n_rows,
+            null_count=nulls,
+            min_=min_,
+            max_=max_,
+            sum_=sum_values(values) if summary.track_sum else 0,
+            counts=counts,
+            fuzzy_null_count=fuzzy_null_count,
+        )
+    return _partitioned.summary_result(check, summaries, series)
+
+
+def find_duplicates(data: Columnar, composite: bool, n_examples: int) -> pd.DataFrame:
+    """Runs `UniqueFeatures.find_duplicates` on columnar data.
+
+    Rows are fingerprinted natively. pyarrow columns are encoded as the positions of their values
+    among the distinct values, and composite keys as the positions of their combinations of
+    those, so pyarrow keys cannot collide. polars hashes values and rows to 64 bits, so distinct
+    polars keys may (very rarely) share a fingerprint. Only the sampled duplicated values are
+    converted to Python objects.
+
+    Args:
+        data: pyarrow Table or RecordBatch, or polars DataFrame or Series.
+        composite: If True: checks the columns together as a single composite key.
+        n_examples: Maximum number of duplicated values to report, and of positions for each
+            (at least 2).
+
+    Returns:
+        DataFrame with the output of `UniqueFeatures.find_duplicates`.
+
+    Raises:
+        ValueError: If unique data contains nulls.
+    """
+    from datasurveyor._unique_features import UniqueFeatures
+    UniqueFeatures._validate_unique_dtype(_empty_frame(data))
+    columns = _columns(data)
+    if any(null_count(_column(data, column)) for column in columns):
+        raise ValueError('Columns with unique data should not contain nulls.')
+    series = is_polars(data) and type(data).__name__ == 'Series'
+    n_rows = _n_rows(data)
+    if series or composite:
+        count_dupes, positions = _sketches.duplicate_fingerprints(_fingerprints(data), n_examples)
+        first = [rows[0] for rows in positions]
+        if series:
+            values = data.gather(first).to_list()
+        else:
+            values = list(zip(*[_take(_column(data, column), first) for column in columns]))
+        found = [(count_dupes, values, positions)]
+    else:
+        found = []
+        for column in columns:
+            values = _column(data, column)
+            count_dupes, positions = _sketches.duplicate_fingerprints(_fingerprints(values), n_examples)
+            found.append((count_dupes, _take(values, [rows[0] for rows in positions]), positions))
+    if series or composite:
+        count_dupes = found[0][0]
+    else:
+        count_dupes = pd.Series([count for count, _, _ in found], index=columns)
+    result = UniqueFeatures._uniqueness_result(n_rows - count_dupes, n_rows)
+    result['dupe_values'] = pd.Series([values for _, values, _ in found], dtype=object)
+    result['dupe_positions'] = pd.Series([positions for _, _, positions in found], dtype=object)
+    return result
+
+
+def null_count(column: Any) -> int:
+    """Counts the nulls of a pyarrow or polars column.
+
+    Args:
+        column: pyarrow Array or ChunkedArray, or polars Series.
+
+    Returns:
+        Count of nulls.
+    """
+    if is_polars(column):
+        return int(column.null_count())
+    return int(column.null_count)
+
+
+def min_max(column: Any) -> Tuple[Any, Any]:
+    """Finds the minimum and maximum non-null values of a pyarrow or polars column.
+
+    Args:
+        column: pyarrow Array or ChunkedArray, or polars Series.
+
+    Returns:
+        The minimum and maximum values, as Python objects.
+    """
+    if is_polars(column):
+        return column.min(), column.max()
+    import pyarrow.compute as pc
+    result = pc.min_max(column)
+    return result['min'].as_py(), result['max'].as_py()
+
+
+def sum_values(column: Any) -> Any:
+    """Sums the non-null values of a pyarrow or polars column (booleans count as 1 and 0).
+
+    Args:
+        column: pyarrow Array or ChunkedArray, or polars Series.
+
+    Returns:
+        The sum, as a Python object.
+    """
+    if is_polars(column):
+        return column.sum()
+    import pyarrow.compute as pc
+    total = pc.sum(column).as_py()
+    return 0 if total is None else total
+
+
+def value_counts(column: Any) -> pd.Series:
+    """Counts each non-null value of a pyarrow or polars column.
+
+    Args:
+        column: pyarrow Array or ChunkedArray, or polars Series.
+
+    Returns:
+        Counts indexed by value, in no particular order, as `_dtypes.value_counts` returns them.
+    """
+    if is_polars(column):
+        counts = column.drop_nulls().value_counts()
+        values, counts = counts.to_series(0).to_list(), counts.to_series(1).to_numpy()
+    else:
+        import pyarrow.compute as pc
+        counts = pc.value_counts(column)
+        valid = counts.field('values').is_valid()
+        values = counts.field('values').filter(valid).to_pylist()
+        counts = counts.field('counts').filter(valid).to_numpy()
+    return pd.Series(counts, index=pd.Index(values), dtype='int64')
+
+
+def distinct_values(column: Any) -> pd.Series:
+    """Lists the distinct non-null values of a pyarrow or polars column.
+
+    Args:
+        column: pyarrow Array or ChunkedArray, or polars Series.
+
+    Returns:
+        Series of the distinct values.
+    """
+    if is_polars(column):
+        return pd.Series(column.drop_nulls().unique().to_numpy())
+    import pyarrow.compute as pc
+    return pc.unique(pc.drop_null(column)).to_pandas()
+
+
+def count_fuzzy_nulls(matcher: FuzzyNullMatcher, counts: pd.Series, nulls: int) -> int:
+    """Counts fuzzy nulls from the counts of the distinct values of a column.
+
+    Args:
+        matcher: Matcher of the fuzzy nulls.
+        counts: Count of each non-null value of the column.
+        nulls: Count of nulls of the column.
+
+    Returns:
+        Count of fuzzy nulls.
+    """
+    matched = matcher.mask(pd.Series(counts.index, dtype=counts.index.dtype))
+    nulls_matched = matcher.mask(pd.Series([None], dtype=object))[0]
+    return int(counts.to_numpy()[matched].sum()) + (nulls if nulls_matched else 0)
+
+
+def _columns(data: Columnar) -> List[Hashable]:
+    if is_polars(data) and type(data).__name__ == 'Series':
+        return [data.name]
+    return list(data.columns) if is_polars(data) else list(data.schema.names)
+
+
+def _column(data: Columnar, column: Hashable) -> Any:
+    if is_polars(data):
+        return data if type(data).__name__ == 'Series' else data.get_column(column)
+    return data.column(column)
+
+
+def _n_rows(data: Columnar) -> int:
+    return len(data) if is_polars(data) else data.num_rows
+
+
+def _empty_frame(data: Columnar) -> Union[pd.DataFrame, pd.Series]:
+    # validators only read dtypes, so they get a pandas frame of no rows with the same schema
+    if is_arrow(data):
+        return data.schema.empty_table().to_pandas()
+    if type(data).__name__ == 'Series':
+        return pd.Series(data.head(0).to_numpy(), name=data.name)
+    return pd.DataFrame({column: data.get_column(column).head(0).to_numpy() for column in data.columns})
+
+
+def _validate(data: Columnar, check: Any) -> None:
+    from datasurveyor._survey import CHECKS, check_columns
+    empty = _empty_frame(data)
+    if isinstance(empty, pd.DataFrame):
+        empty = empty.loc[:, check_columns(check, list(empty.columns))]
+    CHECKS[check.name].validate(empty, check.kwargs)
+
+
+def _fingerprints(data: Any) -> np.ndarray:
+    if is_polars(data):
+        return (data.hash() if type(data).__name__ == 'Series' else data.hash_rows()).to_numpy()
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    if isinstance(data, (pa.Array, pa.ChunkedArray)):
+        return pc.index_in(data, value_set=pc.unique(data)).to_numpy()
+    # the codes of each column are combined with those of the columns before it and factorized
+    # again, so the combined codes stay below the number of rows and are exact rather than hashed
+    combined = np.zeros(data.num_rows, dtype=np.int64)
+    for i in range(data.num_columns):
+        codes = _fingerprints(data.column(i)).astype(np.int64)
+        combined = pd.factorize(combined * (int(codes.max(initial=-1)) + 1) + codes)[0]
+    return combined
+
+
+def _take(column: Any, positions: List[int]) -> List[Any]:
+    if is_polars(column):
+        return column.gather(positions).to_list()
+    return column.take(positions).to_pylist()
@@ -0,0 +1,169 @@
+# standard library imports
+from typing import Any, Tuple, Union
+# third party imports
+import numpy as np
+import pandas as pd
+# local imports
+from datasurveyor import _kernels
+
+
+# dtype kinds accepted by each feature class (b: boolean, i/u: integer, O: object, string, or
+# category, M: datetime); kinds cover numpy, nullable (e.g. Int64), and pyarrow backed dtypes alike
+BINARY_KINDS = 'biu'
+CATEGORICAL_KINDS = 'iuO'
+UNIQUE_KINDS = 'iuOM'
+
+
+def has_kind(dtype: Any, kinds: str) -> bool:
+    """Checks if a dtype is of one of the given kinds.
+
+    Args:
+        dtype: Dtype to be checked.
+        kinds: Accepted dtype kinds.
+
+    Returns:
+        True if the dtype is of one of the kinds.
+    """
+    return dtype.kind in kinds
+
+
+def is_arrow(dtype: Any) -> bool:
+    """Checks if a dtype is backed by pyarrow (e.g. string[pyarrow] or int64[pyarrow]).
+
+    Args:
+        dtype: Dtype to be checked.
+
+    Returns:
+        True if the data is stored as pyarrow arrays.
+    """
+    return getattr(dtype, 'storage', None) in ('pyarrow', 'pyarrow_numpy')
+
+
+def is_extension(dtype: Any) -> bool:
+    """Checks if a dtype is a pandas extension dtype other than category.
+
+    Values of these dtypes (e.g. Int64, boolean, or string[pyarrow]) are counted with the
+    methods of their arrays, since generic pandas routines may convert them to Python objects.
+
+    Args:
+        dtype: Dtype to be checked.
+
+    Returns:
+        True if the dtype is an extension dtype other than category.
+    """
+    return not isinstance(dtype, (np.dtype, pd.CategoricalDtype))
+
+
+def arrow_data(column: pd.Series) -> Any:
+    """Gets the pyarrow ChunkedArray backing a column without copying it.
+
+    Args:
+        column: Column of a pyarrow backed dtype.
+
+    Returns:
+        The pyarrow ChunkedArray holding the values of the column.
+    """
+    array = column.array
+    # the attribute holding the ChunkedArray was renamed in pandas 2.1
+    data = getattr(array, '_pa_array', None)
+    return array._data if data is None else data
+
+
+def count_nulls(data: Union[pd.DataFrame, pd.Series]) -> Union[pd.Series, int]:
+    """Counts the nulls in each column.
+
+    NumPy backed columns are counted block by block, a slice of rows at a time, so the boolean
+    mask of the whole data is never materialized (and boolean and integer columns are not read).
+    The null counts of pyarrow backed columns are read from their arrays rather than computed.
+
+    Args:
+        data: Data to count nulls for.
+
+    Returns:
+        Count(s) of nulls.
+    """
+    if isinstance(data, pd.DataFrame):
+        counts = np.zeros(data.shape[1], dtype=np.int64)
+        for positions, values in _kernels.iter_blocks(data):
+            if isinstance(values, np.ndarray):
+                counts[positions] = _kernels.count_missing(values)
+            else:
+                counts[positions] = [count_nulls(data.iloc[:, position]) for position in positions]
+        return pd.Series(counts, index=data.columns)
+    if is_arrow(data.dtype):
+        return arrow_data(data).null_count
+    if isinstance(data.dtype, np.dtype):
+        return _kernels.count_missing(data.to_numpy().reshape(1, -1))[0]
+    return data.isna().sum()
+
+
+def value_counts(column: pd.Series) -> pd.Series:
+    """Counts each non-null value present in a column.
+
+    Category columns are counted from their codes and only observed categories are kept.
+
+    Args:
+        column: Column to count values for.
+
+    Returns:
+        Counts indexed by value, in no particular order.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes = column.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(column.cat.categories))
+        present = counts > 0
+        return pd.Series(counts[present], index=column.cat.categories[present], dtype='int64')
+    counts = column.value_counts(dropna=True, sort=False)
+    return counts.astype('int64') if is_extension(counts.dtype) else counts
+
+
+def mode_count(
+        data: Union[pd.DataFrame, pd.Series],
+        dropna: bool = False,
+) -> Tuple[Any, Union[pd.Series, int]]:
+    """Finds the most common value of each column and its count.
+
+    The result matches taking the first value of `data.mode(...)` and counting it with
+    `data.eq(...)`, but columns of extension dtypes are counted with their own value counts. A
+    Series ignores nulls, as `Series.mode()` does by default.
+
+    Args:
+        data: Data to find the most common values of.
+        dropna: If True: ignores nulls, if False: counts nulls as a value (DataFrames only).
+
+    Returns:
+        The most common value(s) and count(s), where a count is 0 if nulls are most common.
+    """
+    if isinstance(data, pd.Series):
+        if not is_extension(data.dtype):
+            most_common = data.mode()[0]
+            return most_common, data.eq(most_common).sum()
+        return _column_mode_count(data, dropna=True)
+    if not any(is_extension(dtype) for dtype in data.dtypes):
+        most_common = data.mode(axis=0, dropna=dropna).loc[0, :]
+        return most_common, data.eq(most_common).sum(axis=0)
+    parts = []
+    for i in range(data.shape[1]):
+        column = data.iloc[:, i]
+        if is_extension(column.dtype):
+            parts.append(_column_mode_count(column, dropna))
+        else:
+            modes = column.mode(dropna=dropna)
+            most_common = modes.iloc[0] if len(modes) else np.nan
+            parts.append((most_common, int(column.eq(most_common).sum())))
+    most_common = pd.Series([part[0] for part in parts], index=data.columns).infer_objects()
+    return most_common, pd.Series([part[1] for part in parts], index=data.columns, dtype='int64')
+
+
+def _column_mode_count(column: pd.Series, dropna: bool) -> Tuple[Any, int]:
+    counts = value_counts(column)
+    # like `mode`, nulls only win outright, and then count 0 since `eq` never matches them
+    if counts.empty or (not dropna and count_nulls(column) > counts.max()):
+        return np.nan, 0
+    modes = counts[counts == counts.max()]
+    try:
+        # like `mode`, tied values are sorted
+        modes = modes.sort_index()
+    except TypeError:
+        pass
+    return modes.index[0], int(modes.iloc[0])
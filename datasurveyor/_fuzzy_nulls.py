@@ -0,0 +1,151 @@
+# standard library imports
+import re
+from typing import Any, Iterable, Iterator, Optional, Pattern, Tuple, Union
+# third party imports
+import numpy as np
+import pandas as pd
+# local imports
+from datasurveyor import _dtypes, _kernels
+
+
+# dtype kinds that can hold strings, and so may be normalized or matched against patterns
+STRING_KINDS = 'OSU'
+
+
+def normalize_value(value: str) -> str:
+    """Normalizes a string by case folding it and collapsing its whitespace.
+
+    Args:
+        value: String to be normalized.
+
+    Returns:
+        The string in lower case, without leading or trailing whitespace, and with any run of
+        inner whitespace replaced by a single space.
+    """
+    return ' '.join(value.split()).casefold()
+
+
+def _is_null(value: Any) -> bool:
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        # list-like values are never null
+        return False
+
+
+class FuzzyNullMatcher:
+    """Counts values commonly used to denote nulls (fuzzy nulls).
+
+    Each column is factorized into integer codes and its distinct values, so values are
+    normalized and matched against the literal fuzzy nulls and the regex patterns once per
+    distinct value rather than once per row. The row count then only costs a lookup of each code.
+    Without normalization or patterns, a single hash lookup per row (`isin`) is already cheapest.
+    Counts are reduced a slice of rows at a time, looking up the codes of each slice, so only the
+    mask of a slice is held in memory.
+
+    Args:
+        values: Literal values treated as fuzzy nulls.
+        patterns: Regex patterns treated as fuzzy nulls. A string is a fuzzy null if a pattern
+            matches the whole string (after normalization if `normalize` is True).
+        normalize: If True: strings are compared after case folding and collapsing whitespace,
+            so e.g. ' NULL ' matches the literal 'null'.
+    """
+
+    def __init__(
+            self,
+            values: Iterable,
+            patterns: Optional[Iterable[Union[str, Pattern]]] = None,
+            normalize: bool = False,
+    ) -> None:
+        self.values = list(values)
+        self.patterns = [re.compile(pattern) for pattern in (patterns or ())]
+        self.normalize = normalize
+        self._normalized = {normalize_value(value) for value in self.values if isinstance(value, str)}
+        self._match_nulls = any(_is_null(value) for value in self.values)
+
+    def count(self, data: Union[pd.DataFrame, pd.Series]) -> Union[pd.Series, int]:
+        """Counts the fuzzy nulls in each column.
+
+        Args:
+            data: Data to be checked for fuzzy nulls.
+
+        Returns:
+            Count(s) of fuzzy nulls.
+        """
+        if isinstance(data, pd.DataFrame):
+            counts = [self.count(data.iloc[:, i]) for i in range(data.shape[1])]
+            return pd.Series(counts, index=data.columns, dtype='int64')
+        return sum(int(np.count_nonzero(mask)) for mask in self.iter_masks(data))
+
+    def iter_masks(self, data: pd.Series, block_rows: int = _kernels.MASK_ROWS) -> Iterator[np.ndarray]:
+        """Flags the fuzzy nulls of a column, a slice of rows at a time.
+
+        Args:
+            data: Column to be checked for fuzzy nulls.
+            block_rows: Number of rows flagged at a time.
+
+        Yields:
+            Boolean array for each slice of `block_rows` rows (the last slice may be shorter)
+            that is True where the column holds a fuzzy null.
+        """
+        factorized = self._factorize(data)
+        if factorized is None:
+            for start in range(0, data.shape[0], block_rows):
+                yield self._mask_literals(data.iloc[start:start + block_rows])
+            return
+        # the column is factorized and its distinct values matched once, then each slice looks up its codes
+        codes, matched = factorized
+        for start in range(0, data.shape[0], block_rows):
+            yield matched[codes[start:start + block_rows]]
+
+    def mask(self, data: pd.Series) -> np.ndarray:
+        """Flags the fuzzy nulls of a column.
+
+        Args:
+            data: Column to be checked for fuzzy nulls.
+
+        Returns:
+            Boolean array that is True where the column holds a fuzzy null.
+        """
+        factorized = self._factorize(data)
+        if factorized is None:
+            return self._mask_literals(data)
+        codes, matched = factorized
+        return matched[codes]
+
+    def _factorize(self, data: pd.Series) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        # codes of each row and whether each distinct value matches (None if only literals can match)
+        if not (self.normalize or self.patterns):
+            return None
+        if _dtypes.is_arrow(data.dtype) and data.dtype.kind not in STRING_KINDS:
+            return None
+        if isinstance(data.dtype, pd.CategoricalDtype):
+            codes, uniques = data.cat.codes.to_numpy(), data.cat.categories
+        elif data.dtype.kind in STRING_KINDS or isinstance(data.dtype, pd.StringDtype):
+            codes, uniques = pd.factorize(data)
+        else:
+            return None
+        # code -1 marks nulls, which selects the last entry
+        return codes, np.append(self._match_uniques(pd.Index(uniques)), self._match_nulls)
+
+    def _mask_literals(self, data: pd.Series) -> np.ndarray:
+        if _dtypes.is_arrow(data.dtype) and data.dtype.kind not in STRING_KINDS:
+            # pyarrow rejects comparing values of other types, and strings never match these anyway
+            values = [value for value in self.values if not isinstance(value, str)]
+            return data.isin(values).to_numpy(dtype=bool) if values else np.zeros(data.shape[0], dtype=bool)
+        # without normalization or patterns, or for data that cannot hold strings, only literals can match
+        return data.isin(self.values).to_numpy(dtype=bool)
+
+    def _match_uniques(self, uniques: pd.Index) -> np.ndarray:
+        matched = uniques.isin(self.values)
+        for i, value in enumerate(uniques):
+            if not matched[i] and isinstance(value, str):
+                matched[i] = self._match_string(value)
+        return matched
+
+    def _match_string(self, value: str) -> bool:
+        if self.normalize:
+            value = normalize_value(value)
+            if value in self._normalized:
+                return True
+        return any(pattern.fullmatch(value) for pattern in self.patterns)
@@ -1,68 +1,189 @@
 # standard library imports
-from typing import List, Optional, Union
+from typing import Any, Callable, Hashable, Iterable, List, Mapping, Optional, Pattern, Union
 # third party imports
+import numpy as np
 import pandas as pd
 # local imports
-from datasurveyor import _utils
+from datasurveyor import _columnar, _dtypes, _parallel, _partitioned, _profiling, _sampling, _utils
+from datasurveyor._fuzzy_nulls import FuzzyNullMatcher
+from datasurveyor._sampling import Sampler
 
 
 class GeneralFeatures:
 
     @staticmethod
-    def check_nulls(data: Union[pd.DataFrame, pd.Series]) -> pd.DataFrame:
+    @_profiling.profiled
+    def check_nulls(
+            data: Union[pd.DataFrame, pd.Series],
+            sample: Optional[Union[int, float, Sampler]] = None,
+            confidence: float = 0.95,
+            n_jobs: int = 1,
+    ) -> pd.DataFrame:
         """Checks if data contains nulls.
 
         Args:
-            data: Data to be checked for nulls.
+            data: Data to be checked for nulls (a pandas, polars, or dask DataFrame or Series, a
+                pyarrow Table or RecordBatch, or a list of pandas partitions).
+            sample: If set, the proportion(s) of nulls are estimated from a sample of rows: a
+                number of rows, a proportion of rows, or a `Sampler` (e.g. for stratified sampling).
+            confidence: Confidence level of the Wilson intervals of the estimates when sampling.
+            n_jobs: Number of worker processes checking blocks of columns in parallel (-1 uses one per CPU).
+                Sampled checks run in a single process.
 
         Returns:
             DataFrame with bool(s) indicating if data contains any nulls, count of the nulls
-            present, and the proportion of nulls.
+            present, and the proportion of nulls. When sampling, the counts are estimates and
+            the sample size, the bounds of the intervals of the proportion(s), and bool(s)
+            indicating if the intervals contain 0.0 (so the presence of nulls is uncertain) are added.
         """
+        if _columnar.is_columnar(data):
+            return _columnar.run_check(GeneralFeatures.check_nulls, data, sample=sample)
+        if _partitioned.is_partitioned(data):
+            return _partitioned.run_check(GeneralFeatures.check_nulls, data, n_jobs, sample=sample)
         is_df = _utils.check_if_df(data)
-        is_nulls = data.isna().any(axis=0)
-        count_nulls = data.isna().sum(axis=0)
-        if is_df:
-            prop_nulls = count_nulls.divide(data.shape[0])
-        else:
-            prop_nulls = count_nulls / data.shape[0]
-        result = _utils.result_to_df(
-            data=is_nulls,
-            title='nulls_present',
-            null_count=count_nulls,
-            prop_null=prop_nulls
-        )
-        return result
+        if sample is not None:
+            _sampling.validate_confidence(confidence)
+            sampled, weights = _sampling.resolve_sampler(sample).draw(data)
+            indicators = (sampled if is_df else sampled.to_frame()).isna().astype('float64')
+            prop_null, n_eff = _sampling.weighted_props(indicators, weights)
+            if not is_df:
+                prop_null, n_eff = prop_null.iloc[0], n_eff.iloc[0]
+            lower, upper = _sampling.wilson_interval(prop_null, n_eff, confidence)
+            count_nulls = np.round(prop_null * data.shape[0]).astype('int64')
+            result = GeneralFeatures._nulls_result(count_nulls, data.shape[0])
+            uncertain = _sampling.straddles(lower, upper, 0.0)
+            return _sampling.add_interval(result, 'prop_null', lower, upper, uncertain, sampled.shape[0])
+        if is_df and n_jobs != 1:
+            return _parallel.run_in_blocks(GeneralFeatures.check_nulls, data, n_jobs)
+        count_nulls = _dtypes.count_nulls(data)
+        return GeneralFeatures._nulls_result(count_nulls, data.shape[0])
 
     @staticmethod
+    @_profiling.profiled
     def check_fuzzy_nulls(
             data: Union[pd.DataFrame, pd.Series],
             add_fuzzy_nulls: Optional[List] = None,
+            patterns: Optional[List[Union[str, Pattern]]] = None,
+            normalize: bool = False,
+            n_jobs: int = 1,
     ) -> pd.DataFrame:
         """Checks if DataFrame contains values commonly used to denote nulls (fuzzy nulls).
 
+        Values are matched once per distinct value of each column, so checking columns with
+        few distinct values is fast no matter how many rows they have.
+
         Args:
-            data: Data to be checked for fuzzy nulls.
+            data: Data to be checked for fuzzy nulls (a pandas, polars, or dask DataFrame or Series,
+                a pyarrow Table or RecordBatch, or a list of pandas partitions).
             add_fuzzy_nulls: Additional items to check as fuzzy nulls.
+            patterns: Regex patterns to check as fuzzy nulls (a pattern must match the whole string).
+            normalize: If True: strings are case folded and stripped of extra whitespace before
+                being compared with the fuzzy nulls and patterns (e.g. ' NULL ' matches 'null').
+            n_jobs: Number of worker processes checking blocks of columns in parallel (-1 uses one per CPU).
 
         Returns:
             DataFrame with bool(s) indicating if data contains any fuzzy nulls, count of
             the fuzzy nulls present, and the proportion of fuzzy nulls.
         """
+        if _columnar.is_columnar(data):
+            return _columnar.run_check(
+                GeneralFeatures.check_fuzzy_nulls, data,
+                add_fuzzy_nulls=add_fuzzy_nulls, patterns=patterns, normalize=normalize,
+            )
+        if _partitioned.is_partitioned(data):
+            return _partitioned.run_check(
+                GeneralFeatures.check_fuzzy_nulls, data, n_jobs,
+                add_fuzzy_nulls=add_fuzzy_nulls, patterns=patterns, normalize=normalize,
+            )
         is_df = _utils.check_if_df(data)
+        if is_df and n_jobs != 1:
+            return _parallel.run_in_blocks(
+                GeneralFeatures.check_fuzzy_nulls, data, n_jobs,
+                add_fuzzy_nulls=add_fuzzy_nulls, patterns=patterns, normalize=normalize,
+            )
+        fuzzy_nulls = GeneralFeatures._fuzzy_null_values(add_fuzzy_nulls)
+        count_fuzzy_nulls = FuzzyNullMatcher(fuzzy_nulls, patterns, normalize).count(data)
+        return GeneralFeatures._fuzzy_nulls_result(count_fuzzy_nulls, data.shape[0])
+
+    @staticmethod
+    @_profiling.profiled
+    def check_many(
+            data: Union[Mapping[Hashable, pd.Series], Iterable[pd.Series]],
+            check: Union[str, Callable],
+            **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Runs a check over many independent Series, building a single output.
+
+        Dtypes are validated once per distinct dtype and the output is built once for all Series,
+        so each Series costs microseconds rather than the milliseconds of checking it directly.
+        Each Series is checked like a column of a DataFrame. Unlike the checks, a list of Series
+        is treated as separate Series rather than as partitions of a single Series.
+
+        Args:
+            data: Series to be checked, as a dict mapping names to Series or an iterable of Series
+                (named after their `name`, or their position if unnamed).
+            check: Check to be run: its name (e.g. 'check_nulls') or the check itself.
+            **kwargs: Arguments of the check (other than sampling arguments).
+
+        Returns:
+            DataFrame with a row per Series, as output by the check on a DataFrame with a column
+            per Series.
+        """
+        # imported here, since _batch imports this module
+        from datasurveyor._batch import check_many
+        return check_many(GeneralFeatures, data, check, **kwargs)
+
+    @staticmethod
+    def _fuzzy_null_values(add_fuzzy_nulls: Optional[List] = None) -> List:
+        """Generates the list of values treated as fuzzy nulls.
+
+        Args:
+            add_fuzzy_nulls: Additional items to check as fuzzy nulls.
+
+        Returns:
+            List of the default fuzzy nulls plus any additional items.
+        """
         fuzzy_nulls = ['null', 'Null', 'NULL', '', ' ']
         if add_fuzzy_nulls is not None:
             fuzzy_nulls.extend(add_fuzzy_nulls)
-        is_fuzzy_nulls = data.isin(fuzzy_nulls).any(axis=0)
-        count_fuzzy_nulls = data.isin(fuzzy_nulls).sum(axis=0)
-        if is_df:
-            prop_fuzzy_nulls = count_fuzzy_nulls.divide(data.shape[0])
-        else:
-            prop_fuzzy_nulls = count_fuzzy_nulls / data.shape[0]
+        return fuzzy_nulls
+
+    @staticmethod
+    def _nulls_result(count_nulls: Union[pd.Series, int], n_rows: int) -> pd.DataFrame:
+        """Builds the check_nulls output from precomputed null count(s).
+
+        Args:
+            count_nulls: Count(s) of nulls.
+            n_rows: Number of rows in the data.
+
+        Returns:
+            DataFrame with bool(s) indicating if data contains any nulls, count of the nulls
+            present, and the proportion of nulls.
+        """
+        result = _utils.result_to_df(
+            data=count_nulls > 0,
+            title='nulls_present',
+            null_count=count_nulls,
+            prop_null=count_nulls / n_rows,
+        )
+        return result
+
+    @staticmethod
+    def _fuzzy_nulls_result(count_fuzzy_nulls: Union[pd.Series, int], n_rows: int) -> pd.DataFrame:
+        """Builds the check_fuzzy_nulls output from precomputed fuzzy null count(s).
+
+        Args:
+            count_fuzzy_nulls: Count(s) of fuzzy nulls.
+            n_rows: Number of rows in the data.
+
+        Returns:
+            DataFrame with bool(s) indicating if data contains any fuzzy nulls, count of
+            the fuzzy nulls present, and the proportion of fuzzy nulls.
+        """
         result = _utils.result_to_df(
-            data=is_fuzzy_nulls,
+            data=count_fuzzy_nulls > 0,
             title='fuzzy_nulls_present',
             fuzzy_null_count=count_fuzzy_nulls,
-            prop_fuzzy_null=prop_fuzzy_nulls,
+            prop_fuzzy_null=count_fuzzy_nulls / n_rows,
         )
         return result
@@ -0,0 +1,181 @@
+# standard library imports
+from typing import Any, Dict, Hashable, List, Tuple
+# third party imports
+import numpy as np
+import pandas as pd
+# local imports
+from datasurveyor import _sketches
+from datasurveyor._fuzzy_nulls import FuzzyNullMatcher
+
+
+# statistics computed by a single grouped aggregation of pandas (the name of the aggregation)
+AGGREGATED_STATS = {'min': 'min', 'max': 'max', 'mean': 'mean'}
+
+
+def group_stats(
+        data: pd.DataFrame,
+        by: List[Hashable],
+        plan: Dict[Tuple[Hashable, ...], List[Hashable]],
+) -> Tuple[Dict[Tuple[Hashable, ...], Any], pd.Series]:
+    """Computes the statistics needed by checks for every group of rows at once.
+
+    Rows are grouped by the values of the `by` columns, and each statistic is computed for every
+    group and column in a single grouped aggregation (e.g. `groupby(...).count()` for null
+    counts), rather than by checking each group separately. Modes and the most common categories
+    are found from a single count of each value in each group. Rows with a null in any `by`
+    column are dropped, as `groupby` does.
+
+    Args:
+        data: Data to be grouped.
+        by: Columns whose values define the groups.
+        plan: Statistics needed by the checks and their columns (as returned by `plan_stats`).
+
+    Returns:
+        Dict mapping the key of each statistic to a DataFrame with a row per group and a column
+        per needed column (a tuple of the most common values and their counts for modes), and
+        the number of rows of each group, indexed by group in sorted order.
+    """
+    keys = data.loc[:, by]
+    if keys.isna().any(axis=None):
+        data = data.loc[keys.notna().all(axis=1).to_numpy()]
+    grouped = data.groupby(by, sort=True, observed=True)
+    sizes = grouped.size()
+    groups = sizes.index
+    stats: Dict[Tuple[Hashable, ...], Any] = {}
+    value_counts: Dict[Hashable, pd.Series] = {}
+    codes = None
+    for key, columns in plan.items():
+        stat = key[0]
+        if stat == 'null_count':
+            counts = grouped[columns].count()
+            stats[key] = -counts.sub(sizes, axis=0)
+        elif stat in AGGREGATED_STATS:
+            stats[key] = grouped[columns].agg(AGGREGATED_STATS[stat])
+        elif stat == 'nunique':
+            stats[key] = grouped[columns].nunique(dropna=key[1])
+        elif stat in ('mode', 'top'):
+            parts = []
+            for column in columns:
+                if column not in value_counts:
+                    value_counts[column] = data.groupby(by + [column], observed=True, dropna=False).size()
+                if stat == 'mode':
+                    parts.append(_modes(value_counts[column], groups, dropna=key[1]))
+                else:
+                    parts.append(_top(value_counts[column], groups, k=key[3], dropna=key[1]))
+            if stat == 'mode':
+                stats[key] = (
+                    pd.DataFrame({column: part[0] for column, part in zip(columns, parts)}, index=groups),
+                    pd.DataFrame({column: part[1] for column, part in zip(columns, parts)}, index=groups),
+                )
+            else:
+                stats[key] = pd.DataFrame(dict(zip(columns, parts)), index=groups)
+        elif stat == 'fuzzy_null_count':
+            if codes is None:
+                codes = grouped.ngroup().to_numpy()
+            matcher = FuzzyNullMatcher(*key[1:])
+            stats[key] = pd.DataFrame({
+                column: np.bincount(codes, weights=matcher.mask(data[column]), minlength=len(groups))
+                for column in columns
+            }, index=groups).astype('int64')
+        else:
+            raise ValueError(f'Unknown statistic: {stat}.')
+    return stats, sizes
+
+
+def select_stat(stat: Any, columns: List[Hashable]) -> Any:
+    """Flattens grouped statistics into a value per group and column, group by group.
+
+    Args:
+        stat: DataFrame of a statistic with a row per group (or a tuple of them).
+        columns: Columns to be selected, in order.
+
+    Returns:
+        Series (or tuple of Series) with a row per group and column, ordered by group and then
+        by column, on a RangeIndex.
+    """
+    if isinstance(stat, tuple):
+        return tuple(select_stat(part, columns) for part in stat)
+    values = stat.loc[:, columns].to_numpy(dtype=object).ravel()
+    return pd.Series(values, dtype=object).infer_objects()
+
+
+def add_group_keys(result: pd.DataFrame, sizes: pd.Series, columns: List[Hashable]) -> pd.DataFrame:
+    """Labels the rows of a check output built from `select_stat` with their group and column.
+
+    Args:
+        result: Check output with a row per group and column.
+        sizes: Number of rows of each group (as returned by `group_stats`).
+        columns: Columns the check was run on, in order.
+
+    Returns:
+        The output with the `by` columns first, followed by the checked column and the output of
+        the check.
+    """
+    n_columns = len(columns)
+    keys = sizes.index.repeat(n_columns).to_frame(index=False)
+    result = result.copy()
+    result['column'] = pd.Index(columns)[np.tile(np.arange(n_columns), len(sizes))]
+    return pd.concat([keys, result], axis=1)
+
+
+def group_rows(sizes: pd.Series, n_columns: int) -> pd.Series:
+    """Repeats the number of rows of each group for each of its checked columns.
+
+    Args:
+        sizes: Number of rows of each group (as returned by `group_stats`).
+        n_columns: Number of columns the check is run on.
+
+    Returns:
+        Number of rows of the group of each row of `select_stat`, on a RangeIndex.
+    """
+    return pd.Series(np.repeat(sizes.to_numpy(), n_columns), dtype='int64')
+
+
+def _split_counts(
+        counts: pd.Series,
+        groups: pd.Index,
+) -> Tuple[np.ndarray, pd.Index, np.ndarray, np.ndarray]:
+    # positions of the group of each counted value, the values, their counts, and which are null
+    positions = groups.get_indexer(counts.index.droplevel(-1))
+    values = counts.index.get_level_values(-1)
+    return positions, values, counts.to_numpy(), np.asarray(pd.isna(values))
+
+
+def _modes(counts: pd.Series, groups: pd.Index, dropna: bool) -> Tuple[np.ndarray, np.ndarray]:
+    positions, values, n, null = _split_counts(counts, groups)
+    nulls = np.bincount(positions[null], weights=n[null], minlength=len(groups))
+    present = ~null
+    positions, values, n = positions[present], np.asarray(values[present], dtype=object), n[present]
+    order = np.arange(len(n))
+    try:
+        # like `mode`, tied values are sorted
+        order = np.argsort(values, kind='stable')
+    except TypeError:
+        pass
+    order = order[np.argsort(-n[order], kind='stable')]
+    order = order[np.argsort(positions[order], kind='stable')]
+    _, first = np.unique(positions[order], return_index=True)
+    chosen = order[first]
+    most_common = np.full(len(groups), np.nan, dtype=object)
+    count = np.zeros(len(groups), dtype=np.int64)
+    most_common[positions[chosen]] = values[chosen]
+    count[positions[chosen]] = n[chosen]
+    if not dropna:
+        # like `mode`, nulls only win outright, and then count 0 since `eq` never matches them
+        wins = nulls > count
+        most_common[wins], count[wins] = np.nan, 0
+    return most_common, count
+
+
+def _top(counts: pd.Series, groups: pd.Index, k: int, dropna: bool) -> np.ndarray:
+    positions, values, n, null = _split_counts(counts, groups)
+    order = np.argsort(positions, kind='stable')
+    bounds = np.searchsorted(positions[order], np.arange(len(groups) + 1))
+    # filled one group at a time, since NumPy would turn lists of equal length into a 2-D array
+    top = np.empty(len(groups), dtype=object)
+    for i in range(len(groups)):
+        rows = order[bounds[i]:bounds[i + 1]]
+        present = rows[~null[rows]]
+        null_count = 0 if dropna else int(n[rows[null[rows]]].sum())
+        top[i] = _sketches.top_counts(pd.Series(n[present], index=values[present]), k, null_count)
+    return top
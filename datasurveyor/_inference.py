@@ -0,0 +1,198 @@
+# standard library imports
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+# third party imports
+import numpy as np
+import pandas as pd
+# local imports
+from datasurveyor import _dtypes
+
+
+# checks run on the columns of each feature type; general checks run on every typed column
+FEATURE_CHECKS = {
+    'binary': [
+        'BinaryFeatures.check_all_same',
+        'BinaryFeatures.check_mostly_same',
+        'BinaryFeatures.check_outside_range',
+    ],
+    'categorical': [
+        'CategoricalFeatures.check_mostly_same',
+        'CategoricalFeatures.check_n_categories',
+    ],
+    'unique': ['UniqueFeatures.check_uniqueness'],
+    'general': ['GeneralFeatures.check_nulls', 'GeneralFeatures.check_fuzzy_nulls'],
+}
+
+FEATURE_TYPES = tuple(FEATURE_CHECKS)
+
+
+def validate_feature_types(types: Dict[Hashable, str]) -> None:
+    """Validates a mapping of columns to feature types.
+
+    Args:
+        types: Dict mapping columns to feature types.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If a feature type is not one of `FEATURE_TYPES`.
+    """
+    for column, feature_type in types.items():
+        if feature_type not in FEATURE_TYPES:
+            raise ValueError(
+                f'Unknown feature type {feature_type!r} for column {column!r}. '
+                f'Expected one of: {", ".join(FEATURE_TYPES)}.'
+            )
+    return
+
+
+def build_checks(types: Dict[Hashable, str]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Builds the survey checks for a mapping of columns to feature types.
+
+    Args:
+        types: Dict mapping columns to feature types (general checks run on every column, typed or
+            not).
+
+    Returns:
+        Check requests, as accepted by `Survey`.
+    """
+    checks = []
+    for feature_type, names in FEATURE_CHECKS.items():
+        if feature_type == 'general':
+            columns = None
+        else:
+            columns = [column for column, column_type in types.items() if column_type == feature_type]
+            if not columns:
+                continue
+        checks.extend((name, {'columns': columns}) for name in names)
+    return checks
+
+
+def infer_feature_type(
+        column: pd.Series,
+        sample_size: int = 10_000,
+        max_categories: int = 50,
+        unique_thresh: float = 0.95,
+        seed: Optional[int] = 0,
+) -> str:
+    """Infers the feature type of a column from bounded-cost probes.
+
+    The dtype is read first. Boolean columns are binary, and integer columns are binary when a
+    sample and then the full column lie within 0 and 1. Other probes look at a random sample of
+    `sample_size` rows: columns of a dtype suited to unique data whose sampled values are at least
+    `unique_thresh` distinct (and with no nulls in the full column) are unique, and columns of a
+    dtype suited to categorical data with at most `max_categories` sampled distinct values are
+    categorical. Any other column is general.
+
+    Args:
+        column: Column to be classified.
+        sample_size: Number of rows sampled by the cardinality probes.
+        max_categories: Maximum number of sampled distinct values of a categorical column.
+        unique_thresh: Minimum proportion of distinct values in the sample of a unique column.
+        seed: Seed of the random number generator drawing the sample.
+
+    Returns:
+        The feature type, one of `FEATURE_TYPES`.
+    """
+    dtype = column.dtype
+    sample = _sample_values(column, sample_size, seed)
+    if sample.empty:
+        return 'general'
+    if _dtypes.has_kind(dtype, 'b'):
+        return 'binary'
+    if _dtypes.has_kind(dtype, 'iu') and _within_binary_range(sample) and _within_binary_range(column):
+        return 'binary'
+    n_unique = sample.nunique(dropna=True)
+    if (
+        _dtypes.has_kind(dtype, _dtypes.UNIQUE_KINDS)
+        and n_unique >= unique_thresh * sample.shape[0]
+        and _dtypes.count_nulls(column) == 0
+    ):
+        return 'unique'
+    if _dtypes.has_kind(dtype, _dtypes.CATEGORICAL_KINDS) and n_unique <= max_categories:
+        return 'categorical'
+    return 'general'
+
+
+def infer_feature_types(
+        data: Union[pd.DataFrame, pd.Series],
+        sample_size: int = 10_000,
+        max_categories: int = 50,
+        unique_thresh: float = 0.95,
+        seed: Optional[int] = 0,
+) -> Dict[Hashable, str]:
+    """Infers the feature type of each column, as `infer_feature_type` does.
+
+    Args:
+        data: Data whose columns are classified.
+        sample_size: Number of rows sampled by the cardinality probes.
+        max_categories: Maximum number of sampled distinct values of a categorical column.
+        unique_thresh: Minimum proportion of distinct values in the sample of a unique column.
+        seed: Seed of the random number generator drawing the sample.
+
+    Returns:
+        Dict mapping each column to its feature type, in column order.
+
+    Raises:
+        ValueError: If `sample_size` or `max_categories` is not a positive integer, or
+            `unique_thresh` is not between 0.0 and 1.0 (inclusive).
+    """
+    frame = data if isinstance(data, pd.DataFrame) else data.to_frame()
+    return resolve_feature_types(frame, {}, sample_size, max_categories, unique_thresh, seed)
+
+
+def resolve_feature_types(
+        data: pd.DataFrame,
+        types: Dict[Hashable, str],
+        sample_size: int = 10_000,
+        max_categories: int = 50,
+        unique_thresh: float = 0.95,
+        seed: Optional[int] = 0,
+) -> Dict[Hashable, str]:
+    """Completes a mapping of columns to feature types by inferring the types of the others.
+
+    Args:
+        data: Data whose columns are classified.
+        types: Dict mapping columns to feature types, which are kept as they are.
+        sample_size: Number of rows sampled by the cardinality probes.
+        max_categories: Maximum number of sampled distinct values of a categorical column.
+        unique_thresh: Minimum proportion of distinct values in the sample of a unique column.
+        seed: Seed of the random number generator drawing the sample.
+
+    Returns:
+        Dict mapping each column to its feature type, in column order.
+
+    Raises:
+        ValueError: If a feature type is not recognized, `sample_size` or `max_categories` is
+            not a positive integer, or `unique_thresh` is not between 0.0 and 1.0 (inclusive).
+    """
+    validate_feature_types(types)
+    if not isinstance(sample_size, int) or sample_size < 1:
+        raise ValueError('The sample_size parameter must be a positive integer.')
+    if not isinstance(max_categories, int) or max_categories < 1:
+        raise ValueError('The max_categories parameter must be a positive integer.')
+    if not 0.0 <= unique_thresh <= 1.0:
+        raise ValueError('The unique_thresh parameter must be between 0.0 and 1.0.')
+    resolved = {}
+    for i, column in enumerate(data.columns):
+        if column in types:
+            resolved[column] = types[column]
+        else:
+            # columns are probed one at a time, without copying the data
+            resolved[column] = infer_feature_type(
+                data.iloc[:, i], sample_size, max_categories, unique_thresh, seed,
+            )
+    # types of columns missing from the data are kept, so surveying the data reports them
+    resolved.update(types)
+    return resolved
+
+
+def _sample_values(column: pd.Series, sample_size: int, seed: Optional[int]) -> pd.Series:
+    if column.shape[0] > sample_size:
+        positions = np.random.default_rng(seed).choice(column.shape[0], size=sample_size, replace=False)
+        column = column.iloc[np.sort(positions)]
+    return column.dropna()
+
+
+def _within_binary_range(values: pd.Series) -> bool:
+    return bool(values.min() >= 0 and values.max() <= 1)
@@ -0,0 +1,177 @@
+# standard library imports
+from typing import Any, Iterator, List, NamedTuple, Tuple
+# third party imports
+import numpy as np
+import pandas as pd
+
+
+# number of rows reduced at a time, so a slice of a block stays in cache across its reductions
+BLOCK_ROWS = 8_192
+
+# number of rows masked at a time by kernels calling pandas on each slice, which amortizes the
+# overhead of each call; a multiple of 8, so the mask of each slice packs into whole bytes
+MASK_ROWS = 65_536
+
+# dtype kinds of the NumPy blocks reduced by the kernel (b: boolean, i/u: integer)
+KERNEL_KINDS = 'biu'
+
+
+class MinMaxSum(NamedTuple):
+    """Minimum, maximum, sum, and count of the non-null values of each column.
+
+    Attributes:
+        min: Minimum of each column.
+        max: Maximum of each column.
+        sum: Sum of each column, as float64 (as pandas sums integers to take their mean).
+        count: Number of non-null values of each column.
+    """
+    min: pd.Series
+    max: pd.Series
+    sum: pd.Series
+    count: pd.Series
+
+    @property
+    def mean(self) -> pd.Series:
+        """Mean of each column (NaN for columns without values)."""
+        return self.sum / self.count.where(self.count > 0)
+
+
+def min_max_sum(data: pd.DataFrame, block_rows: int = BLOCK_ROWS) -> MinMaxSum:
+    """Computes the minimum, maximum, and sum of every column in one pass over the data.
+
+    Boolean and integer columns are reduced straight from the 2-D NumPy blocks backing the
+    DataFrame, `block_rows` rows at a time, so each slice of a block is read from memory once and
+    reduced three times while it is in cache. No intermediate Series are created and blocks of
+    different dtypes are never consolidated into a copy. Columns of other dtypes (e.g. nullable or
+    pyarrow backed) are reduced by their own methods.
+
+    Args:
+        data: Data to be reduced.
+        block_rows: Number of rows reduced at a time.
+
+    Returns:
+        The minimum, maximum, sum, and count of non-null values of each column. Minimums and
+        maximums are NaN for columns without values.
+    """
+    n_columns = data.shape[1]
+    mins = np.full(n_columns, np.nan, dtype=object)
+    maxs = np.full(n_columns, np.nan, dtype=object)
+    sums = np.zeros(n_columns, dtype=np.float64)
+    counts = np.zeros(n_columns, dtype=np.int64)
+    for positions, values in iter_blocks(data):
+        if isinstance(values, np.ndarray) and values.dtype.kind in KERNEL_KINDS and values.shape[1]:
+            block_min, block_max, block_sum = _reduce_block(values, block_rows)
+            mins[positions], maxs[positions], sums[positions] = list(block_min), list(block_max), block_sum
+            counts[positions] = values.shape[1]
+            continue
+        for position in positions:
+            column = data.iloc[:, position]
+            counts[position] = column.count()
+            if counts[position]:
+                mins[position], maxs[position] = column.min(), column.max()
+                sums[position] = column.sum()
+    index = data.columns
+    return MinMaxSum(
+        min=pd.Series(mins, index=index).infer_objects(),
+        max=pd.Series(maxs, index=index).infer_objects(),
+        sum=pd.Series(sums, index=index),
+        count=pd.Series(counts, index=index),
+    )
+
+
+def count_missing(values: np.ndarray, block_rows: int = BLOCK_ROWS) -> np.ndarray:
+    """Counts the missing values of each column of a NumPy block, a slice of rows at a time.
+
+    Only the boolean mask of a slice of `block_rows` rows is held in memory at once, rather
+    than a mask of the whole block. Boolean and integer blocks cannot hold missing values, so they
+    are not read at all.
+
+    Args:
+        values: 2-D NumPy block with a row per column (as yielded by `iter_blocks`).
+        block_rows: Number of rows masked at a time.
+
+    Returns:
+        Number of missing values of each column of the block, as int64.
+    """
+    n_columns, n_rows = values.shape
+    counts = np.zeros(n_columns, dtype=np.int64)
+    if values.dtype.kind in KERNEL_KINDS:
+        return counts
+    for start in range(0, n_rows, block_rows):
+        counts += np.count_nonzero(is_missing(values[:, start:start + block_rows]), axis=1)
+    return counts
+
+
+def is_missing(values: np.ndarray) -> np.ndarray:
+    """Flags the missing values of a NumPy array, like `pd.isna`.
+
+    Args:
+        values: Array to be checked.
+
+    Returns:
+        Boolean array of the same shape that is True where `values` holds NaN, NaT, or None.
+    """
+    kind = values.dtype.kind
+    if kind in KERNEL_KINDS:
+        return np.zeros(values.shape, dtype=bool)
+    # NumPy ufuncs skip the per-element dispatch pd.isna needs for object arrays
+    if kind in 'fc':
+        return np.isnan(values)
+    if kind in 'mM':
+        return np.isnat(values)
+    return pd.isna(values)
+
+
+def _reduce_block(values: np.ndarray, block_rows: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # a block holds one column per row of `values`, and rows of the data along its second axis
+    n_columns, n_rows = values.shape
+    mins, maxs = values[:, 0].copy(), values[:, 0].copy()
+    sums = np.zeros(n_columns, dtype=np.float64)
+    # blocks built from 2-D arrays are transposed views, which NumPy reduces along their strided
+    # axis slowly, so each slice is first copied into a contiguous buffer while it is in cache
+    buffer = None if values.flags.c_contiguous else np.empty((n_columns, block_rows), dtype=values.dtype)
+    for start in range(0, n_rows, block_rows):
+        part = values[:, start:start + block_rows]
+        if buffer is not None:
+            part = buffer[:, :part.shape[1]]
+            np.copyto(part, values[:, start:start + block_rows])
+        low, high = part.min(axis=1), part.max(axis=1)
+        np.minimum(mins, low, out=mins)
+        np.maximum(maxs, high, out=maxs)
+        sums += part.sum(axis=1, dtype=_sum_dtype(low, high, part.shape[1]))
+    return mins, maxs, sums
+
+
+def _sum_dtype(low: np.ndarray, high: np.ndarray, n_rows: int) -> type:
+    # integers are summed exactly as int64 when no sum of the slice can exceed the integers a
+    # float64 represents exactly, and are otherwise summed as float64 (like pandas does)
+    bound = max(-float(low.min()), float(high.max()))
+    return np.int64 if bound * n_rows < 2 ** 53 else np.float64
+
+
+def iter_blocks(data: pd.DataFrame) -> Iterator[Tuple[List[int], Any]]:
+    """Iterates over the blocks of values backing a DataFrame, without copying them.
+
+    The blocks of the block manager are read directly, since pandas has no public way to reach
+    them without consolidating blocks of different dtypes into a copy. If the block manager
+    cannot be read, each column is yielded as a block of its own.
+
+    Args:
+        data: DataFrame whose blocks are read.
+
+    Yields:
+        The positions of the columns of each block, and its values: a 2-D NumPy array with a row
+        per column, or the extension array of a single column.
+    """
+    manager = getattr(data, '_mgr', None)
+    blocks = getattr(manager, 'blocks', None)
+    if blocks is None:
+        for position in range(data.shape[1]):
+            yield [position], data.iloc[:, position].array
+        return
+    for block in blocks:
+        values = block.values
+        positions = list(block.mgr_locs.as_array)
+        if isinstance(values, np.ndarray) and values.ndim == 1:
+            values = values.reshape(1, -1)
+        yield positions, values
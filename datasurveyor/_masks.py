@@ -0,0 +1,211 @@
+# standard library imports
+from typing import Any, Hashable, Iterator, List, Optional, Pattern, Tuple, Union
+# third party imports
+import numpy as np
+import pandas as pd
+# local imports
+from datasurveyor import _kernels, _utils
+from datasurveyor._fuzzy_nulls import FuzzyNullMatcher
+
+
+# number of set bits in each byte value
+_POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint8)
+
+
+class NullMask:
+    """Bit-packed mask of the null (or fuzzy null) cells of each column.
+
+    Each column is stored with one bit per row (as packed by `np.packbits`), so a mask takes an
+    eighth of the memory of the boolean DataFrame returned by `isna`. Masks are built a slice of
+    rows at a time, so the boolean mask of the whole data is never materialized. Masks can be
+    combined with `|`, `&`, and `~`, counted per column, and expanded into boolean arrays to
+    filter rows (e.g. `data[~mask.rows()]` drops the rows holding any null).
+
+    Args:
+        bits: Packed bits with a row of bytes per column (as returned by `np.packbits(mask, axis=1)`
+            for a boolean array with a row per column).
+        n_rows: Number of rows masked.
+        columns: Names of the masked columns.
+
+    Raises:
+        ValueError: If the shape of `bits` does not match the number of rows and columns.
+    """
+
+    def __init__(self, bits: np.ndarray, n_rows: int, columns: List[Hashable]) -> None:
+        self.bits = np.asarray(bits, dtype=np.uint8)
+        self.n_rows = n_rows
+        self.columns = list(columns)
+        if self.bits.shape != (len(self.columns), -(-n_rows // 8)):
+            raise ValueError('The shape of bits must be the number of columns by the number of rows / 8.')
+
+    @classmethod
+    def from_nulls(
+            cls,
+            data: Union[pd.DataFrame, pd.Series],
+            block_rows: int = _kernels.MASK_ROWS,
+    ) -> 'NullMask':
+        """Masks the nulls of data.
+
+        NumPy backed columns are masked block by block, and boolean and integer columns (which
+        cannot hold nulls) are not read at all.
+
+        Args:
+            data: Data to be masked.
+            block_rows: Number of rows masked at a time (a multiple of 8).
+
+        Returns:
+            Mask that is set where the data holds a null.
+
+        Raises:
+            TypeError: If `data` is not a pandas DataFrame or Series.
+            ValueError: If `block_rows` is not a positive multiple of 8.
+        """
+        data = cls._validate(data, block_rows)
+        bits = np.zeros((data.shape[1], -(-data.shape[0] // 8)), dtype=np.uint8)
+        for positions, values in _kernels.iter_blocks(data):
+            if isinstance(values, np.ndarray):
+                if values.dtype.kind in _kernels.KERNEL_KINDS:
+                    continue
+                for start in range(0, data.shape[0], block_rows):
+                    part = _kernels.is_missing(values[:, start:start + block_rows])
+                    bits[positions, start // 8:(start + part.shape[1] + 7) // 8] = np.packbits(part, axis=1)
+                continue
+            for position in positions:
+                masks = cls._slices(data.iloc[:, position], block_rows)
+                cls._pack(bits[position], (np.asarray(mask.isna()) for mask in masks), block_rows)
+        return cls(bits, data.shape[0], list(data.columns))
+
+    @classmethod
+    def from_fuzzy_nulls(
+            cls,
+            data: Union[pd.DataFrame, pd.Series],
+            add_fuzzy_nulls: Optional[List] = None,
+            patterns: Optional[List[Union[str, Pattern]]] = None,
+            normalize: bool = False,
+            block_rows: int = _kernels.MASK_ROWS,
+    ) -> 'NullMask':
+        """Masks the fuzzy nulls of data, as counted by `GeneralFeatures.check_fuzzy_nulls`.
+
+        Args:
+            data: Data to be masked.
+            add_fuzzy_nulls: Additional items to mask as fuzzy nulls.
+            patterns: Regex patterns to mask as fuzzy nulls (a pattern must match the whole string).
+            normalize: If True: strings are case folded and stripped of extra whitespace before
+                being compared with the fuzzy nulls and patterns (e.g. ' NULL ' matches 'null').
+            block_rows: Number of rows masked at a time (a multiple of 8).
+
+        Returns:
+            Mask that is set where the data holds a fuzzy null.
+
+        Raises:
+            TypeError: If `data` is not a pandas DataFrame or Series.
+            ValueError: If `block_rows` is not a positive multiple of 8.
+        """
+        # imported here, since _general_features imports the profiled checks
+        from datasurveyor._general_features import GeneralFeatures
+        data = cls._validate(data, block_rows)
+        matcher = FuzzyNullMatcher(GeneralFeatures._fuzzy_null_values(add_fuzzy_nulls), patterns, normalize)
+        bits = np.zeros((data.shape[1], -(-data.shape[0] // 8)), dtype=np.uint8)
+        for position in range(data.shape[1]):
+            cls._pack(bits[position], matcher.iter_masks(data.iloc[:, position], block_rows), block_rows)
+        return cls(bits, data.shape[0], list(data.columns))
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Number of rows and columns masked."""
+        return self.n_rows, len(self.columns)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the packed bits, in bytes."""
+        return self.bits.nbytes
+
+    def count(self) -> pd.Series:
+        """Counts the masked cells of each column.
+
+        Returns:
+            Number of masked cells of each column, indexed by column.
+        """
+        counts = np.zeros(len(self.columns), dtype=np.int64)
+        for start in range(0, self.bits.shape[1], _kernels.MASK_ROWS):
+            counts += _POPCOUNT[self.bits[:, start:start + _kernels.MASK_ROWS]].sum(axis=1, dtype=np.int64)
+        return pd.Series(counts, index=self.columns)
+
+    def column(self, column: Hashable) -> np.ndarray:
+        """Expands the mask of a single column.
+
+        Args:
+            column: Name of the column.
+
+        Returns:
+            Boolean array with a value per row that is True where the column is masked.
+
+        Raises:
+            KeyError: If the column is not masked.
+        """
+        if column not in self.columns:
+            raise KeyError(f'Column {column!r} is not masked.')
+        return self._unpack(self.bits[self.columns.index(column)])
+
+    def rows(self, how: str = 'any') -> np.ndarray:
+        """Flags the rows with masked cells, reducing the packed bits before expanding them.
+
+        Args:
+            how: 'any' flags rows with any masked cell, 'all' flags rows with every cell masked.
+
+        Returns:
+            Boolean array with a value per row.
+
+        Raises:
+            ValueError: If `how` is not 'any' or 'all'.
+        """
+        if how not in ('any', 'all'):
+            raise ValueError("The how parameter must be 'any' or 'all'.")
+        if not self.columns:
+            return np.full(self.n_rows, how == 'all')
+        reduce = np.bitwise_or if how == 'any' else np.bitwise_and
+        return self._unpack(reduce.reduce(self.bits, axis=0))
+
+    def __or__(self, other: 'NullMask') -> 'NullMask':
+        return NullMask(self.bits | self._aligned(other).bits, self.n_rows, self.columns)
+
+    def __and__(self, other: 'NullMask') -> 'NullMask':
+        return NullMask(self.bits & self._aligned(other).bits, self.n_rows, self.columns)
+
+    def __invert__(self) -> 'NullMask':
+        bits = ~self.bits
+        if self.n_rows % 8 and bits.shape[1]:
+            # the padding bits past the last row stay unset, so counts only count rows
+            bits[:, -1] &= np.uint8(0xFF << (8 - self.n_rows % 8) & 0xFF)
+        return NullMask(bits, self.n_rows, self.columns)
+
+    def __repr__(self) -> str:
+        return f'NullMask(n_rows={self.n_rows}, columns={self.columns!r})'
+
+    def _aligned(self, other: 'NullMask') -> 'NullMask':
+        if not isinstance(other, NullMask) or other.n_rows != self.n_rows or other.columns != self.columns:
+            raise ValueError('Masks can only be combined with masks of the same rows and columns.')
+        return other
+
+    def _unpack(self, bits: np.ndarray) -> np.ndarray:
+        return np.unpackbits(bits, count=self.n_rows).astype(bool)
+
+    @staticmethod
+    def _validate(data: Union[pd.DataFrame, pd.Series], block_rows: int) -> pd.DataFrame:
+        is_df = _utils.check_if_df(data)
+        if not isinstance(block_rows, (int, np.integer)) or block_rows < 8 or block_rows % 8:
+            raise ValueError('The block_rows parameter must be a positive multiple of 8.')
+        return data if is_df else data.to_frame()
+
+    @staticmethod
+    def _slices(column: pd.Series, block_rows: int) -> Iterator[Any]:
+        values = column.array
+        for start in range(0, column.shape[0], block_rows):
+            yield values[start:start + block_rows]
+
+    @staticmethod
+    def _pack(bits: np.ndarray, masks: Iterator[np.ndarray], block_rows: int) -> None:
+        # each slice but the last holds a multiple of 8 rows, so it packs into whole bytes
+        for i, mask in enumerate(masks):
+            start = i * block_rows // 8
+            bits[start:start + -(-len(mask) // 8)] = np.packbits(mask)
@@ -0,0 +1,151 @@
+# standard library imports
+import contextlib
+import os
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+# third party imports
+import numpy as np
+import pandas as pd
+
+
+# dtype kinds copied into shared memory rather than pickled (bool, signed/unsigned int, float)
+SHARED_KINDS = 'biuf'
+
+# (shared memory name or None, pickled DataFrame or None, shape, dtype, columns)
+BlockPart = Tuple[Optional[str], Optional[pd.DataFrame], Tuple[int, ...], Optional[str], List[Hashable]]
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """Resolves the number of worker processes to use.
+
+    Args:
+        n_jobs: Number of worker processes, or -1 to use one per CPU.
+
+    Returns:
+        The number of worker processes.
+
+    Raises:
+        ValueError: If `n_jobs` is not a positive integer or -1.
+    """
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if not isinstance(n_jobs, int) or n_jobs < 1:
+        raise ValueError('The n_jobs parameter must be a positive integer or -1.')
+    return n_jobs
+
+
+def split_columns(columns: List[Hashable], n_blocks: int) -> List[List[Hashable]]:
+    """Splits columns into contiguous blocks of near equal size.
+
+    Args:
+        columns: Columns to be split.
+        n_blocks: Number of blocks.
+
+    Returns:
+        Non-empty blocks of columns in their original order.
+    """
+    positions = np.array_split(np.arange(len(columns)), n_blocks)
+    return [[columns[i] for i in block] for block in positions if len(block)]
+
+
+def run_in_blocks(check: Callable, data: pd.DataFrame, n_jobs: int, **kwargs) -> pd.DataFrame:
+    """Runs a check over blocks of columns in a process pool.
+
+    Numeric columns are handed to the workers through shared memory, while other columns are
+    pickled. The output of each block is concatenated in the original column order.
+
+    Args:
+        check: Check to be run on each block of columns.
+        data: Data to be checked.
+        n_jobs: Number of worker processes, or -1 to use one per CPU.
+        **kwargs: Additional arguments passed to the check.
+
+    Returns:
+        Output of the check over all columns.
+    """
+    n_jobs = min(resolve_n_jobs(n_jobs), data.shape[1])
+    if n_jobs <= 1:
+        return check(data, **kwargs)
+    # imported here, since most checks never start a process pool
+    from concurrent.futures import ProcessPoolExecutor
+    blocks = split_columns(list(data.columns), n_jobs)
+    segments = []
+    try:
+        parts = []
+        for block in blocks:
+            block_parts, block_segments = _to_parts(data.loc[:, block])
+            parts.append(block_parts)
+            segments.extend(block_segments)
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [
+                executor.submit(_run_block, check, block_parts, block, kwargs)
+                for block_parts, block in zip(parts, blocks)
+            ]
+            results = [future.result() for future in futures]
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+    return pd.concat(results, ignore_index=True)
+
+
+def _to_parts(data: pd.DataFrame) -> Tuple[List[BlockPart], List[Any]]:
+    try:
+        from multiprocessing import shared_memory
+    except ImportError:
+        # shared memory requires Python 3.8 or later
+        return [(None, data, data.shape, None, list(data.columns))], []
+    parts, segments = [], []
+    by_dtype: Dict[np.dtype, List[Hashable]] = {}
+    other = []
+    for column, dtype in data.dtypes.items():
+        if isinstance(dtype, np.dtype) and dtype.kind in SHARED_KINDS:
+            by_dtype.setdefault(dtype, []).append(column)
+        else:
+            other.append(column)
+    for dtype, columns in by_dtype.items():
+        values = data.loc[:, columns].to_numpy(dtype=dtype)
+        segment = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        segments.append(segment)
+        np.ndarray(values.shape, dtype=dtype, buffer=segment.buf)[:] = values
+        parts.append((segment.name, None, values.shape, dtype.str, columns))
+    if other:
+        parts.append((None, data.loc[:, other], (data.shape[0], len(other)), None, other))
+    return parts, segments
+
+
+def _run_block(
+        check: Callable,
+        parts: List[BlockPart],
+        columns: List[Hashable],
+        kwargs: Dict,
+) -> pd.DataFrame:
+    segments: List[Any] = []
+    try:
+        return _check_block(check, parts, columns, kwargs, segments)
+    finally:
+        for segment in segments:
+            # views of the segment are still referenced by the traceback if the check raised
+            with contextlib.suppress(BufferError):
+                segment.close()
+
+
+def _check_block(
+        check: Callable,
+        parts: List[BlockPart],
+        columns: List[Hashable],
+        kwargs: Dict,
+        segments: List[Any],
+) -> pd.DataFrame:
+    frames = []
+    for name, frame, shape, dtype, part_columns in parts:
+        if name is None:
+            # align with the shared memory frames, which are rebuilt without the original index
+            frame.index = pd.RangeIndex(frame.shape[0])
+            frames.append(frame)
+            continue
+        from multiprocessing import shared_memory
+        segment = shared_memory.SharedMemory(name=name)
+        segments.append(segment)
+        values = np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+        frames.append(pd.DataFrame(values, columns=part_columns, copy=False))
+    return check(pd.concat(frames, axis=1).loc[:, columns], **kwargs)
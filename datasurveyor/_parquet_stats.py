@@ -0,0 +1,156 @@
+# standard library imports
+import os
+from typing import Any, Dict, Hashable, List, Optional
+# local imports
+from datasurveyor import _dtypes
+from datasurveyor._summary import ColumnSummary
+from datasurveyor._survey import CHECKS, _Check, check_columns
+
+
+# checks rejecting columns with nulls, which are rejected from footer null counts before any data is read
+NULL_FREE_CHECKS = ('UniqueFeatures.check_uniqueness',)
+
+
+def is_parquet(source: Any) -> bool:
+    """Checks if a source is the path of a Parquet file.
+
+    Args:
+        source: Source of a survey.
+
+    Returns:
+        True if `source` is a path with a Parquet suffix.
+    """
+    # imported here, since _streaming imports this module
+    from datasurveyor._streaming import PARQUET_SUFFIXES
+    if not isinstance(source, (str, os.PathLike)):
+        return False
+    return os.path.splitext(os.fspath(source))[1].lower() in PARQUET_SUFFIXES
+
+
+def summarize_footer(
+        path: str,
+        checks: List[_Check],
+        chunksize: int,
+) -> Optional[Dict[Hashable, ColumnSummary]]:
+    """Summarizes a Parquet file from the statistics in its footer, scanning data only if needed.
+
+    Parquet writers store the null count, minimum, and maximum of each column in every row
+    group. Summaries tracking only null counts (and minimums and maximums of boolean or integer
+    columns) are updated from those statistics without reading any data page. Only the row groups
+    of columns whose statistics are missing, or which need statistics the footer does not hold
+    (e.g. category counts), are read, and only those columns. Columns checked for uniqueness are
+    rejected from their footer null counts before any data page is read.
+
+    Args:
+        path: Path of a Parquet file.
+        checks: Parsed checks.
+        chunksize: Number of rows per chunk when scanning row groups.
+
+    Returns:
+        Dict mapping each column needed by the checks to its summary, in column order, or None
+        if the file has no row groups.
+
+    Raises:
+        TypeError: If a column has a dtype its check does not accept.
+        ValueError: If the footer shows nulls in columns checked for uniqueness.
+        ImportError: If pyarrow is not installed.
+    """
+    # imported here, since _streaming imports this module
+    from datasurveyor._streaming import new_summaries
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError('Surveying Parquet files requires pyarrow.') from e
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    # validators only read dtypes, so they get the schema as a DataFrame of no rows
+    empty = parquet_file.schema_arrow.empty_table().to_pandas()
+    columns = list(empty.columns)
+    for check in checks:
+        CHECKS[check.name].validate(empty.loc[:, check_columns(check, columns)], check.kwargs)
+    if metadata.num_row_groups == 0:
+        return None
+    summaries = new_summaries(checks, columns)
+    fields = _field_names(parquet_file.schema_arrow, columns)
+    positions = _chunk_positions(metadata.row_group(0))
+    # footer statistics of every row group are read before any data page
+    plan, footer_nulls = [], {}
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        stats, scanned = {}, []
+        for column, summary in summaries.items():
+            position = positions.get(fields.get(column))
+            statistics = None if position is None else row_group.column(position).statistics
+            if statistics is not None and statistics.has_null_count:
+                footer_nulls[column] = footer_nulls.get(column, 0) + statistics.null_count
+            found = footer_stats(statistics, row_group.num_rows, summary, empty[column].dtype)
+            if found is None:
+                scanned.append(column)
+            else:
+                stats[column] = found
+        plan.append((row_group.num_rows, stats, scanned))
+    for check in checks:
+        if check.name in NULL_FREE_CHECKS and any(footer_nulls.get(c) for c in check_columns(check, columns)):
+            raise ValueError('Columns with unique data should not contain nulls.')
+    for i, (n_rows, stats, scanned) in enumerate(plan):
+        for column, found in stats.items():
+            summaries[column].add_stats(n_rows=n_rows, **found)
+        if not scanned:
+            continue
+        batches = parquet_file.iter_batches(
+            batch_size=chunksize, row_groups=[i], columns=[fields[column] for column in scanned],
+        )
+        for batch in batches:
+            chunk = batch.to_pandas()
+            for column in scanned:
+                summaries[column].update(chunk[fields[column]])
+    return summaries
+
+
+def footer_stats(
+        statistics: Any,
+        n_rows: int,
+        summary: ColumnSummary,
+        dtype: Any,
+) -> Optional[Dict[str, Any]]:
+    """Reads the statistics a summary tracks from the footer statistics of a column chunk.
+
+    Args:
+        statistics: Statistics of the column chunk in a row group (None if not written).
+        n_rows: Number of rows in the row group.
+        summary: Summary of the column.
+        dtype: pandas dtype the column is read with.
+
+    Returns:
+        Arguments of `ColumnSummary.add_stats` other than the number of rows, or None if the
+        statistics are missing or cannot answer what the summary tracks (so the chunk is scanned).
+    """
+    if summary.track_sum or summary.track_counts or summary.fuzzy_nulls is not None:
+        return None
+    if statistics is None or not statistics.has_null_count:
+        return None
+    found = {'null_count': statistics.null_count}
+    if not summary.track_min_max or statistics.null_count == n_rows:
+        return found
+    # string statistics may be truncated and float statistics skip NaN, so only booleans and
+    # integers have exact minimums and maximums
+    if not statistics.has_min_max or not _dtypes.has_kind(dtype, _dtypes.BINARY_KINDS):
+        return None
+    found.update(min_=statistics.min, max_=statistics.max)
+    return found
+
+
+def _field_names(schema: Any, columns: List[Hashable]) -> Dict[Hashable, str]:
+    # the pandas columns are the fields other than the stored index, in the same order
+    # (a RangeIndex is described in the metadata rather than stored)
+    index_columns = (schema.pandas_metadata or {}).get('index_columns', [])
+    index_fields = {name for name in index_columns if isinstance(name, str)}
+    names = [name for name in schema.names if name not in index_fields]
+    if len(names) == len(columns):
+        return dict(zip(columns, names))
+    return {column: str(column) for column in columns}
+
+
+def _chunk_positions(row_group: Any) -> Dict[str, int]:
+    # nested fields are stored as several column chunks, none named after the field, so they are scanned
+    return {row_group.column(j).path_in_schema: j for j in range(row_group.num_columns)}
@@ -0,0 +1,348 @@
+# standard library imports
+import functools
+from typing import Any, Callable, Dict, Hashable, List, Tuple, Union
+# third party imports
+import numpy as np
+import pandas as pd
+# local imports
+from datasurveyor import _parallel, _sketches
+
+
+# number of partial results combined by each step of the tree reduction
+SPLIT_EVERY = 8
+
+# a dask DataFrame or Series, or a list of pandas partitions
+Partitioned = Union[List[Union[pd.DataFrame, pd.Series]], Tuple[Union[pd.DataFrame, pd.Series], ...], Any]
+
+
+def is_dask(data: Any) -> bool:
+    """Checks if data is a dask DataFrame or Series (without importing dask).
+
+    Args:
+        data: Data to be checked.
+
+    Returns:
+        True if `data` is a dask collection that can be split into delayed partitions.
+    """
+    return type(data).__module__.split('.')[0] == 'dask' and hasattr(data, 'to_delayed')
+
+
+def is_partitioned(data: Any) -> bool:
+    """Checks if data is split into partitions the checks can map over.
+
+    Args:
+        data: Data to be checked.
+
+    Returns:
+        True if `data` is a dask DataFrame or Series, or a non-empty list or tuple of pandas
+        DataFrames or Series.
+    """
+    if is_dask(data):
+        return True
+    return (
+        isinstance(data, (list, tuple))
+        and len(data) > 0
+        and all(isinstance(part, (pd.DataFrame, pd.Series)) for part in data)
+    )
+
+
+def is_series(data: Partitioned) -> bool:
+    """Checks if partitioned data is a single column, like a Series.
+
+    Args:
+        data: Partitioned data.
+
+    Returns:
+        True if `data` is a dask Series or a list of Series.
+    """
+    first = data._meta if is_dask(data) else data[0]
+    return isinstance(first, pd.Series)
+
+
+def map_reduce(
+        data: Partitioned,
+        mapper: Callable[[Union[pd.DataFrame, pd.Series]], Any],
+        combine: Callable[[List[Any]], Any],
+        n_jobs: int = 1,
+        split_every: int = SPLIT_EVERY,
+) -> Any:
+    """Maps each partition to a partial result and combines the partials with a tree reduction.
+
+    Partials are combined `split_every` at a time, level by level, in partition order, so
+    `combine` may rely on the order of its inputs. Dask collections are computed with the
+    scheduler dask is configured to use (e.g. threads, processes, or a distributed cluster).
+
+    Args:
+        data: Dask DataFrame or Series, or a list of pandas partitions.
+        mapper: Maps a pandas partition to a partial result.
+        combine: Combines a list of partial results into one.
+        n_jobs: Number of worker processes mapping a list of partitions (-1 uses one per CPU).
+        split_every: Number of partials combined by each step of the reduction.
+
+    Returns:
+        The combined result of all partitions.
+    """
+    if is_dask(data):
+        import dask
+        partials = [dask.delayed(mapper)(part) for part in data.to_delayed()]
+        combine = dask.delayed(combine)
+    else:
+        n_jobs = min(_parallel.resolve_n_jobs(n_jobs), len(data))
+        if n_jobs <= 1:
+            partials = [mapper(part) for part in data]
+        else:
+            # imported here, since most checks never start a process pool
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                partials = list(executor.map(mapper, data))
+    while len(partials) > 1:
+        partials = [combine(partials[i:i + split_every]) for i in range(0, len(partials), split_every)]
+    return partials[0].compute() if is_dask(data) else partials[0]
+
+
+def run_check(func: Callable, data: Partitioned, n_jobs: int = 1, **kwargs) -> pd.DataFrame:
+    """Runs a feature check as a map-reduce over the partitions of the data.
+
+    Each partition is reduced to mergeable column summaries (or HyperLogLog sketches when
+    `approx` is set), the partials are merged with a tree reduction, and the output is built from
+    the merged statistics, so it matches calling the check on the concatenated partitions.
+
+    Args:
+        func: Public check to be run (e.g. `GeneralFeatures.check_nulls`).
+        data: Dask DataFrame or Series, or a list of pandas partitions sharing the same columns.
+        n_jobs: Number of worker processes mapping a list of partitions (-1 uses one per CPU).
+        **kwargs: Additional arguments passed to the check.
+
+    Returns:
+        DataFrame with the output of the check.
+
+    Raises:
+        ValueError: If the check samples rows, or the partitions do not share the same columns.
+    """
+    # imported here, since _survey imports the feature classes that call this function
+    from datasurveyor._survey import parse_check
+    if kwargs.get('sample') is not None:
+        raise ValueError('Sampled checks require a pandas DataFrame or Series.')
+    check = parse_check((func.__qualname__, kwargs))
+    series = is_series(data)
+    if check.kwargs.get('approx'):
+        mapper = functools.partial(_sketch_partition, check=check)
+        columns, sketches, null_counts, n_rows = map_reduce(data, mapper, _merge_sketches, n_jobs)
+        return approx_result(check, columns, sketches, null_counts, n_rows, series)
+    mapper = functools.partial(_summarize_partition, check=check)
+    summaries = map_reduce(data, mapper, _merge_summaries, n_jobs)
+    return summary_result(check, summaries, series)
+
+
+def find_duplicates(data: Partitioned, composite: bool, n_examples: int) -> pd.DataFrame:
+    """Runs `UniqueFeatures.find_duplicates` over the partitions of the data.
+
+    The fingerprints of each partition are gathered in partition order (8 bytes per row and
+    column), so positions count rows across all partitions. The sampled duplicated values are
+    then fetched from the partitions holding them.
+
+    Args:
+        data: Dask DataFrame or Series, or a list of pandas partitions sharing the same columns.
+        composite: If True: checks the columns together as a single composite key.
+        n_examples: Maximum number of duplicated values to report, and of positions for each
+            (at least 2).
+
+    Returns:
+        DataFrame with the output of `UniqueFeatures.find_duplicates`.
+
+    Raises:
+        ValueError: If unique data contains nulls.
+    """
+    from datasurveyor._unique_features import UniqueFeatures
+    series = is_series(data)
+    mapper = functools.partial(_fingerprint_partition, composite=composite)
+    columns, hashes, lengths = map_reduce(data, mapper, _concat_fingerprints)
+    found = [_sketches.duplicate_fingerprints(key_hashes, n_examples) for key_hashes in hashes]
+    # only the rows holding the first appearance of each sampled value are fetched
+    first = sorted({rows[0] for _, positions in found for rows in positions})
+    rows = _take_rows(data, lengths, first)
+    n_rows = int(sum(lengths))
+    values = []
+    for i, (_, positions) in enumerate(found):
+        key = rows.loc[[rows_[0] for rows_ in positions]]
+        if isinstance(key, pd.Series):
+            values.append(key.tolist())
+        elif composite:
+            values.append(list(key.itertuples(index=False, name=None)))
+        else:
+            values.append(key.iloc[:, i].tolist())
+    counts = [count for count, _ in found]
+    if composite or series:
+        count_dupes = counts[0]
+    else:
+        count_dupes = pd.Series(counts, index=columns)
+    result = UniqueFeatures._uniqueness_result(n_rows - count_dupes, n_rows)
+    result['dupe_values'] = pd.Series(values, dtype=object)
+    result['dupe_positions'] = pd.Series([positions for _, positions in found], dtype=object)
+    return result
+
+
+def summary_result(check: Any, summaries: Dict[Hashable, Any], series: bool) -> pd.DataFrame:
+    """Builds the output of a check from the merged summaries of its columns.
+
+    Args:
+        check: Parsed check.
+        summaries: Summaries of the columns checked.
+        series: If True: builds the output of a Series (scalar statistics).
+
+    Returns:
+        DataFrame with the output of the check.
+    """
+    from datasurveyor._streaming import summaries_to_results
+    from datasurveyor._survey import CHECKS
+    if not series:
+        return summaries_to_results([check], list(summaries), summaries)[check.name]
+    summary = next(iter(summaries.values()))
+
+    def get(key):
+        # like the checks themselves, a Series ignores nulls when finding its most common value
+        return summary.stat(('mode', True) if key[0] == 'mode' else key)
+
+    return CHECKS[check.name].build(get, summary.n_rows, check.kwargs)
+
+
+def approx_result(
+        check: Any,
+        columns: List[Hashable],
+        sketches: List[_sketches.HyperLogLog],
+        null_counts: List[int],
+        n_rows: int,
+        series: bool,
+) -> pd.DataFrame:
+    """Builds the output of an approximate check from the merged HyperLogLog sketches of its columns.
+
+    Args:
+        check: Parsed check (`CategoricalFeatures.check_n_categories` or
+            `UniqueFeatures.check_uniqueness`).
+        columns: Columns checked.
+        sketches: Sketch of the non-null values of each column.
+        null_counts: Count of nulls of each column.
+        n_rows: Number of rows checked.
+        series: If True: builds the output of a Series (scalar statistics).
+
+    Returns:
+        DataFrame with the output of the check.
+
+    Raises:
+        ValueError: If unique data contains nulls.
+    """
+    from datasurveyor._categorical_features import CategoricalFeatures
+    from datasurveyor._unique_features import UniqueFeatures
+    is_uniqueness = check.name == 'UniqueFeatures.check_uniqueness'
+    if is_uniqueness and any(null_counts):
+        raise ValueError('Columns with unique data should not contain nulls.')
+    dropna = True if is_uniqueness else check.kwargs['dropna']
+    estimates = []
+    for sketch, null_count in zip(sketches, null_counts):
+        # matches `_sketches.approx_nunique`: capped at the number of values, plus nulls if kept
+        estimate = int(round(min(sketch.estimate(), n_rows - null_count)))
+        estimates.append(estimate + int(not dropna and null_count > 0))
+    rel_error = _sketches.HyperLogLog(check.kwargs['precision']).rel_error
+    if series:
+        n_unique, error = estimates[0], estimates[0] * rel_error
+    else:
+        n_unique = pd.Series(estimates, index=columns, dtype='int64')
+        error = n_unique * rel_error
+    if is_uniqueness:
+        return UniqueFeatures._uniqueness_result(n_unique, n_rows, error)
+    return CategoricalFeatures._n_categories_result(n_unique, error)
+
+
+def _to_frame(part: Union[pd.DataFrame, pd.Series]) -> pd.DataFrame:
+    return part if isinstance(part, pd.DataFrame) else part.to_frame()
+
+
+def _validate_partition(part: Union[pd.DataFrame, pd.Series], check: Any) -> pd.DataFrame:
+    # validators only read dtypes, so they get the checked columns of no rows
+    from datasurveyor._survey import CHECKS, check_columns
+    frame = _to_frame(part)
+    empty = frame.iloc[:0].loc[:, check_columns(check, list(frame.columns))]
+    CHECKS[check.name].validate(empty if isinstance(part, pd.DataFrame) else empty.iloc[:, 0], check.kwargs)
+    return frame
+
+
+def _summarize_partition(part: Union[pd.DataFrame, pd.Series], check: Any) -> Dict[Hashable, Any]:
+    from datasurveyor._streaming import new_summaries
+    frame = _validate_partition(part, check)
+    summaries = new_summaries([check], list(frame.columns))
+    for column, summary in summaries.items():
+        summary.update(frame[column])
+    return summaries
+
+
+def _merge_summaries(partials: List[Dict[Hashable, Any]]) -> Dict[Hashable, Any]:
+    from datasurveyor._streaming import StreamingSurvey
+    return StreamingSurvey.merge_summaries(partials)
+
+
+def _sketch_partition(
+        part: Union[pd.DataFrame, pd.Series],
+        check: Any,
+) -> Tuple[List[Hashable], List[_sketches.HyperLogLog], List[int], int]:
+    from datasurveyor._survey import check_columns
+    frame = _validate_partition(part, check)
+    columns = check_columns(check, list(frame.columns))
+    sketches, null_counts = [], []
+    for column in columns:
+        values = frame[column]
+        sketches.append(_sketches.HyperLogLog(check.kwargs['precision']).update(values.dropna()))
+        null_counts.append(int(values.isna().sum()))
+    return columns, sketches, null_counts, frame.shape[0]
+
+
+def _merge_sketches(
+        partials: List[Tuple[List[Hashable], List[_sketches.HyperLogLog], List[int], int]],
+) -> Tuple[List[Hashable], List[_sketches.HyperLogLog], List[int], int]:
+    columns, sketches, null_counts, n_rows = partials[0]
+    for other_columns, other_sketches, other_nulls, other_rows in partials[1:]:
+        if other_columns != columns:
+            raise ValueError('Only partitions with the same columns can be checked together.')
+        sketches = [sketch.merge(other) for sketch, other in zip(sketches, other_sketches)]
+        null_counts = [count + other for count, other in zip(null_counts, other_nulls)]
+        n_rows += other_rows
+    return columns, sketches, null_counts, n_rows
+
+
+def _fingerprint_partition(
+        part: Union[pd.DataFrame, pd.Series],
+        composite: bool,
+) -> Tuple[List[Hashable], List[np.ndarray], List[int]]:
+    from datasurveyor._unique_features import UniqueFeatures
+    UniqueFeatures._validate_unique_dtype(part.iloc[:0])
+    if part.isna().to_numpy().any():
+        raise ValueError('Columns with unique data should not contain nulls.')
+    if isinstance(part, pd.Series) or composite:
+        columns = list(part.columns) if isinstance(part, pd.DataFrame) else [part.name]
+        return columns, [_sketches.fingerprints(part)], [part.shape[0]]
+    hashes = [_sketches.fingerprints(part.iloc[:, i]) for i in range(part.shape[1])]
+    return list(part.columns), hashes, [part.shape[0]]
+
+
+def _concat_fingerprints(
+        partials: List[Tuple[List[Hashable], List[np.ndarray], List[int]]],
+) -> Tuple[List[Hashable], List[np.ndarray], List[int]]:
+    columns = partials[0][0]
+    if any(other[0] != columns for other in partials[1:]):
+        raise ValueError('Only partitions with the same columns can be checked together.')
+    hashes = [np.concatenate([partial[1][i] for partial in partials]) for i in range(len(partials[0][1]))]
+    lengths = [length for partial in partials for length in partial[2]]
+    return columns, hashes, lengths
+
+
+def _take_rows(data: Partitioned, lengths: List[int], positions: List[int]) -> Union[pd.DataFrame, pd.Series]:
+    starts = np.concatenate([[0], np.cumsum(lengths)])
+    parts = []
+    for i in np.unique(np.searchsorted(starts, positions, side='right') - 1):
+        wanted = [position for position in positions if starts[i] <= position < starts[i + 1]]
+        part = data.partitions[i].compute() if is_dask(data) else data[i]
+        rows = part.iloc[np.asarray(wanted) - starts[i]]
+        parts.append(rows.set_axis(wanted, axis=0))
+    if not parts:
+        first = data._meta if is_dask(data) else data[0].iloc[:0]
+        return first
+    return pd.concat(parts)
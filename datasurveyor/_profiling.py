@@ -0,0 +1,294 @@
+# standard library imports
+import functools
+import secrets
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
+# third party imports
+import pandas as pd
+# local imports
+from datasurveyor import _columnar, _partitioned
+
+
+# profilers receiving the records of checks, in the order they were started
+_ACTIVE: List['Profiler'] = []
+
+# depth of the profiled checks running in each thread, so checks called by checks are not recorded
+_STATE = threading.local()
+
+# OpenTelemetry span kind and status codes (SPAN_KIND_INTERNAL, STATUS_CODE_OK, STATUS_CODE_ERROR)
+SPAN_KIND_INTERNAL = 1
+STATUS_CODE_OK = 1
+STATUS_CODE_ERROR = 2
+
+
+class CheckProfile(NamedTuple):
+    """Measurements of a single run of a check, or of the check on a single column.
+
+    Attributes:
+        check: Qualified name of the check (e.g. 'BinaryFeatures.check_all_same').
+        column: Column checked on its own, or None for the run of the check over all columns.
+        start_time: Time the run started, in seconds since the epoch.
+        wall_time: Wall time of the run, in seconds.
+        n_rows: Number of rows of the data (None if unknown without computing, as for dask).
+        bytes_scanned: Size of the buffers of the data, in bytes (None if unknown). Object
+            columns count the size of their pointers, not of the objects they point to.
+        peak_memory: Peak memory allocated by Python during the run, in bytes (None if not traced).
+        rows_per_second: Number of rows checked per second (None if the number of rows is unknown).
+        error: Name of the exception raised by the run, or None if the run succeeded.
+    """
+    check: str
+    column: Optional[Hashable]
+    start_time: float
+    wall_time: float
+    n_rows: Optional[int]
+    bytes_scanned: Optional[int]
+    peak_memory: Optional[int]
+    rows_per_second: Optional[float]
+    error: Optional[str]
+
+
+class Profiler:
+    """Records the wall time, bytes scanned, peak memory, and throughput of every check run.
+
+    While a profiler is active (within a `with` block, or between `start` and `stop`), each
+    call to a public check of `BinaryFeatures`, `CategoricalFeatures`, `GeneralFeatures`, or
+    `UniqueFeatures` is measured and recorded. Checks called by other checks are measured as
+    part of the outer call. With `per_column`, each column of a pandas DataFrame is then checked
+    again on its own and recorded as a child of the check, to find which columns are slow (which
+    roughly doubles the time spent checking).
+
+    Peak memory is measured with `tracemalloc`, so it only counts allocations made by Python and
+    NumPy, and slows down the checks while tracing. It is disabled with `trace_memory=False`.
+
+    Args:
+        callback: Function called with each `CheckProfile` as soon as it is recorded.
+        per_column: If True: also checks and records each column of a DataFrame on its own.
+        trace_memory: If True: records the peak memory allocated by each run.
+    """
+
+    def __init__(
+            self,
+            callback: Optional[Callable[[CheckProfile], Any]] = None,
+            per_column: bool = False,
+            trace_memory: bool = True,
+    ) -> None:
+        self.callback = callback
+        self.per_column = per_column
+        self.trace_memory = trace_memory
+        self.records: List[CheckProfile] = []
+
+    def __enter__(self) -> 'Profiler':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def start(self) -> 'Profiler':
+        """Starts recording checks.
+
+        Returns:
+            The profiler.
+        """
+        if self not in _ACTIVE:
+            _ACTIVE.append(self)
+        return self
+
+    def stop(self) -> None:
+        """Stops recording checks (the records are kept).
+
+        Returns:
+            None
+        """
+        if self in _ACTIVE:
+            _ACTIVE.remove(self)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Lists the records as a DataFrame.
+
+        Returns:
+            DataFrame with a row per record and a column per field of `CheckProfile`.
+        """
+        return pd.DataFrame(self.records, columns=list(CheckProfile._fields))
+
+    def to_spans(self, service_name: str = 'datasurveyor') -> Dict[str, Any]:
+        """Exports the records as OpenTelemetry spans.
+
+        Each run of a check is a span of its own trace, and the runs on single columns are its
+        child spans. The output follows the OTLP JSON encoding, so it can be sent as is to the
+        `/v1/traces` endpoint of an OpenTelemetry collector (e.g. http://localhost:4318/v1/traces).
+
+        Args:
+            service_name: Value of the `service.name` resource attribute.
+
+        Returns:
+            Dict holding the OTLP JSON request of the spans.
+        """
+        from datasurveyor import __version__
+        spans, trace_id, parent_id = [], None, ''
+        for record in self.records:
+            span_id = secrets.token_hex(8)
+            if record.column is None:
+                trace_id, parent_id = secrets.token_hex(16), span_id
+            elif trace_id is None:
+                trace_id = secrets.token_hex(16)
+            spans.append(_to_span(record, trace_id, span_id, '' if record.column is None else parent_id))
+        return {
+            'resourceSpans': [{
+                'resource': {'attributes': _to_attributes({'service.name': service_name})},
+                'scopeSpans': [{
+                    'scope': {'name': 'datasurveyor', 'version': __version__},
+                    'spans': spans,
+                }],
+            }],
+        }
+
+    def _record(self, record: CheckProfile) -> None:
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+
+def profiled(check: Callable) -> Callable:
+    """Decorates a public check, so its runs are recorded by the active profilers.
+
+    Args:
+        check: Check to be profiled, taking the data as its first argument.
+
+    Returns:
+        The decorated check, which calls `check` directly while no profiler is active.
+    """
+
+    @functools.wraps(check)
+    def wrapper(data: Any, *args: Any, **kwargs: Any) -> Any:
+        if not _ACTIVE or getattr(_STATE, 'depth', 0):
+            return check(data, *args, **kwargs)
+        profilers = list(_ACTIVE)
+        trace_memory = any(profiler.trace_memory for profiler in profilers)
+        _STATE.depth = 1
+        try:
+            result, record, error = _measure(check, data, args, kwargs, None, trace_memory)
+            for profiler in profilers:
+                profiler._record(record)
+            if error is not None:
+                raise error
+            column_profilers = [profiler for profiler in profilers if profiler.per_column]
+            if column_profilers and isinstance(data, pd.DataFrame) and data.shape[1] > 1:
+                for column in data.columns:
+                    # failures on a single column are recorded, since the check passed on all columns
+                    _, record, _ = _measure(check, data[[column]], args, kwargs, column, trace_memory)
+                    for profiler in column_profilers:
+                        profiler._record(record)
+        finally:
+            _STATE.depth = 0
+        return result
+
+    return wrapper
+
+
+def data_size(data: Any) -> Tuple[Optional[int], Optional[int]]:
+    """Measures the number of rows and the size of the buffers of data, without computing it.
+
+    Args:
+        data: pandas, polars, or dask DataFrame or Series, pyarrow Table or RecordBatch, or list of
+            pandas partitions.
+
+    Returns:
+        The number of rows and the size in bytes, either of which is None if unknown (e.g. for
+        dask collections, whose size is only known once computed).
+    """
+    if isinstance(data, pd.DataFrame):
+        return data.shape[0], int(data.memory_usage(index=False).sum())
+    if isinstance(data, pd.Series):
+        return data.shape[0], int(data.memory_usage(index=False))
+    if _columnar.is_arrow(data):
+        return data.num_rows, data.nbytes
+    if _columnar.is_polars(data):
+        return len(data), int(data.estimated_size())
+    if _partitioned.is_partitioned(data) and not _partitioned.is_dask(data):
+        sizes = [data_size(part) for part in data]
+        return sum(n_rows for n_rows, _ in sizes), sum(n_bytes for _, n_bytes in sizes)
+    return None, None
+
+
+def _measure(
+        check: Callable,
+        data: Any,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        column: Optional[Hashable],
+        trace_memory: bool,
+) -> Tuple[Any, CheckProfile, Optional[Exception]]:
+    # runs the check, returning the exception it raised rather than raising it
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if trace_memory:
+        # tracemalloc.reset_peak was added in Python 3.9; before, the peak includes earlier runs
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+    start_time, start = time.time(), time.perf_counter()
+    result, error = None, None
+    try:
+        result = check(data, *args, **kwargs)
+    except Exception as exc:
+        error = exc
+    wall_time = time.perf_counter() - start
+    peak_memory = max(tracemalloc.get_traced_memory()[1] - base, 0) if trace_memory else None
+    if started_tracing:
+        tracemalloc.stop()
+    n_rows, bytes_scanned = data_size(data)
+    record = CheckProfile(
+        check=check.__qualname__,
+        column=column,
+        start_time=start_time,
+        wall_time=wall_time,
+        n_rows=n_rows,
+        bytes_scanned=bytes_scanned,
+        peak_memory=peak_memory,
+        rows_per_second=n_rows / wall_time if n_rows is not None and wall_time > 0 else None,
+        error=None if error is None else type(error).__name__,
+    )
+    return result, record, error
+
+
+def _to_span(record: CheckProfile, trace_id: str, span_id: str, parent_id: str) -> Dict[str, Any]:
+    start = int(record.start_time * 1e9)
+    attributes = {
+        'datasurveyor.column': None if record.column is None else str(record.column),
+        'datasurveyor.rows': record.n_rows,
+        'datasurveyor.bytes_scanned': record.bytes_scanned,
+        'datasurveyor.peak_memory': record.peak_memory,
+        'datasurveyor.rows_per_second': record.rows_per_second,
+    }
+    status = {'code': STATUS_CODE_OK}
+    if record.error is not None:
+        status = {'code': STATUS_CODE_ERROR, 'message': record.error}
+    return {
+        'traceId': trace_id,
+        'spanId': span_id,
+        'parentSpanId': parent_id,
+        'name': record.check,
+        'kind': SPAN_KIND_INTERNAL,
+        # 64-bit integers are strings in the OTLP JSON encoding
+        'startTimeUnixNano': str(start),
+        'endTimeUnixNano': str(start + int(record.wall_time * 1e9)),
+        'attributes': _to_attributes(attributes),
+        'status': status,
+    }
+
+
+def _to_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    converted = []
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        if isinstance(value, str):
+            converted.append({'key': key, 'value': {'stringValue': value}})
+        elif isinstance(value, float):
+            converted.append({'key': key, 'value': {'doubleValue': value}})
+        else:
+            converted.append({'key': key, 'value': {'intValue': str(int(value))}})
+    return converted
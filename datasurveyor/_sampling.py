@@ -0,0 +1,289 @@
+# standard library imports
+from statistics import NormalDist
+from typing import Any, Hashable, List, Optional, Tuple, Union
+# third party imports
+import numpy as np
+import pandas as pd
+
+
+class Sampler:
+    """Draws a random sample of rows, so checks can be estimated without reading every row.
+
+    Exactly one of `size` and `frac` must be set. Without `by`, `size` draws a fixed number of
+    rows uniformly without replacement (the sample a reservoir sampler yields) and `frac` keeps
+    each row independently with probability `frac` (Bernoulli sampling, keeping a single random
+    row if no row is kept). With `by`, rows are grouped into strata and `size` rows (or a `frac`
+    of the rows, at least one) are drawn from each stratum.
+    Every sampled row is weighted by the number of rows it stands for, so estimates from strata
+    sampled at different rates remain unbiased.
+
+    Args:
+        size: Number of rows to sample (per stratum if `by` is set).
+        frac: Proportion of rows to sample (per stratum if `by` is set).
+        by: Column(s) of the data, or an array-like with a value per row, defining the strata.
+        seed: Seed of the random number generator (samples differ between calls if None).
+
+    Raises:
+        ValueError: If not exactly one of `size` and `frac` is set, `size` is not a positive
+            integer, or `frac` is not greater than 0.0 and less than or equal to 1.0.
+    """
+
+    def __init__(
+            self,
+            size: Optional[int] = None,
+            frac: Optional[float] = None,
+            by: Optional[Union[Hashable, List[Hashable], np.ndarray, pd.Series]] = None,
+            seed: Optional[int] = None,
+    ) -> None:
+        if (size is None) == (frac is None):
+            raise ValueError('Exactly one of the size and frac parameters must be set.')
+        if size is not None and (not isinstance(size, (int, np.integer)) or size < 1):
+            raise ValueError('The size parameter must be a positive integer.')
+        if frac is not None and not 0.0 < frac <= 1.0:
+            raise ValueError('The frac parameter must be greater than 0.0 and less than or equal to 1.0.')
+        self.size = size
+        self.frac = frac
+        self.by = by
+        self.seed = seed
+
+    def draw(
+            self,
+            data: Union[pd.DataFrame, pd.Series],
+    ) -> Tuple[Union[pd.DataFrame, pd.Series], np.ndarray]:
+        """Draws a sample of the rows of the data.
+
+        Args:
+            data: Data to be sampled.
+
+        Returns:
+            The sampled rows (in their original order) and the weight of each sampled row.
+
+        Raises:
+            ValueError: If the data has no rows.
+        """
+        rng = np.random.default_rng(self.seed)
+        n_rows = data.shape[0]
+        if not n_rows:
+            raise ValueError('Data with no rows cannot be sampled.')
+        if self.by is None:
+            positions = self._draw_positions(np.arange(n_rows), rng)
+            weights = np.full(positions.shape[0], n_rows / positions.shape[0])
+        else:
+            positions, weights = [np.empty(0, dtype=np.intp)], [np.empty(0)]
+            for stratum in self._strata(data):
+                sampled = self._draw_positions(stratum, rng)
+                positions.append(sampled)
+                weights.append(np.full(sampled.shape[0], stratum.shape[0] / sampled.shape[0]))
+            positions, weights = np.concatenate(positions), np.concatenate(weights)
+        order = np.argsort(positions, kind='stable')
+        return data.iloc[positions[order]], weights[order]
+
+    def _draw_positions(self, positions: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        if self.size is not None:
+            if self.size >= positions.shape[0]:
+                return positions
+            return rng.choice(positions, size=self.size, replace=False)
+        if self.by is None:
+            sampled = positions[rng.random(positions.shape[0]) < self.frac]
+            # like the strata below, a sample keeps at least one row, so every estimate is defined
+            return sampled if sampled.shape[0] else rng.choice(positions, size=1)
+        # strata are sampled proportionally, keeping at least one row of each stratum
+        n_sampled = max(1, int(round(self.frac * positions.shape[0])))
+        return rng.choice(positions, size=n_sampled, replace=False)
+
+    def _strata(self, data: Union[pd.DataFrame, pd.Series]) -> List[np.ndarray]:
+        by = self.by
+        if isinstance(data, pd.DataFrame) and not isinstance(by, (np.ndarray, pd.Series)):
+            by = [data[column] for column in (by if isinstance(by, list) else [by])]
+        elif isinstance(by, pd.Series):
+            by = by.to_numpy()
+        groups = pd.Series(np.arange(data.shape[0])).groupby(by, sort=False, dropna=False)
+        return [group.to_numpy() for _, group in groups]
+
+
+def resolve_sampler(sample: Union[int, float, Sampler]) -> Sampler:
+    """Resolves the `sample` argument of a check into a sampler.
+
+    Args:
+        sample: Number of rows to sample, proportion of rows to sample, or a `Sampler`.
+
+    Returns:
+        The sampler.
+
+    Raises:
+        ValueError: If `sample` is not a positive integer, a proportion, or a `Sampler`.
+    """
+    if isinstance(sample, Sampler):
+        return sample
+    if isinstance(sample, (bool, np.bool_)):
+        raise ValueError('The sample parameter must be a positive integer, a proportion, or a Sampler.')
+    if isinstance(sample, (int, np.integer)):
+        return Sampler(size=sample)
+    if isinstance(sample, (float, np.floating)):
+        return Sampler(frac=sample)
+    raise ValueError('The sample parameter must be a positive integer, a proportion, or a Sampler.')
+
+
+def validate_confidence(confidence: float) -> None:
+    """Validates the confidence level of intervals.
+
+    Args:
+        confidence: Confidence level to be validated.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If `confidence` is not between 0.0 and 1.0 (exclusive).
+    """
+    if not 0.0 < confidence < 1.0:
+        raise ValueError('The confidence parameter must be greater than 0.0 and less than 1.0.')
+    return
+
+
+def effective_size(weights: np.ndarray) -> float:
+    """Computes the Kish effective sample size of weighted rows.
+
+    Args:
+        weights: Weight of each sampled row.
+
+    Returns:
+        The number of equally weighted rows giving estimates of the same precision (the number
+        of rows itself when the weights are equal).
+    """
+    return weights.sum() ** 2 / (weights ** 2).sum()
+
+
+def to_indicators(data: Union[pd.DataFrame, pd.Series]) -> pd.DataFrame:
+    """Converts binary data to float columns with NaN in place of nulls.
+
+    Args:
+        data: Binary data.
+
+    Returns:
+        DataFrame of 0.0, 1.0, and NaN.
+    """
+    frame = data if isinstance(data, pd.DataFrame) else data.to_frame()
+    columns = {i: frame.iloc[:, i].to_numpy(dtype='float64', na_value=np.nan) for i in range(frame.shape[1])}
+    return pd.DataFrame(columns, index=frame.index).set_axis(frame.columns, axis=1)
+
+
+def wilson_interval(
+        prop: Union[pd.Series, float],
+        n: Union[pd.Series, float],
+        confidence: float,
+) -> Tuple[Union[pd.Series, float], Union[pd.Series, float]]:
+    """Computes Wilson score intervals for proportions.
+
+    Args:
+        prop: Estimated proportion(s).
+        n: (Effective) number(s) of sampled rows behind the estimate(s).
+        confidence: Confidence level of the interval(s) (e.g. 0.95).
+
+    Returns:
+        The lower and upper bound(s) of the interval(s).
+    """
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    denominator = 1 + z ** 2 / n
+    center = (prop + z ** 2 / (2 * n)) / denominator
+    half_width = z * np.sqrt(prop * (1 - prop) / n + z ** 2 / (4 * n ** 2)) / denominator
+    lower = np.maximum(center - half_width, 0.0)
+    upper = np.minimum(center + half_width, 1.0)
+    # the bounds at the edges are exact, rather than off by rounding
+    return lower * (prop > 0), upper + (1 - upper) * (prop >= 1)
+
+
+def weighted_props(
+        indicators: pd.DataFrame,
+        weights: np.ndarray,
+) -> Tuple[pd.Series, pd.Series]:
+    """Estimates the proportion of each column of indicators that is 1.
+
+    Args:
+        indicators: Columns of 0.0 and 1.0 per sampled row (NaN rows are left out of the column).
+        weights: Weight of each sampled row.
+
+    Returns:
+        The estimated proportion of each column and its effective sample size (the Kish
+        effective sample size, equal to the number of rows when the weights are equal).
+    """
+    valid = indicators.notna().mul(weights, axis=0)
+    total = valid.sum(axis=0)
+    props = indicators.fillna(0.0).mul(weights, axis=0).sum(axis=0) / total
+    return props, total ** 2 / (valid ** 2).sum(axis=0)
+
+
+def weighted_mode(
+        column: pd.Series,
+        weights: np.ndarray,
+        dropna: bool,
+) -> Tuple[Any, float]:
+    """Finds the most common value of a sampled column from weighted counts.
+
+    Args:
+        column: Sampled column.
+        weights: Weight of each sampled row.
+        dropna: If True: ignores nulls, if False: counts nulls as a value.
+
+    Returns:
+        The most common value and the proportion of all rows it is estimated to make up (nulls
+        count as 0, as they do for the unsampled check).
+    """
+    codes, uniques = pd.factorize(column)
+    valid = codes >= 0
+    counts = np.bincount(codes[valid], weights=weights[valid], minlength=len(uniques))
+    if not counts.size or (not dropna and weights[~valid].sum() > counts.max()):
+        return np.nan, 0.0
+    tied = pd.Index(uniques)[counts == counts.max()]
+    try:
+        # ties are broken like `mode`, by sorting the tied values
+        tied = tied.sort_values()
+    except TypeError:
+        pass
+    return tied[0], counts.max() / weights.sum()
+
+
+def straddles(
+        lower: Union[pd.Series, float],
+        upper: Union[pd.Series, float],
+        thresh: float,
+) -> Union[pd.Series, bool]:
+    """Checks if intervals contain a threshold, so a check cannot tell which side the data is on.
+
+    Args:
+        lower: Lower bound(s) of the interval(s).
+        upper: Upper bound(s) of the interval(s).
+        thresh: Threshold compared against.
+
+    Returns:
+        Bool(s) indicating if each interval contains the threshold.
+    """
+    return (lower <= thresh) & (upper >= thresh)
+
+
+def add_interval(
+        result: pd.DataFrame,
+        prop_name: str,
+        lower: Union[pd.Series, float],
+        upper: Union[pd.Series, float],
+        uncertain: Union[pd.Series, bool],
+        sample_size: int,
+) -> pd.DataFrame:
+    """Adds the confidence interval columns of a sampled check to its output.
+
+    Args:
+        result: Output of the check computed from estimates.
+        prop_name: Name of the column holding the estimated proportion.
+        lower: Lower bound(s) of the interval(s).
+        upper: Upper bound(s) of the interval(s).
+        uncertain: Bool(s) indicating if the interval(s) contain the threshold of the check.
+        sample_size: Number of sampled rows.
+
+    Returns:
+        The output with the sample size, the interval bounds, and the uncertain flag(s) added.
+    """
+    result['sample_size'] = sample_size
+    columns = {f'{prop_name}_lower': lower, f'{prop_name}_upper': upper, 'uncertain': uncertain}
+    for name, value in columns.items():
+        result[name] = value.to_numpy() if isinstance(value, pd.Series) else value
+    return result
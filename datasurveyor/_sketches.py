@@ -0,0 +1,448 @@
+# standard library imports
+import math
+from typing import Any, List, Optional, Tuple, Union
+# third party imports
+import numpy as np
+import pandas as pd
+# local imports
+from datasurveyor import _dtypes
+
+
+class HyperLogLog:
+    """HyperLogLog sketch estimating the number of distinct values in constant memory.
+
+    Values are hashed to 64-bit fingerprints with `fingerprints`, so the sketch never holds the
+    values themselves. The sketch uses 2 ** `precision` one-byte registers and has a
+    relative standard error of roughly 1.04 / sqrt(2 ** `precision`).
+
+    Args:
+        precision: Number of bits of each hash used to select a register (4 to 18).
+
+    Raises:
+        ValueError: If `precision` is not between 4 and 18 (inclusive).
+    """
+
+    # number of rows hashed at once, bounding the memory used by the hashes
+    chunk_rows = 1 << 20
+
+    def __init__(self, precision: int = 14) -> None:
+        if not isinstance(precision, int) or not 4 <= precision <= 18:
+            raise ValueError('The precision parameter must be an integer between 4 and 18.')
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def rel_error(self) -> float:
+        """Relative standard error of the estimate."""
+        return 1.04 / math.sqrt(self.registers.shape[0])
+
+    def update(self, values: Union[pd.Series, np.ndarray]) -> 'HyperLogLog':
+        """Adds values to the sketch.
+
+        Args:
+            values: Values to be added (nulls should be removed beforehand).
+
+        Returns:
+            The updated sketch.
+        """
+        values = pd.Series(values, copy=False)
+        for start in range(0, values.shape[0], self.chunk_rows):
+            self._update_hashes(fingerprints(values.iloc[start:start + self.chunk_rows]))
+        return self
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """Combines two sketches of different parts of the same data.
+
+        Args:
+            other: Sketch of another part of the data.
+
+        Returns:
+            New sketch equal to the sketch of both parts together.
+
+        Raises:
+            ValueError: If the sketches do not share the same precision.
+        """
+        if self.precision != other.precision:
+            raise ValueError('Only sketches with the same precision can be merged.')
+        merged = HyperLogLog(self.precision)
+        merged.registers = np.maximum(self.registers, other.registers)
+        return merged
+
+    def estimate(self) -> float:
+        """Estimates the number of distinct values added to the sketch.
+
+        Returns:
+            Estimated number of distinct values.
+        """
+        m = self.registers.shape[0]
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.ldexp(1.0, -self.registers.astype(np.int64)).sum()
+        n_empty = int((self.registers == 0).sum())
+        if raw <= 2.5 * m and n_empty:
+            # linear counting is more accurate for small cardinalities
+            return m * math.log(m / n_empty)
+        return float(raw)
+
+    def _update_hashes(self, hashes: np.ndarray) -> None:
+        hashes = hashes.astype(np.uint64, copy=False)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        rest = hashes << np.uint64(self.precision)
+        rank = np.minimum(_leading_zeros(rest), 64 - self.precision) + 1
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+
+
+def _leading_zeros(values: np.ndarray) -> np.ndarray:
+    # branch-free count of leading zero bits of unsigned 64-bit integers
+    count = np.zeros(values.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        top_clear = values < np.uint64(1 << (64 - shift))
+        count += top_clear * shift
+        values = np.where(top_clear, values << np.uint64(shift), values)
+    return count + (values == 0)
+
+
+def approx_nunique(
+        data: Union[pd.DataFrame, pd.Series],
+        precision: int,
+        dropna: bool = True,
+) -> Tuple[Union[pd.Series, int], Union[pd.Series, float]]:
+    """Estimates the number of unique values with a HyperLogLog sketch per column.
+
+    Args:
+        data: Data to estimate the number of unique values for.
+        precision: Precision of the sketches.
+        dropna: If True: ignores nulls, if False: counts nulls as a unique value.
+
+    Returns:
+        Estimated number(s) of unique values, capped at the number of rows, and the standard
+        error(s) of the estimate(s).
+    """
+    if isinstance(data, pd.DataFrame):
+        estimates = data.apply(lambda column: approx_nunique(column, precision, dropna)[0], axis=0)
+        return estimates.astype('int64'), estimates * HyperLogLog(precision).rel_error
+    values = data.dropna()
+    sketch = HyperLogLog(precision).update(values)
+    estimate = int(round(min(sketch.estimate(), values.shape[0])))
+    if not dropna and values.shape[0] < data.shape[0]:
+        estimate += 1
+    return estimate, estimate * sketch.rel_error
+
+
+class MisraGries:
+    """Misra-Gries sketch tracking the most frequent values in bounded memory.
+
+    At most `capacity` candidate values are kept. Whenever more are seen, the count of the
+    (`capacity` + 1)-th most frequent candidate is subtracted from every candidate and those
+    left without a positive count are dropped. Counts are therefore lower bounds that are off
+    by at most `error`, and every value making up more than 1 / (`capacity` + 1) of the data is
+    guaranteed to be kept. Sketches of different parts of the same data can be merged.
+
+    Args:
+        capacity: Maximum number of candidate values kept.
+
+    Raises:
+        ValueError: If `capacity` is not a positive integer.
+    """
+
+    # number of rows counted at once, bounding the memory used between reductions
+    chunk_rows = 1 << 20
+
+    def __init__(self, capacity: int = 100) -> None:
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError('The capacity parameter must be a positive integer.')
+        self.capacity = capacity
+        self.counts = pd.Series(dtype='int64')
+        self.error = 0
+
+    def update(self, values: Union[pd.Series, np.ndarray]) -> 'MisraGries':
+        """Adds values to the sketch.
+
+        Args:
+            values: Values to be added (nulls are ignored).
+
+        Returns:
+            The updated sketch.
+        """
+        values = pd.Series(values, copy=False)
+        for start in range(0, values.shape[0], self.chunk_rows):
+            chunk = values.iloc[start:start + self.chunk_rows]
+            self._add(_dtypes.value_counts(chunk), 0)
+        return self
+
+    def merge(self, other: 'MisraGries') -> 'MisraGries':
+        """Combines two sketches of different parts of the same data.
+
+        Args:
+            other: Sketch of another part of the data.
+
+        Returns:
+            New sketch of both parts together, with the smaller of the two capacities.
+        """
+        merged = MisraGries(min(self.capacity, other.capacity))
+        merged._add(self.counts, self.error)
+        merged._add(other.counts, other.error)
+        return merged
+
+    def top(self, k: int = 1, null_count: int = 0) -> List[Tuple[Any, int]]:
+        """Lists the most frequent values.
+
+        Args:
+            k: Number of values to list.
+            null_count: Count of nulls, listed as a value if greater than 0.
+
+        Returns:
+            Up to `k` pairs of value and count, from most to least frequent.
+        """
+        return top_counts(self.counts, k, null_count)
+
+    def _add(self, counts: pd.Series, error: int) -> None:
+        self.counts, decrement = reduce_counts(add_counts(self.counts, counts), self.capacity)
+        self.error += error + decrement
+
+
+def add_counts(left: pd.Series, right: pd.Series) -> pd.Series:
+    """Adds two Series of counts indexed by value.
+
+    Args:
+        left: Counts of each value.
+        right: Counts of each value.
+
+    Returns:
+        Combined counts of each value.
+    """
+    if right.empty:
+        return left
+    if left.empty:
+        return right.astype('int64')
+    return left.add(right, fill_value=0).astype('int64')
+
+
+def reduce_counts(counts: pd.Series, capacity: int) -> Tuple[pd.Series, int]:
+    """Applies the Misra-Gries reduction so at most `capacity` counts remain.
+
+    Args:
+        counts: Counts of each value.
+        capacity: Maximum number of counts kept.
+
+    Returns:
+        The reduced counts and the amount subtracted from each of them.
+    """
+    if counts.shape[0] <= capacity:
+        return counts, 0
+    decrement = int(counts.nlargest(capacity + 1).iloc[-1])
+    counts = counts - decrement
+    return counts[counts > 0], decrement
+
+
+def top_counts(counts: pd.Series, k: int, null_count: int = 0) -> List[Tuple[Any, int]]:
+    """Lists the `k` largest counts, ordering tied values the way pandas orders tied modes.
+
+    Args:
+        counts: Counts of each non-null value.
+        k: Number of values to list.
+        null_count: Count of nulls, listed as a value (after any tied values) if greater than 0.
+
+    Returns:
+        Up to `k` pairs of value and count, from most to least frequent.
+    """
+    largest = counts.nlargest(k, keep='all')
+    try:
+        largest = largest.sort_index(kind='mergesort')
+    except TypeError:
+        pass
+    largest = largest.sort_values(ascending=False, kind='mergesort')
+    top = [(value, int(count)) for value, count in largest.items()]
+    if null_count:
+        position = next((i for i, (_, count) in enumerate(top) if null_count > count), len(top))
+        top.insert(position, (np.nan, null_count))
+    return top[:k]
+
+
+def top_categories(
+        data: Union[pd.DataFrame, pd.Series],
+        k: int = 1,
+        dropna: bool = False,
+        capacity: Optional[int] = None,
+) -> Union[pd.Series, List[Tuple[Any, int]]]:
+    """Lists the most frequent categories of each column.
+
+    Args:
+        data: Categorical data.
+        k: Number of categories to list.
+        dropna: If True: ignores nulls, if False: counts nulls as a category.
+        capacity: Capacity of the Misra-Gries sketch used to find the categories in bounded
+            memory (categories are counted exactly if None).
+
+    Returns:
+        Up to `k` pairs of category and count, from most to least frequent, per column.
+    """
+    if isinstance(data, pd.DataFrame):
+        top = [top_categories(data[column], k, dropna, capacity) for column in data.columns]
+        return pd.Series(top, index=data.columns, dtype=object)
+    null_count = 0 if dropna else int(data.isna().sum())
+    if capacity is None:
+        counts = _dtypes.value_counts(data)
+    else:
+        counts = MisraGries(capacity).update(data).counts
+    return top_counts(counts, k, null_count)
+
+
+def leading_category(
+        top: Union[pd.Series, List[Tuple[Any, int]]],
+) -> Tuple[Any, Union[pd.Series, int]]:
+    """Splits the most frequent category and its count from lists of the most frequent categories.
+
+    Args:
+        top: Pairs of category and count, from most to least frequent, per column.
+
+    Returns:
+        The most frequent category (or categories) and count(s).
+    """
+    if isinstance(top, pd.Series):
+        most_common = top.map(lambda pairs: pairs[0][0] if pairs else np.nan).infer_objects()
+        return most_common, top.map(lambda pairs: pairs[0][1] if pairs else 0).astype('int64')
+    return (top[0][0], top[0][1]) if top else (np.nan, 0)
+
+
+# fingerprint shared by every null
+_NULL_FINGERPRINT = pd.util.hash_array(np.array([None], dtype=object))[0]
+
+# odd multiplier of the polynomial hash of the bytes of strings (the 64-bit FNV prime)
+_BYTE_PRIME = np.uint64(0x100000001B3)
+
+
+def fingerprints(data: Union[pd.DataFrame, pd.Series]) -> np.ndarray:
+    """Hashes each row to a 64-bit fingerprint.
+
+    Values are hashed by their logical kind rather than their dtype, so a value gets the same
+    fingerprint in every column holding it (e.g. int32, int64, Int64, or int64[pyarrow], and
+    object, string, or string[pyarrow]) and fingerprints of partitions of different dtypes can
+    be combined. Numbers, booleans, and datetimes are hashed straight from NumPy arrays, where
+    integral floats are hashed as integers (as 1.0 equals 1). Strings are hashed from their UTF-8
+    bytes, read from the Arrow buffers of pyarrow backed strings without converting them to
+    Python objects. Categories are hashed once and looked up by code, and nulls all share a
+    single fingerprint. Other values are hashed by pandas, one distinct value at a time.
+
+    Args:
+        data: Column, or columns hashed together as a composite key.
+
+    Returns:
+        Array with one unsigned 64-bit fingerprint per row.
+    """
+    if isinstance(data, pd.DataFrame):
+        # combine the fingerprints of each column by hashing them together
+        hashes = pd.DataFrame({i: fingerprints(data.iloc[:, i]) for i in range(data.shape[1])})
+        return pd.util.hash_pandas_object(hashes, index=False).to_numpy()
+    if isinstance(data.dtype, pd.CategoricalDtype):
+        # code -1 marks nulls, which all share the last fingerprint
+        categories = fingerprints(pd.Series(data.cat.categories))
+        return np.append(categories, _NULL_FINGERPRINT)[data.cat.codes.to_numpy()]
+    nulls = np.asarray(data.isna())
+    if not nulls.any():
+        return _hash_values(data)
+    hashes = np.full(data.shape[0], _NULL_FINGERPRINT, dtype=np.uint64)
+    hashes[~nulls] = _hash_values(data[~nulls])
+    return hashes
+
+
+def _hash_values(values: pd.Series) -> np.ndarray:
+    # hashes values without nulls by their logical kind
+    kind = values.dtype.kind
+    if kind in 'biu':
+        return pd.util.hash_array(values.to_numpy(dtype='uint64' if kind == 'u' else 'int64'))
+    if kind == 'f':
+        return _hash_floats(values.to_numpy(dtype='float64'))
+    if kind in 'mM':
+        if isinstance(values.dtype, pd.DatetimeTZDtype):
+            values = values.dt.tz_convert('UTC').dt.tz_localize(None)
+        return pd.util.hash_array(values.to_numpy(dtype=f'{kind}8[ns]').view('int64'))
+    if _dtypes.is_arrow(values.dtype) and kind == 'O':
+        import pyarrow as pa
+        chunks = _dtypes.arrow_data(values).chunks
+        if chunks and all(chunk.type in (pa.string(), pa.large_string()) for chunk in chunks):
+            return np.concatenate([_hash_arrow_strings(chunk) for chunk in chunks])
+    # values of other kinds are factorized natively, so only distinct values are hashed
+    codes, uniques = pd.factorize(values)
+    return _hash_objects(np.asarray(uniques, dtype=object))[codes]
+
+
+def _hash_objects(values: np.ndarray) -> np.ndarray:
+    # Python objects of a single kind are hashed like NumPy arrays of that kind, others by pandas
+    inferred = pd.api.types.infer_dtype(values, skipna=False)
+    if inferred == 'string':
+        return _hash_strings(values)
+    if inferred in ('integer', 'boolean'):
+        try:
+            return pd.util.hash_array(values.astype(np.int64))
+        except OverflowError:
+            pass
+    if inferred in ('floating', 'mixed-integer-float'):
+        return _hash_floats(values.astype(np.float64))
+    return pd.util.hash_array(values)
+
+
+def _hash_floats(values: np.ndarray) -> np.ndarray:
+    # integral floats take the bits of the integer they equal, so 1.0 hashes as 1 (and -0.0 as 0)
+    integral = (values == np.floor(values)) & (np.abs(values) < 2.0 ** 63)
+    bits = np.where(integral, np.where(integral, values, 0.0).astype(np.int64), values.view(np.int64))
+    return pd.util.hash_array(bits)
+
+
+def _hash_strings(values: np.ndarray) -> np.ndarray:
+    encoded = [value.encode('utf-8') for value in values]
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    return _hash_utf8(offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8))
+
+
+def _hash_arrow_strings(chunk: Any) -> np.ndarray:
+    import pyarrow as pa
+    chunk = chunk.cast(pa.large_string())
+    _, offsets, data = chunk.buffers()
+    offsets = np.frombuffer(offsets, dtype=np.int64)[chunk.offset:chunk.offset + len(chunk) + 1]
+    data = np.empty(0, dtype=np.uint8) if data is None else np.frombuffer(data, dtype=np.uint8)
+    return _hash_utf8(offsets, data)
+
+
+def _hash_utf8(offsets: np.ndarray, data: np.ndarray) -> np.ndarray:
+    # polynomial hash of the bytes of each string, mixed with its length and hashed by pandas
+    lengths = np.diff(offsets)
+    starts = offsets[:-1] - offsets[0]
+    data = data[offsets[0]:offsets[-1]]
+    # position of each byte within its string, computed in place
+    position = np.repeat(starts, lengths)
+    np.subtract(np.arange(data.shape[0]), position, out=position)
+    powers = np.cumprod(np.full(max(int(lengths.max(initial=0)), 1), _BYTE_PRIME, dtype=np.uint64))
+    terms = powers[position]
+    np.multiply(terms, data, out=terms)
+    sums = np.zeros(lengths.shape[0], dtype=np.uint64)
+    filled = lengths > 0
+    if filled.any():
+        sums[filled] = np.add.reduceat(terms, starts[filled])
+    return pd.util.hash_array(sums ^ lengths.astype(np.uint64))
+
+
+def duplicate_fingerprints(hashes: np.ndarray, n_examples: int) -> Tuple[int, List[List[int]]]:
+    """Counts duplicated fingerprints and locates a bounded sample of them.
+
+    Args:
+        hashes: Fingerprint of each row.
+        n_examples: Maximum number of duplicated fingerprints to locate, and of positions
+            listed for each of them (at least 2, so a duplicate row is always listed).
+
+    Returns:
+        The count of duplicates (rows repeating an earlier fingerprint) and, for up to
+        `n_examples` duplicated fingerprints in order of first appearance, up to
+        max(`n_examples`, 2) row positions where each appears.
+    """
+    is_dupe = pd.Series(hashes, copy=False).duplicated(keep='first').to_numpy()
+    count = int(is_dupe.sum())
+    if not count or not n_examples:
+        return count, []
+    examples = pd.unique(hashes[is_dupe])[:n_examples]
+    candidates = np.flatnonzero(np.isin(hashes, examples))
+    groups = pd.Series(candidates).groupby(hashes[candidates], sort=False)
+    # the first occurrence alone would not show which row duplicates it
+    n_positions = max(n_examples, 2)
+    positions = sorted(group.to_numpy()[:n_positions].tolist() for _, group in groups)
+    return count, positions[:n_examples]
@@ -0,0 +1,254 @@
+# standard library imports
+import numbers
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+# third party imports
+import numpy as np
+import pandas as pd
+# local imports
+from datasurveyor import _columnar, _sketches, _utils
+from datasurveyor._fuzzy_nulls import FuzzyNullMatcher, _is_null
+from datasurveyor._survey import CheckRequest, StatKey, build_results, check_columns, parse_checks, plan_stats
+
+
+# statistics served by the counts of the most common values of a column
+TOP_STATS = ('mode', 'top')
+
+
+def quote_identifier(name: Hashable) -> str:
+    """Quotes a column or table name as a SQL identifier.
+
+    Args:
+        name: Name to be quoted.
+
+    Returns:
+        The name in double quotes, with any double quotes within it doubled.
+    """
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def to_literal(value: Any) -> Optional[str]:
+    """Writes a string or number as a SQL literal.
+
+    Args:
+        value: Value to be written.
+
+    Returns:
+        The SQL literal, or None if the value has no portable literal (e.g. a list or a NaN).
+    """
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    if isinstance(value, (bool, np.bool_)):
+        return str(int(value))
+    if isinstance(value, numbers.Integral):
+        return str(int(value))
+    if isinstance(value, numbers.Real) and np.isfinite(value):
+        return repr(float(value))
+    return None
+
+
+class SqlSurvey:
+    """Runs a collection of feature checks inside a database, fetching only their aggregates.
+
+    The statistics the checks need are compiled into a single `SELECT` of aggregates over the
+    table (`COUNT`, `MIN`, `MAX`, `AVG`, `COUNT(DISTINCT ...)`, and `SUM(CASE ...)` for fuzzy
+    nulls), so only one row is fetched however large the table is. Modes and the most common
+    categories take a `GROUP BY` query per column, which only fetches the values tied for the
+    most common counts. Fuzzy nulls matched by patterns or normalization are matched in Python
+    against the distinct values of the column. The output of each check matches the output of
+    the check on the table read into pandas.
+
+    Identifiers are quoted with double quotes as in standard SQL (MySQL needs the ANSI_QUOTES
+    mode). Literal fuzzy nulls are compared with the values of the column in the database, so
+    databases that reject comparing strings with numbers need `check_fuzzy_nulls` restricted to
+    text columns. Columns are not validated against the dtypes the checks accept, since the
+    database types are not pandas dtypes. Heavy hitter checks (`heavy_hitters`) are answered
+    exactly, and checks cannot be estimated with a sketch (`approx`).
+
+    Args:
+        connection: DB-API 2.0 connection to the database (e.g. from `sqlite3.connect`).
+        table: Name of the table or view to survey, qualified by its schema with a dot if needed.
+        checks: Checks to be run, as accepted by `Survey`.
+
+    Raises:
+        ValueError: If a check is not supported, samples rows, or is requested more than once.
+    """
+
+    def __init__(self, connection: Any, table: str, checks: List[CheckRequest]) -> None:
+        self._connection = connection
+        self._table = '.'.join(quote_identifier(part) for part in table.split('.'))
+        self._checks = parse_checks(checks)
+
+    def run(self) -> Dict[str, pd.DataFrame]:
+        """Runs the requested checks.
+
+        Returns:
+            Dict mapping the qualified name of each check to its output DataFrame.
+
+        Raises:
+            KeyError: If a check requests columns the table does not have.
+            ValueError: If an argument of a check is invalid, or a column checked for
+                uniqueness contains nulls.
+        """
+        columns = self._columns()
+        for check in self._checks:
+            missing = [column for column in check_columns(check, columns) if column not in columns]
+            if missing:
+                raise KeyError(f'Columns not found in {self._table}: {missing}.')
+            if 'thresh' in check.kwargs:
+                _utils.validate_thresh(check.kwargs['thresh'])
+        plan = plan_stats(self._checks, columns)
+        slots = self._slots(plan)
+        row = self._fetch(self.compile(plan))[0]
+        n_rows = int(row[0])
+        stats = {slot: value for slot, value in zip(slots, row[1:])}
+        counts = self._top_counts(plan)
+        fuzzy = self._fuzzy_counts(plan, stats)
+
+        def get_stat(key: StatKey, selected: List[Hashable]) -> Any:
+            values = [self._stat(key, column, n_rows, stats, counts, fuzzy) for column in selected]
+            if key[0] == 'mode':
+                return tuple(pd.Series(list(part), index=selected) for part in zip(*values))
+            return pd.Series(values, index=selected)
+
+        return build_results(self._checks, columns, get_stat, n_rows)
+
+    def compile(self, plan: Optional[Dict[StatKey, List[Hashable]]] = None) -> str:
+        """Compiles the aggregates the checks need into a single query.
+
+        Args:
+            plan: Statistics needed by the checks and their columns (planned from the columns of
+                the table if None).
+
+        Returns:
+            The `SELECT` of the number of rows followed by each aggregate.
+        """
+        if plan is None:
+            plan = plan_stats(self._checks, self._columns())
+        expressions = ['COUNT(*)'] + [_aggregate(key, column) for key, column in self._slots(plan)]
+        return f'SELECT {", ".join(expressions)} FROM {self._table}'
+
+    def _columns(self) -> List[Hashable]:
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(f'SELECT * FROM {self._table} WHERE 1 = 0')
+            return [description[0] for description in cursor.description]
+        finally:
+            cursor.close()
+
+    def _fetch(self, query: str) -> List[Tuple]:
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(query)
+            return list(cursor.fetchall())
+        finally:
+            cursor.close()
+
+    def _slots(self, plan: Dict[StatKey, List[Hashable]]) -> List[Tuple[StatKey, Hashable]]:
+        # the null count of every column is fetched, since modes and fuzzy nulls count nulls too
+        slots = []
+        for column in dict.fromkeys(column for needed in plan.values() for column in needed):
+            slots.append((('null_count',), column))
+        for key, needed in plan.items():
+            if key[0] in ('min', 'max', 'mean', 'nunique'):
+                slots.extend((key, column) for column in needed)
+            elif key[0] == 'fuzzy_null_count' and _pushed_down(key):
+                slots.extend((key, column) for column in needed)
+        return slots
+
+    def _top_counts(self, plan: Dict[StatKey, List[Hashable]]) -> Dict[Hashable, pd.Series]:
+        # a single query per column fetches every value needed by its modes and top categories
+        k_needed: Dict[Hashable, int] = {}
+        for key, needed in plan.items():
+            if key[0] in TOP_STATS:
+                k = 1 if key[0] == 'mode' else key[3]
+                for column in needed:
+                    k_needed[column] = max(k_needed.get(column, 0), k)
+        return {column: self._group_counts(column, k) for column, k in k_needed.items()}
+
+    def _fuzzy_counts(
+            self,
+            plan: Dict[StatKey, List[Hashable]],
+            stats: Dict[Tuple[StatKey, Hashable], Any],
+    ) -> Dict[Tuple[StatKey, Hashable], int]:
+        # fuzzy nulls that cannot be compared in SQL are matched against the distinct values
+        fuzzy = {}
+        for key, needed in plan.items():
+            if key[0] != 'fuzzy_null_count' or _pushed_down(key):
+                continue
+            matcher = FuzzyNullMatcher(*key[1:])
+            for column in needed:
+                nulls = int(stats[(('null_count',), column)])
+                fuzzy[(key, column)] = _columnar.count_fuzzy_nulls(matcher, self._group_counts(column), nulls)
+        return fuzzy
+
+    def _group_counts(self, column: Hashable, k: Optional[int] = None) -> pd.Series:
+        # counts every non-null value, or only the values tied with the k most common ones
+        name = quote_identifier(column)
+        groups = f'FROM {self._table} WHERE {name} IS NOT NULL GROUP BY {name}'
+        query = f'SELECT {name}, COUNT(*) {groups}'
+        if k is not None:
+            largest = f'SELECT COUNT(*) AS n {groups} ORDER BY COUNT(*) DESC LIMIT {int(k)}'
+            query += f' HAVING COUNT(*) >= (SELECT MIN(n) FROM ({largest}) AS largest)'
+        rows = self._fetch(query)
+        index = pd.Index([value for value, _ in rows])
+        return pd.Series([count for _, count in rows], index=index, dtype='int64')
+
+    def _stat(
+            self,
+            key: StatKey,
+            column: Hashable,
+            n_rows: int,
+            stats: Dict[Tuple[StatKey, Hashable], Any],
+            counts: Dict[Hashable, pd.Series],
+            fuzzy: Dict[Tuple[StatKey, Hashable], int],
+    ) -> Any:
+        null_count = int(stats[(('null_count',), column)])
+        if key[0] == 'mode':
+            top = counts[column]
+            # like the checks, nulls only win the mode outright, and then count 0
+            if top.empty or (not key[1] and null_count > top.max()):
+                return np.nan, 0
+            return _sketches.top_counts(top, 1)[0]
+        if key[0] == 'top':
+            # the values tied with the k most common ones list the same categories as all counts
+            return _sketches.top_counts(counts[column], key[3], 0 if key[1] else null_count)
+        if key[0] == 'null_count':
+            return null_count
+        if key[0] == 'fuzzy_null_count':
+            if (key, column) in fuzzy:
+                return fuzzy[(key, column)]
+            matches_nulls = any(_is_null(value) for value in key[1])
+            return int(stats[(key, column)] or 0) + (null_count if matches_nulls else 0)
+        value = stats[(key, column)]
+        if key[0] == 'nunique':
+            return int(value) + int(not key[1] and null_count > 0)
+        if value is None:
+            return np.nan
+        return float(value) if key[0] == 'mean' else value
+
+
+def _pushed_down(key: StatKey) -> bool:
+    # literal fuzzy nulls are compared in SQL, unless strings are normalized or matched by patterns
+    values, patterns, normalize = key[1:]
+    if patterns or normalize:
+        return False
+    return all(_is_null(value) or to_literal(value) is not None for value in values)
+
+
+def _aggregate(key: StatKey, column: Hashable) -> str:
+    name = quote_identifier(column)
+    stat = key[0]
+    if stat == 'null_count':
+        return f'COUNT(*) - COUNT({name})'
+    if stat == 'min':
+        return f'MIN({name})'
+    if stat == 'max':
+        return f'MAX({name})'
+    if stat == 'mean':
+        return f'AVG({name})'
+    if stat == 'nunique':
+        return f'COUNT(DISTINCT {name})'
+    literals = [to_literal(value) for value in key[1] if not _is_null(value)]
+    if not literals:
+        return '0'
+    return f'SUM(CASE WHEN {name} IN ({", ".join(literals)}) THEN 1 ELSE 0 END)'
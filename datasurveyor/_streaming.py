@@ -0,0 +1,366 @@
+# standard library imports
+import os
+import pickle
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+# third party imports
+import numpy as np
+import pandas as pd
+# local imports
+from datasurveyor import _parquet_stats, _utils
+from datasurveyor._cache import SummaryCache, cache_key, column_fingerprint
+from datasurveyor._summary import ColumnSummary
+from datasurveyor._survey import CHECKS, CheckRequest, StatKey, _Check, build_results, check_columns
+from datasurveyor._survey import parse_check, parse_checks, plan_stats, reject_approx
+
+
+Source = Union[str, os.PathLike, Iterable[Union[pd.DataFrame, pd.Series]]]
+Summaries = Dict[Hashable, ColumnSummary]
+
+CSV_SUFFIXES = ('.csv', '.tsv', '.txt')
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+JSON_LINES_SUFFIXES = ('.jsonl', '.ndjson', '.json')
+NUMPY_SUFFIXES = ('.npy',)
+ARROW_IPC_SUFFIXES = ('.arrow', '.feather', '.ipc')
+
+
+def iter_chunks(source: Source, chunksize: int = 100_000, **read_kwargs) -> Iterator[pd.DataFrame]:
+    """Iterates over a file or an iterable of chunks as DataFrames.
+
+    NumPy (.npy) and Arrow IPC (Feather version 2) files are memory-mapped rather than read. The
+    chunks are views of the mapped file, paged in as they are checked, and each mapping is
+    released once its chunks are dropped, so resident memory stays bounded by the chunk size.
+
+    Args:
+        source: Path of a CSV, Parquet, JSON lines, NumPy (.npy), or Arrow IPC file, or an
+            iterable of DataFrames or Series (e.g. the reader returned by
+            `pd.read_csv(..., chunksize=...)`).
+        chunksize: Number of rows per chunk when reading a file.
+        **read_kwargs: Additional arguments passed to the pandas reader of a CSV or JSON lines file.
+
+    Yields:
+        Chunks of the data as DataFrames.
+
+    Raises:
+        ValueError: If the file type is not recognized, or a NumPy array has more than 2 dimensions.
+        ImportError: If a Parquet or Arrow IPC file is read without pyarrow installed.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        suffix = os.path.splitext(path)[1].lower()
+        if suffix in CSV_SUFFIXES:
+            yield from pd.read_csv(path, chunksize=chunksize, **read_kwargs)
+        elif suffix in PARQUET_SUFFIXES:
+            yield from _iter_parquet(path, chunksize)
+        elif suffix in JSON_LINES_SUFFIXES:
+            yield from pd.read_json(path, lines=True, chunksize=chunksize, **read_kwargs)
+        elif suffix in NUMPY_SUFFIXES:
+            yield from _iter_npy(path, chunksize)
+        elif suffix in ARROW_IPC_SUFFIXES:
+            yield from _iter_arrow_ipc(path, chunksize)
+        else:
+            raise ValueError(
+                f'Unable to survey files of type {suffix}. '
+                'Expected CSV, Parquet, JSON lines, NumPy (.npy), or Arrow IPC.'
+            )
+        return
+    for chunk in source:
+        yield chunk if _utils.check_if_df(chunk) else chunk.to_frame()
+
+
+def _iter_parquet(path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError('Surveying Parquet files requires pyarrow.') from e
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+        yield batch.to_pandas()
+
+
+def _iter_npy(path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    array = np.load(path, mmap_mode='r')
+    if array.ndim > 2:
+        raise ValueError(f'Unable to survey NumPy arrays with {array.ndim} dimensions. Expected 1 or 2.')
+    shape, dtype, offset = array.shape, array.dtype, array.offset
+    contiguous_rows = array.flags.c_contiguous
+    del array
+    row_bytes = dtype.itemsize * int(np.prod(shape[1:]))
+    for start in range(0, shape[0], chunksize):
+        n_rows = min(chunksize, shape[0] - start)
+        if contiguous_rows:
+            # only the rows of the chunk are mapped, and unmapped once the chunk is dropped
+            block = np.memmap(
+                path, dtype, mode='r', offset=offset + start * row_bytes, shape=(n_rows, *shape[1:]),
+            )
+        else:
+            block = np.load(path, mmap_mode='r')[start:start + n_rows]
+        # wrapping a plain array in a DataFrame does not copy it
+        yield pd.DataFrame(block)
+
+
+def _iter_arrow_ipc(path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError('Surveying Arrow IPC files requires pyarrow.') from e
+    with pa.memory_map(path) as source:
+        n_batches = pa.ipc.open_file(source).num_record_batches
+    for i in range(n_batches):
+        # each record batch is read from its own map, released once its chunks are dropped
+        with pa.memory_map(path) as source:
+            batch = pa.ipc.open_file(source).get_batch(i)
+        for start in range(0, batch.num_rows, chunksize):
+            # numeric columns without nulls are converted without copying them
+            yield batch.slice(start, chunksize).to_pandas(split_blocks=True)
+
+
+def new_summaries(checks: List[_Check], columns: List[Hashable]) -> Dict[Hashable, ColumnSummary]:
+    """Creates empty summaries tracking the statistics the checks need for each column.
+
+    Args:
+        checks: Parsed checks.
+        columns: All columns of the surveyed data.
+
+    Returns:
+        Dict mapping each column needed by the checks to an empty summary, in column order.
+    """
+    config: Dict[Hashable, Dict[str, Any]] = {}
+    exact_counts = set()
+    for key, needed in plan_stats(checks, columns).items():
+        for column in needed:
+            column_config = config.setdefault(column, {})
+            if key[0] in ('min', 'max'):
+                column_config['track_min_max'] = True
+            elif key[0] == 'mean':
+                column_config['track_sum'] = True
+            elif key[0] in ('nunique', 'mode', 'top'):
+                column_config['track_counts'] = True
+                if key[0] == 'top' and key[2] is not None:
+                    column_config['capacity'] = key[2]
+                else:
+                    exact_counts.add(column)
+            elif key[0] == 'fuzzy_null_count':
+                column_config['fuzzy_nulls'] = key[1]
+                column_config['fuzzy_patterns'] = key[2]
+                column_config['normalize_fuzzy'] = key[3]
+    for column in exact_counts:
+        # bounded counts cannot serve statistics needing the count of every value
+        config[column].pop('capacity', None)
+    return {column: ColumnSummary(**config[column]) for column in columns if column in config}
+
+
+def summaries_to_results(
+        checks: List[_Check],
+        columns: List[Hashable],
+        summaries: Dict[Hashable, ColumnSummary],
+) -> Dict[str, pd.DataFrame]:
+    """Builds the output of each check from column summaries.
+
+    Args:
+        checks: Parsed checks.
+        columns: All columns of the surveyed data.
+        summaries: Summaries of the columns needed by the checks.
+
+    Returns:
+        Dict mapping the qualified name of each check to its output DataFrame.
+    """
+    def get_stat(key: StatKey, selected: List[Hashable]) -> Any:
+        values = [summaries[column].stat(key) for column in selected]
+        if key[0] == 'mode':
+            return tuple(pd.Series(list(part), index=selected) for part in zip(*values))
+        return pd.Series(values, index=selected)
+
+    n_rows = next(iter(summaries.values())).n_rows
+    return build_results(checks, columns, get_stat, n_rows)
+
+
+class StreamingSurvey:
+    """Runs a collection of feature checks over data that is read one chunk at a time.
+
+    Each chunk updates mergeable per-column summaries (null counts, fuzzy null counts,
+    minimums, maximums, sums, and category counts), so peak memory is bounded by the chunk
+    size plus the category counts of the columns that need them. The output of each check is
+    identical to the output of calling the check on the full data.
+
+    With a `cache`, the summary of each chunk is stored so a later survey of the same data only
+    summarizes the chunks that are new or have changed and merges the rest from the cache. Chunks
+    are keyed by a fingerprint of the content of each column, or by partition ID when the source
+    is a mapping of partition IDs to partitions. Cached partitions are not read at all, so a
+    partition ID must change whenever the content of its partition does.
+
+    Args:
+        source: Path of a CSV, Parquet, JSON lines, NumPy (.npy), or Arrow IPC file, an iterable
+            of DataFrames (e.g. the reader returned by `pd.read_csv(..., chunksize=...)` or Parquet
+            row groups), or a mapping of partition IDs to partitions (each a DataFrame, a Series,
+            or a path).
+        checks: Checks to be run, as accepted by `Survey`.
+        chunksize: Number of rows per chunk when reading a file.
+        cache: Cache of chunk summaries reused between surveys (nothing is cached if None).
+        metadata: If True: Parquet files are summarized from the statistics in their footers, and
+            only the row groups of columns those statistics cannot answer are read.
+        **read_kwargs: Additional arguments passed to the pandas reader of a CSV or JSON lines file.
+    """
+
+    def __init__(
+            self,
+            source: Union[Source, Mapping[Hashable, Union[Source, pd.DataFrame, pd.Series]]],
+            checks: List[CheckRequest],
+            chunksize: int = 100_000,
+            cache: Optional[SummaryCache] = None,
+            metadata: bool = False,
+            **read_kwargs,
+    ) -> None:
+        self._source = source
+        self._checks = parse_checks(checks)
+        self._chunksize = chunksize
+        self._cache = cache
+        self._metadata = metadata
+        self._read_kwargs = read_kwargs
+
+    def run(self) -> Dict[str, pd.DataFrame]:
+        """Runs the requested checks.
+
+        Returns:
+            Dict mapping the qualified name of each check to its output DataFrame.
+
+        Raises:
+            ValueError: If the source contains no chunks.
+        """
+        return StreamingSurvey.from_summaries(self.summarize(), self._checks)
+
+    def summarize(self) -> Dict[Hashable, ColumnSummary]:
+        """Summarizes the source without building the output of the checks.
+
+        Summaries of separate partitions of the same data can be combined with `merge_summaries`
+        and turned into the output of the checks with `from_summaries`.
+
+        Returns:
+            Dict mapping each column needed by the checks to its summary, in column order.
+
+        Raises:
+            ValueError: If the source contains no chunks.
+        """
+        summaries = None
+        for partition_id, source in self._partitions():
+            partial = None if partition_id is None else self._cached_partition(partition_id)
+            if partial is None and self._metadata and _parquet_stats.is_parquet(source):
+                partial = _parquet_stats.summarize_footer(os.fspath(source), self._checks, self._chunksize)
+                self._store_partition(partition_id, partial)
+            elif partial is None:
+                partial = self._summarize_partition(self._iter_chunks(source), partition_id)
+            if partial is not None:
+                partials = [partial] if summaries is None else [summaries, partial]
+                summaries = StreamingSurvey.merge_summaries(partials)
+        if summaries is None:
+            raise ValueError('The source did not contain any data to survey.')
+        return summaries
+
+    def _partitions(self) -> Iterator[Tuple[Optional[Hashable], Source]]:
+        # partitions are yielded unread, so partitions served from the cache are never read
+        if isinstance(self._source, Mapping):
+            for partition_id, partition in self._source.items():
+                if isinstance(partition, (pd.DataFrame, pd.Series)):
+                    partition = [partition]
+                yield partition_id, partition
+        elif self._cache is None or (self._metadata and _parquet_stats.is_parquet(self._source)):
+            # without a cache, all chunks update the same summaries (as do footers, which are not cached)
+            yield None, self._source
+        else:
+            for chunk in self._iter_chunks(self._source):
+                yield None, [chunk]
+
+    def _iter_chunks(self, source: Source) -> Iterator[pd.DataFrame]:
+        return iter_chunks(source, self._chunksize, **self._read_kwargs)
+
+    def _summarize_partition(
+            self,
+            chunks: Iterator[pd.DataFrame],
+            partition_id: Optional[Hashable] = None,
+    ) -> Optional[Summaries]:
+        summaries = None
+        for chunk in chunks:
+            columns = list(chunk.columns)
+            if summaries is None:
+                summaries = new_summaries(self._checks, columns)
+            for check in self._checks:
+                subset = chunk.loc[:, check_columns(check, columns)]
+                CHECKS[check.name].validate(subset, check.kwargs)
+            for column, summary in summaries.items():
+                if self._cache is None or partition_id is not None:
+                    summary.update(chunk[column])
+                    continue
+                # chunks of the same content share their summary regardless of the column name
+                key = cache_key(ColumnSummary._version, summary._config(), column_fingerprint(chunk[column]))
+                cached = self._cache.get(key)
+                if cached is None:
+                    self._cache.put(key, summary.update(chunk[column]).to_bytes())
+                else:
+                    summaries[column] = ColumnSummary.from_bytes(cached)
+        self._store_partition(partition_id, summaries)
+        return summaries
+
+    def _store_partition(self, partition_id: Optional[Hashable], summaries: Optional[Summaries]) -> None:
+        if self._cache is not None and partition_id is not None and summaries is not None:
+            state = {column: summary.to_bytes() for column, summary in summaries.items()}
+            self._cache.put(self._partition_key(partition_id), pickle.dumps(state))
+
+    def _cached_partition(self, partition_id: Hashable) -> Optional[Summaries]:
+        if self._cache is None:
+            return None
+        cached = self._cache.get(self._partition_key(partition_id))
+        if cached is None:
+            return None
+        return {column: ColumnSummary.from_bytes(state) for column, state in pickle.loads(cached).items()}
+
+    def _partition_key(self, partition_id: Hashable) -> str:
+        checks = [(check.name, check.columns, sorted(check.kwargs.items())) for check in self._checks]
+        return cache_key(ColumnSummary._version, partition_id, checks)
+
+    @staticmethod
+    def merge_summaries(
+            partials: Iterable[Dict[Hashable, ColumnSummary]],
+    ) -> Dict[Hashable, ColumnSummary]:
+        """Combines the summaries of separate partitions of the same data.
+
+        Args:
+            partials: Summaries of each partition, as returned by `summarize`.
+
+        Returns:
+            Dict mapping each column to the summary of all partitions together.
+
+        Raises:
+            ValueError: If there are no partitions or the partitions do not share the same columns.
+        """
+        merged = None
+        for partial in partials:
+            if merged is None:
+                merged = dict(partial)
+            elif list(partial) != list(merged):
+                raise ValueError('Only summaries of partitions with the same columns can be merged.')
+            else:
+                merged = {column: summary.merge(partial[column]) for column, summary in merged.items()}
+        if merged is None:
+            raise ValueError('At least one partition summary is required.')
+        return merged
+
+    @staticmethod
+    def from_summaries(
+            summaries: Dict[Hashable, ColumnSummary],
+            checks: List[CheckRequest],
+    ) -> Dict[str, pd.DataFrame]:
+        """Builds the output of the checks from column summaries.
+
+        Args:
+            summaries: Summaries of the columns needed by the checks, as returned by `summarize`
+                or `merge_summaries`.
+            checks: Checks to be run, as accepted by `Survey`.
+
+        Returns:
+            Dict mapping the qualified name of each check to its output DataFrame.
+
+        Raises:
+            ValueError: If a check is estimated with a sketch.
+        """
+        checks = [check if isinstance(check, _Check) else parse_check(check) for check in checks]
+        for check in checks:
+            reject_approx(check)
+        return summaries_to_results(checks, list(summaries), summaries)
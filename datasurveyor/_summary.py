@@ -0,0 +1,248 @@
+# standard library imports
+import pickle
+from typing import Any, Hashable, Optional, Tuple
+# third party imports
+import numpy as np
+import pandas as pd
+# local imports
+from datasurveyor import _dtypes, _sketches
+from datasurveyor._fuzzy_nulls import FuzzyNullMatcher
+
+
+class ColumnSummary:
+    """Mergeable accumulator of the statistics behind the feature checks for a single column.
+
+    A summary is updated chunk by chunk (or built per partition and merged), so the checks can
+    be answered without holding the full column in memory. Null and row counts are always
+    tracked; the remaining statistics are tracked only when requested, since value counts in
+    particular grow with the number of distinct values. Summaries can be serialized to bytes,
+    so partitions can be summarized by separate processes or machines and merged afterwards.
+
+    Args:
+        track_min_max: If True: tracks the minimum and maximum non-null values.
+        track_sum: If True: tracks the sum of the non-null values.
+        track_counts: If True: tracks the count of each non-null value.
+        fuzzy_nulls: Values to count as fuzzy nulls (fuzzy nulls are not counted if None).
+        capacity: If set, only the counts of the `capacity` most frequent values are tracked
+            with a Misra-Gries sketch, so only the most frequent values can be listed.
+        fuzzy_patterns: Regex patterns to count as fuzzy nulls.
+        normalize_fuzzy: If True: strings are normalized before being matched as fuzzy nulls.
+    """
+
+    _version = 3
+
+    def __init__(
+            self,
+            track_min_max: bool = False,
+            track_sum: bool = False,
+            track_counts: bool = False,
+            fuzzy_nulls: Optional[Tuple] = None,
+            capacity: Optional[int] = None,
+            fuzzy_patterns: Tuple = (),
+            normalize_fuzzy: bool = False,
+    ) -> None:
+        self.track_min_max = track_min_max
+        self.track_sum = track_sum
+        self.track_counts = track_counts
+        self.fuzzy_nulls = None if fuzzy_nulls is None else tuple(fuzzy_nulls)
+        self.capacity = capacity
+        self.fuzzy_patterns = tuple(fuzzy_patterns)
+        self.normalize_fuzzy = normalize_fuzzy
+        self._matcher = None if fuzzy_nulls is None else FuzzyNullMatcher(
+            self.fuzzy_nulls, self.fuzzy_patterns, normalize_fuzzy,
+        )
+        self.n_rows = 0
+        self.null_count = 0
+        self.fuzzy_null_count = 0
+        self.min = None
+        self.max = None
+        self.sum = 0
+        self.counts = pd.Series(dtype='int64')
+
+    def update(self, data: pd.Series) -> 'ColumnSummary':
+        """Adds a chunk of the column to the summary.
+
+        Args:
+            data: Chunk of the column.
+
+        Returns:
+            The updated summary.
+        """
+        null_count = int(_dtypes.count_nulls(data))
+        fuzzy_null_count = 0 if self._matcher is None else self._matcher.count(data)
+        if null_count == data.shape[0]:
+            return self.add_stats(data.shape[0], null_count, fuzzy_null_count=fuzzy_null_count)
+        return self.add_stats(
+            n_rows=data.shape[0],
+            null_count=null_count,
+            min_=data.min() if self.track_min_max else None,
+            max_=data.max() if self.track_min_max else None,
+            sum_=data.sum() if self.track_sum else 0,
+            counts=_dtypes.value_counts(data) if self.track_counts else None,
+            fuzzy_null_count=fuzzy_null_count,
+        )
+
+    def add_stats(
+            self,
+            n_rows: int,
+            null_count: int,
+            min_: Any = None,
+            max_: Any = None,
+            sum_: Any = 0,
+            counts: Optional[pd.Series] = None,
+            fuzzy_null_count: int = 0,
+    ) -> 'ColumnSummary':
+        """Adds precomputed statistics of a chunk of the column to the summary.
+
+        Chunks held outside pandas (e.g. pyarrow or polars columns) are summarized this way from
+        statistics computed with their own kernels. Statistics the summary does not track are ignored.
+
+        Args:
+            n_rows: Number of rows in the chunk.
+            null_count: Number of nulls in the chunk.
+            min_: Minimum non-null value of the chunk (None if every value is null).
+            max_: Maximum non-null value of the chunk (None if every value is null).
+            sum_: Sum of the non-null values of the chunk.
+            counts: Count of each non-null value of the chunk, indexed by value.
+            fuzzy_null_count: Number of fuzzy nulls in the chunk.
+
+        Returns:
+            The updated summary.
+        """
+        self.n_rows += n_rows
+        self.null_count += null_count
+        self.fuzzy_null_count += fuzzy_null_count
+        if self.track_min_max and min_ is not None:
+            self._update_min_max(min_, max_)
+        if self.track_sum:
+            self.sum += sum_
+        if self.track_counts and counts is not None:
+            self._update_counts(counts)
+        return self
+
+    def merge(self, other: 'ColumnSummary') -> 'ColumnSummary':
+        """Combines two summaries of different parts of the same column.
+
+        Args:
+            other: Summary of another part of the column.
+
+        Returns:
+            New summary equal to the summary of both parts together.
+
+        Raises:
+            ValueError: If the summaries do not track the same statistics.
+        """
+        if self._config() != other._config():
+            raise ValueError('Only summaries tracking the same statistics can be merged.')
+        merged = ColumnSummary(*self._config())
+        for summary in (self, other):
+            merged.n_rows += summary.n_rows
+            merged.null_count += summary.null_count
+            merged.fuzzy_null_count += summary.fuzzy_null_count
+            merged.sum += summary.sum
+            if summary.min is not None:
+                merged._update_min_max(summary.min, summary.max)
+            merged._update_counts(summary.counts)
+        return merged
+
+    def to_bytes(self) -> bytes:
+        """Serializes the summary.
+
+        Returns:
+            The summary as bytes.
+        """
+        state = {
+            'version': self._version,
+            'config': self._config(),
+            'n_rows': self.n_rows,
+            'null_count': self.null_count,
+            'fuzzy_null_count': self.fuzzy_null_count,
+            'min': self.min,
+            'max': self.max,
+            'sum': self.sum,
+            'counts': self.counts,
+        }
+        return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ColumnSummary':
+        """Deserializes a summary created by `to_bytes`.
+
+        Note that deserialization uses pickle, so only summaries from trusted sources should be loaded.
+
+        Args:
+            data: The summary as bytes.
+
+        Returns:
+            The deserialized summary.
+
+        Raises:
+            ValueError: If the bytes were created by an incompatible version of datasurveyor.
+        """
+        state = pickle.loads(data)
+        if state.get('version') != cls._version:
+            raise ValueError('The summary was serialized by an incompatible version of datasurveyor.')
+        summary = cls(*state['config'])
+        for name in ('n_rows', 'null_count', 'fuzzy_null_count', 'min', 'max', 'sum', 'counts'):
+            setattr(summary, name, state[name])
+        return summary
+
+    def stat(self, key: Tuple[Hashable, ...]) -> Any:
+        """Answers a survey statistic from the summary.
+
+        Args:
+            key: Key of the statistic, as used by `Survey`.
+
+        Returns:
+            The value of the statistic for the summarized column.
+
+        Raises:
+            ValueError: If the summary does not track the statistic.
+        """
+        stat = key[0]
+        if stat == 'null_count':
+            return self.null_count
+        if stat in ('min', 'max') and self.track_min_max:
+            return getattr(self, stat)
+        if stat == 'mean' and self.track_sum:
+            n_values = self.n_rows - self.null_count
+            return self.sum / n_values if n_values else np.nan
+        exact_counts = self.track_counts and self.capacity is None
+        if stat == 'nunique' and exact_counts:
+            dropna = key[1]
+            return self.counts.shape[0] + int(not dropna and self.null_count > 0)
+        if stat == 'mode' and exact_counts:
+            return self._mode(dropna=key[1])
+        if stat == 'top' and self.track_counts and (self.capacity is None or key[2] is not None):
+            dropna, k = key[1], key[3]
+            return _sketches.top_counts(self.counts, k, 0 if dropna else self.null_count)
+        fuzzy_config = (self.fuzzy_nulls, self.fuzzy_patterns, self.normalize_fuzzy)
+        if stat == 'fuzzy_null_count' and fuzzy_config == (tuple(key[1]), tuple(key[2]), key[3]):
+            return self.fuzzy_null_count
+        raise ValueError(f'Statistic {key} is not tracked by this summary.')
+
+    def _config(self) -> Tuple[bool, bool, bool, Optional[Tuple], Optional[int], Tuple, bool]:
+        return (
+            self.track_min_max,
+            self.track_sum,
+            self.track_counts,
+            self.fuzzy_nulls,
+            self.capacity,
+            self.fuzzy_patterns,
+            self.normalize_fuzzy,
+        )
+
+    def _update_min_max(self, min_: Any, max_: Any) -> None:
+        self.min = min_ if self.min is None else min(self.min, min_)
+        self.max = max_ if self.max is None else max(self.max, max_)
+
+    def _update_counts(self, counts: pd.Series) -> None:
+        self.counts = _sketches.add_counts(self.counts, counts)
+        if self.capacity is not None:
+            self.counts, _ = _sketches.reduce_counts(self.counts, self.capacity)
+
+    def _mode(self, dropna: bool) -> Tuple[Any, int]:
+        # like the checks, nulls only win the mode outright, and then count 0 since `eq` never matches them
+        if self.counts.empty or (not dropna and self.null_count > self.counts.max()):
+            return np.nan, 0
+        return _sketches.top_counts(self.counts, 1)[0]
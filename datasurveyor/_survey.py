@@ -0,0 +1,474 @@
+# standard library imports
+import inspect
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple, Union
+# third party imports
+import numpy as np
+import pandas as pd
+# local imports
+from datasurveyor import _dtypes, _grouped, _inference, _kernels, _sketches, _utils
+from datasurveyor._binary_features import BinaryFeatures
+from datasurveyor._categorical_features import CategoricalFeatures
+from datasurveyor._fuzzy_nulls import FuzzyNullMatcher
+from datasurveyor._general_features import GeneralFeatures
+from datasurveyor._unique_features import UniqueFeatures
+
+
+CheckRequest = Union[str, Callable, Tuple[Union[str, Callable], Dict[str, Any]]]
+StatKey = Tuple[Hashable, ...]
+
+# statistics computed together by `_kernels.min_max_sum`
+REDUCED_STATS = (('min',), ('max',), ('mean',))
+
+
+class _CheckSpec(NamedTuple):
+    """Describes how a single check is served from shared per-column statistics.
+
+    Attributes:
+        func: Public check the spec mirrors (used for argument binding and defaults).
+        validate: Validates the data (and arguments) before any statistics are computed.
+        stats: Returns the keys of the statistics the check needs given its arguments.
+        build: Builds the check output from the statistics and the number of rows.
+    """
+    func: Callable
+    validate: Callable[[Union[pd.DataFrame, pd.Series], Dict[str, Any]], None]
+    stats: Callable[[Dict[str, Any]], List[StatKey]]
+    build: Callable[[Callable[[StatKey], Any], int, Dict[str, Any]], pd.DataFrame]
+
+
+def _fuzzy_key(kwargs: Dict[str, Any]) -> StatKey:
+    return (
+        'fuzzy_null_count',
+        tuple(GeneralFeatures._fuzzy_null_values(kwargs['add_fuzzy_nulls'])),
+        tuple(kwargs['patterns'] or ()),
+        kwargs['normalize'],
+    )
+
+
+def _build_uniqueness(get: Callable[[StatKey], Any], n_rows: int, kwargs: Dict[str, Any]) -> pd.DataFrame:
+    if np.any(get(('null_count',)) > 0):
+        raise ValueError('Columns with unique data should not contain nulls.')
+    return UniqueFeatures._uniqueness_result(get(('nunique', True)), n_rows)
+
+
+def _categorical_mode_key(kwargs: Dict[str, Any]) -> StatKey:
+    if kwargs['heavy_hitters'] or kwargs['top_k'] is not None:
+        capacity = kwargs['capacity'] if kwargs['heavy_hitters'] else None
+        return ('top', kwargs['dropna'], capacity, kwargs['top_k'] or 1)
+    return ('mode', kwargs['dropna'])
+
+
+def _build_categorical_mostly_same(
+        get: Callable[[StatKey], Any],
+        n_rows: int,
+        kwargs: Dict[str, Any],
+) -> pd.DataFrame:
+    key = _categorical_mode_key(kwargs)
+    if key[0] == 'mode':
+        most_common, count_common = get(key)
+        return CategoricalFeatures._mostly_same_result(most_common, count_common, n_rows, kwargs['thresh'])
+    top = get(key)
+    most_common, count_common = _sketches.leading_category(top)
+    return CategoricalFeatures._mostly_same_result(
+        most_common, count_common, n_rows, kwargs['thresh'], None if kwargs['top_k'] is None else top,
+    )
+
+
+def _validate_thresh_and(validator: Callable) -> Callable:
+    def validate(data: Union[pd.DataFrame, pd.Series], kwargs: Dict[str, Any]) -> None:
+        _utils.validate_thresh(kwargs['thresh'])
+        validator(data)
+    return validate
+
+
+def _no_validation(data: Union[pd.DataFrame, pd.Series], kwargs: Dict[str, Any]) -> None:
+    return
+
+
+CHECKS: Dict[str, _CheckSpec] = {
+    'BinaryFeatures.check_all_same': _CheckSpec(
+        func=BinaryFeatures.check_all_same,
+        validate=lambda data, kwargs: BinaryFeatures._validate_binary_dtype(data),
+        stats=lambda kwargs: [('min',), ('max',)],
+        build=lambda get, n_rows, kwargs: BinaryFeatures._all_same_result(get(('min',)), get(('max',))),
+    ),
+    'BinaryFeatures.check_mostly_same': _CheckSpec(
+        func=BinaryFeatures.check_mostly_same,
+        validate=_validate_thresh_and(BinaryFeatures._validate_binary_dtype),
+        stats=lambda kwargs: [('mean',)],
+        build=lambda get, n_rows, kwargs: BinaryFeatures._mostly_same_result(
+            get(('mean',)), kwargs['thresh'],
+        ),
+    ),
+    'BinaryFeatures.check_outside_range': _CheckSpec(
+        func=BinaryFeatures.check_outside_range,
+        validate=lambda data, kwargs: BinaryFeatures._validate_binary_dtype(data),
+        stats=lambda kwargs: [('min',), ('max',)],
+        build=lambda get, n_rows, kwargs: BinaryFeatures._outside_range_result(
+            get(('min',)), get(('max',)),
+        ),
+    ),
+    'CategoricalFeatures.check_mostly_same': _CheckSpec(
+        func=CategoricalFeatures.check_mostly_same,
+        validate=_validate_thresh_and(CategoricalFeatures._validate_categorical_dtype),
+        stats=lambda kwargs: [_categorical_mode_key(kwargs)],
+        build=_build_categorical_mostly_same,
+    ),
+    'CategoricalFeatures.check_n_categories': _CheckSpec(
+        func=CategoricalFeatures.check_n_categories,
+        validate=lambda data, kwargs: CategoricalFeatures._validate_categorical_dtype(data),
+        stats=lambda kwargs: [('nunique', kwargs['dropna'])],
+        build=lambda get, n_rows, kwargs: CategoricalFeatures._n_categories_result(
+            get(('nunique', kwargs['dropna'])),
+        ),
+    ),
+    'GeneralFeatures.check_nulls': _CheckSpec(
+        func=GeneralFeatures.check_nulls,
+        validate=_no_validation,
+        stats=lambda kwargs: [('null_count',)],
+        build=lambda get, n_rows, kwargs: GeneralFeatures._nulls_result(get(('null_count',)), n_rows),
+    ),
+    'GeneralFeatures.check_fuzzy_nulls': _CheckSpec(
+        func=GeneralFeatures.check_fuzzy_nulls,
+        validate=_no_validation,
+        stats=lambda kwargs: [_fuzzy_key(kwargs)],
+        build=lambda get, n_rows, kwargs: GeneralFeatures._fuzzy_nulls_result(
+            get(_fuzzy_key(kwargs)), n_rows,
+        ),
+    ),
+    'UniqueFeatures.check_uniqueness': _CheckSpec(
+        func=UniqueFeatures.check_uniqueness,
+        validate=lambda data, kwargs: UniqueFeatures._validate_unique_dtype(data),
+        stats=lambda kwargs: [('null_count',), ('nunique', True)],
+        build=_build_uniqueness,
+    ),
+}
+
+
+class _Check(NamedTuple):
+    """A requested check with its arguments bound and defaults applied."""
+    name: str
+    columns: Optional[List[Hashable]]
+    kwargs: Dict[str, Any]
+
+
+def parse_check(request: CheckRequest) -> _Check:
+    """Resolves a check request into the check name, columns, and bound arguments.
+
+    Args:
+        request: A check (e.g. `GeneralFeatures.check_nulls`), its qualified name (e.g.
+        'GeneralFeatures.check_nulls'), or a tuple of either and a dict of arguments. The
+        dict may include a `columns` entry restricting the check to a subset of columns.
+
+    Returns:
+        The parsed check.
+
+    Raises:
+        ValueError: If the check is not one of the supported feature checks or samples rows.
+        TypeError: If the arguments do not match the signature of the check.
+    """
+    kwargs = {}
+    if isinstance(request, tuple):
+        request, kwargs = request
+    name = request if isinstance(request, str) else getattr(request, '__qualname__', repr(request))
+    if name not in CHECKS:
+        raise ValueError(f'Unknown check: {name}. Supported checks are: {", ".join(CHECKS)}.')
+    kwargs = dict(kwargs)
+    columns = kwargs.pop('columns', None)
+    bound = inspect.signature(CHECKS[name].func).bind_partial(**kwargs)
+    bound.apply_defaults()
+    if bound.arguments.get('sample') is not None:
+        raise ValueError(
+            'Sampled checks cannot be surveyed. Call the check directly to estimate it from a sample.'
+        )
+    columns = None if columns is None else list(columns)
+    return _Check(name=name, columns=columns, kwargs=dict(bound.arguments))
+
+
+def reject_approx(check: _Check) -> None:
+    """Rejects a check estimated with a HyperLogLog sketch, since surveys count exactly.
+
+    Args:
+        check: Parsed check.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If the check is estimated with a sketch (`approx` is True).
+    """
+    if check.kwargs.get('approx'):
+        raise ValueError(
+            'Approximate checks cannot be surveyed. Call the check directly to estimate it with a sketch.'
+        )
+
+
+def parse_checks(requests: List[CheckRequest]) -> List[_Check]:
+    """Resolves a list of check requests, rejecting checks requested more than once.
+
+    Args:
+        requests: Check requests as accepted by `parse_check`.
+
+    Returns:
+        The parsed checks in the order requested.
+
+    Raises:
+        ValueError: If a check is requested more than once or is estimated with a sketch.
+    """
+    checks = [parse_check(request) for request in requests]
+    for check in checks:
+        reject_approx(check)
+    names = [check.name for check in checks]
+    if len(set(names)) != len(names):
+        raise ValueError('Each check may only be requested once per survey.')
+    return checks
+
+
+def check_columns(check: _Check, columns: List[Hashable]) -> List[Hashable]:
+    """Resolves the columns a check applies to.
+
+    Args:
+        check: Parsed check.
+        columns: All columns of the surveyed data.
+
+    Returns:
+        The columns requested for the check, or all columns if none were requested.
+    """
+    return columns if check.columns is None else check.columns
+
+
+def plan_stats(checks: List[_Check], columns: List[Hashable]) -> Dict[StatKey, List[Hashable]]:
+    """Works out which statistics the checks need and for which columns.
+
+    Args:
+        checks: Parsed checks.
+        columns: All columns of the surveyed data.
+
+    Returns:
+        Dict mapping the key of each needed statistic to the columns it is needed for.
+    """
+    plan: Dict[StatKey, List[Hashable]] = {}
+    for check in checks:
+        check_cols = check_columns(check, columns)
+        for key in CHECKS[check.name].stats(check.kwargs):
+            needed = plan.setdefault(key, [])
+            needed.extend(column for column in check_cols if column not in needed)
+    return plan
+
+
+def build_results(
+        checks: List[_Check],
+        columns: List[Hashable],
+        get_stat: Callable[[StatKey, List[Hashable]], Any],
+        n_rows: int,
+) -> Dict[str, pd.DataFrame]:
+    """Builds the output of each check from computed statistics.
+
+    Args:
+        checks: Parsed checks.
+        columns: All columns of the surveyed data.
+        get_stat: Returns the value(s) of a statistic for a list of columns.
+        n_rows: Number of rows in the surveyed data.
+
+    Returns:
+        Dict mapping the qualified name of each check to its output DataFrame.
+    """
+    results = {}
+    for check in checks:
+        check_cols = check_columns(check, columns)
+        get = lambda key: get_stat(key, check_cols)  # noqa: E731
+        results[check.name] = CHECKS[check.name].build(get, n_rows, check.kwargs)
+    return results
+
+
+class Survey:
+    """Runs a collection of feature checks while computing each shared statistic once.
+
+    Each check in the four feature classes reduces the data to a handful of per-column
+    statistics (null counts, minimums, maximums, means, counts of unique values, modes,
+    and fuzzy null counts). A survey works out which statistics the requested checks need,
+    computes each of them once over every column that needs it, and builds the output of
+    every check from those shared results.
+
+    Args:
+        data: Data to be surveyed.
+        checks: Checks to be run. Each item is a check (e.g. `GeneralFeatures.check_nulls`),
+            its qualified name (e.g. 'GeneralFeatures.check_nulls'), or a tuple of either and a
+            dict of arguments for the check. The dict may include a `columns` entry restricting
+            the check to a subset of the columns of a DataFrame. Statistics are computed
+            exactly, so checks cannot be estimated with a sketch (`approx`).
+        by: Column(s) of a DataFrame whose values group its rows. If set, every check is run on
+            every group, with each statistic computed for all groups in a single grouped
+            aggregation, and the output of each check has a row per group and column, led by the
+            `by` columns. The `by` columns are not checked, and rows with a null in any of them
+            are dropped. Heavy hitter checks (`heavy_hitters`) are answered exactly, and
+            nulls tied with values for the most common category lose the tie.
+
+    Raises:
+        ValueError: If `by` is set for a Series, names columns the data does not have, or a check
+            is estimated with a sketch.
+    """
+
+    def __init__(
+            self,
+            data: Union[pd.DataFrame, pd.Series],
+            checks: List[CheckRequest],
+            by: Optional[Union[Hashable, List[Hashable]]] = None,
+    ) -> None:
+        self._is_df = _utils.check_if_df(data)
+        self._data = data if self._is_df else data.to_frame()
+        self._checks = parse_checks(checks)
+        self._by = None if by is None else (list(by) if isinstance(by, list) else [by])
+        if self._by is not None:
+            if not self._is_df:
+                raise ValueError('Only the rows of a DataFrame can be grouped by its columns.')
+            missing = [column for column in self._by if column not in self._data.columns]
+            if missing:
+                raise ValueError(f'Columns to group by not found: {missing}.')
+
+    @staticmethod
+    def infer_feature_types(
+            data: Union[pd.DataFrame, pd.Series],
+            sample_size: int = 10_000,
+            max_categories: int = 50,
+            unique_thresh: float = 0.95,
+            seed: Optional[int] = 0,
+    ) -> Dict[Hashable, str]:
+        """Classifies each column as binary, categorical, unique, or general from cheap probes.
+
+        Boolean columns, and integer columns whose values all lie within 0 and 1 (probed on a
+        sample first), are binary. The remaining probes look at a random sample of rows: columns
+        whose sampled values are at least `unique_thresh` distinct and that contain no nulls are
+        unique, and columns with at most `max_categories` sampled distinct values are
+        categorical. Only columns of a dtype the matching feature class accepts are given its
+        type, and any other column is general.
+
+        Args:
+            data: Data whose columns are classified.
+            sample_size: Number of rows sampled by the cardinality probes.
+            max_categories: Maximum number of sampled distinct values of a categorical column.
+            unique_thresh: Minimum proportion of distinct values in the sample of a unique column.
+            seed: Seed of the random number generator drawing the sample.
+
+        Returns:
+            Dict mapping each column to its feature type, in column order.
+
+        Raises:
+            ValueError: If `sample_size` or `max_categories` is not a positive integer, or
+                `unique_thresh` is not between 0.0 and 1.0 (inclusive).
+        """
+        return _inference.infer_feature_types(data, sample_size, max_categories, unique_thresh, seed)
+
+    @classmethod
+    def from_feature_types(
+            cls,
+            data: Union[pd.DataFrame, pd.Series],
+            types: Optional[Dict[Hashable, str]] = None,
+            **infer_kwargs,
+    ) -> 'Survey':
+        """Creates a survey running the checks that match the feature type of each column.
+
+        Binary columns get the checks of `BinaryFeatures`, categorical columns those of
+        `CategoricalFeatures`, and unique columns those of `UniqueFeatures`, while the checks
+        of `GeneralFeatures` run on every column. Columns missing from `types` are classified
+        by `infer_feature_types`, and all checks are then run by a single survey.
+
+        Args:
+            data: Data to be surveyed.
+            types: Dict mapping columns to feature types ('binary', 'categorical', 'unique', or
+                'general'), overriding the inferred types.
+            **infer_kwargs: Additional arguments passed to `infer_feature_types`.
+
+        Returns:
+            The survey.
+
+        Raises:
+            ValueError: If a feature type or an argument of `infer_feature_types` is invalid.
+        """
+        frame = data if _utils.check_if_df(data) else data.to_frame()
+        types = _inference.resolve_feature_types(frame, dict(types or {}), **infer_kwargs)
+        return cls(data, _inference.build_checks(types))
+
+    def run(self) -> Dict[str, pd.DataFrame]:
+        """Runs the requested checks.
+
+        Returns:
+            Dict mapping the qualified name of each check to its output DataFrame, which is
+            identical to the output of calling the check directly.
+        """
+        columns = list(self._data.columns)
+        if self._by is not None:
+            columns = [column for column in columns if column not in self._by]
+        for check in self._checks:
+            check_cols = check_columns(check, columns)
+            if self._by is not None and any(column in self._by for column in check_cols):
+                raise ValueError('Columns to group by cannot be checked.')
+            CHECKS[check.name].validate(self._subset(check_cols), check.kwargs)
+        plan = plan_stats(self._checks, columns)
+        if self._by is not None:
+            return self._run_grouped(plan, columns)
+        stats = self._reduce(plan)
+        stats.update({key: self._compute(key, needed) for key, needed in plan.items() if key not in stats})
+        return build_results(
+            self._checks,
+            columns,
+            lambda key, selected: self._select(stats[key], selected),
+            self._data.shape[0],
+        )
+
+    def _run_grouped(
+            self,
+            plan: Dict[StatKey, List[Hashable]],
+            columns: List[Hashable],
+    ) -> Dict[str, pd.DataFrame]:
+        # each check is built once over every group, from statistics flattened group by group
+        stats, sizes = _grouped.group_stats(self._data, self._by, plan)
+        results = {}
+        for check in self._checks:
+            check_cols = check_columns(check, columns)
+            get = lambda key: _grouped.select_stat(stats[key], check_cols)  # noqa: E731
+            n_rows = _grouped.group_rows(sizes, len(check_cols))
+            result = CHECKS[check.name].build(get, n_rows, check.kwargs)
+            results[check.name] = _grouped.add_group_keys(result, sizes, check_cols)
+        return results
+
+    def _subset(self, columns: List[Hashable]) -> Union[pd.DataFrame, pd.Series]:
+        # validators only read dtypes, so they get columns of no rows rather than a copy of the data
+        empty = self._data.iloc[:0]
+        if self._is_df:
+            return empty.loc[:, columns]
+        return empty.iloc[:, 0]
+
+    def _reduce(self, plan: Dict[StatKey, List[Hashable]]) -> Dict[StatKey, pd.Series]:
+        # minimums, maximums, and means are served by a single scan of the columns needing any of them
+        keys = [key for key in plan if key in REDUCED_STATS]
+        if not keys:
+            return {}
+        needed = set().union(*(plan[key] for key in keys))
+        columns = [column for column in self._data.columns if column in needed]
+        data = self._data if len(columns) == self._data.shape[1] else self._data.loc[:, columns]
+        reduced = _kernels.min_max_sum(data)
+        return {key: getattr(reduced, key[0]) for key in keys}
+
+    def _compute(self, key: StatKey, columns: List[Hashable]) -> Any:
+        data = self._data if columns == list(self._data.columns) else self._data.loc[:, columns]
+        stat = key[0]
+        if stat == 'null_count':
+            return _dtypes.count_nulls(data)
+        if stat == 'nunique':
+            return data.nunique(axis=0, dropna=key[1])
+        if stat == 'mode':
+            # like the checks themselves, a Series ignores nulls when finding its most common value
+            return _dtypes.mode_count(data, dropna=key[1] or not self._is_df)
+        if stat == 'top':
+            return _sketches.top_categories(data, k=key[3], dropna=key[1], capacity=key[2])
+        if stat == 'fuzzy_null_count':
+            return FuzzyNullMatcher(*key[1:]).count(data)
+        raise ValueError(f'Unknown statistic: {stat}.')
+
+    def _select(self, stat: Any, columns: List[Hashable]) -> Any:
+        if isinstance(stat, tuple):
+            return tuple(self._select(part, columns) for part in stat)
+        if not self._is_df:
+            return stat.iloc[0]
+        # statistics shared with other columns may have been upcast to object
+        return stat.loc[columns].infer_objects()
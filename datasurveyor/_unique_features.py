@@ -1,10 +1,13 @@
 # standard library imports
-from typing import Union
+from typing import Any, Callable, Hashable, Iterable, List, Mapping, Optional, Tuple, Union
 # third party imports
-import numpy as np
 import pandas as pd
 # local imports
-from datasurveyor import _utils
+from datasurveyor import _columnar, _dtypes, _parallel, _partitioned, _profiling, _sketches, _utils
+
+
+# standard errors by which an estimated count of duplicates must exceed 0 to flag duplicates
+DUPE_ERRORS = 3.0
 
 
 class UniqueFeatures:
@@ -13,6 +16,9 @@ class UniqueFeatures:
     def _validate_unique_dtype(data: Union[pd.DataFrame, pd.Series]) -> None:
         """Validates that unique data contains only dtype object, int, or datetime.
 
+        Category, string (including string[pyarrow]), nullable or pyarrow backed integer, and
+        timezone aware datetime dtypes are accepted as they are, without conversion.
+
         Args:
             data: Unique data to be validated.
 
@@ -23,51 +29,205 @@ class UniqueFeatures:
             TypeError: If `data` contains dtype other than object, int, or datetime.
         """
         is_df = _utils.check_if_df(data)
-        err_message = 'Unique feature columns should be of type object, int64, or datetime64.'
-        types = (np.dtype('O'), np.dtype(int), np.dtype('datetime64[ns]'))
+        err_message = (
+            'Unique feature columns should be of type object, int64, or datetime64 '
+            '(or another string, category, integer, or datetime dtype).'
+        )
         if is_df:
-            if not data.dtypes.isin(types).all():
+            if not all(_dtypes.has_kind(dtype, _dtypes.UNIQUE_KINDS) for dtype in data.dtypes):
                 raise TypeError(err_message)
         else:
-            if data.dtypes not in types:
+            if not _dtypes.has_kind(data.dtypes, _dtypes.UNIQUE_KINDS):
                 raise TypeError(err_message)
         return
 
     @staticmethod
+    @_profiling.profiled
     def check_uniqueness(
             data: Union[pd.DataFrame, pd.Series],
+            approx: bool = False,
+            precision: int = 14,
+            n_jobs: int = 1,
     ) -> pd.DataFrame:
         """Checks if unique data contains columns with duplicates.
 
         Args:
-            data: Data to be checked for duplicates.
+            data: Data to be checked for duplicates (a pandas, polars, or dask DataFrame or Series,
+                a pyarrow Table or RecordBatch, or a list of pandas partitions).
+            approx: If True: estimates the count(s) of duplicates with a HyperLogLog sketch in
+                constant memory.
+            precision: Precision of the sketch used when `approx` is True (4 to 18), where higher
+                precision uses more memory (2 ** `precision` bytes) and is more accurate.
+            n_jobs: Number of worker processes checking blocks of columns in parallel (-1 uses one per CPU).
 
         Returns:
             DataFrame with bool(s) indicating if data contains duplicates, the count of
-            duplicates present, and the proportion of duplicates.
+            duplicates present, the proportion of duplicates, and the standard error(s) of the
+            count(s) of duplicates if `approx` is True (duplicates are then only flagged when
+            their estimated count exceeds 3 standard errors).
 
         Raises:
             ValueError: If unique data contains nulls.
         """
+        if _columnar.is_columnar(data):
+            return _columnar.run_check(
+                UniqueFeatures.check_uniqueness, data, approx=approx, precision=precision,
+            )
+        if _partitioned.is_partitioned(data):
+            return _partitioned.run_check(
+                UniqueFeatures.check_uniqueness, data, n_jobs, approx=approx, precision=precision,
+            )
         UniqueFeatures._validate_unique_dtype(data)
         is_df = _utils.check_if_df(data)
         err_message = 'Columns with unique data should not contain nulls.'
         if is_df:
             if data.isna().any(axis=None):
                 raise ValueError(err_message)
-            count_dupes = data.nunique(axis=0).subtract(data.shape[0]).multiply(-1)
-            is_dupes = count_dupes.astype(bool)
-            prop_dupes = count_dupes.divide(data.shape[0])
+            if n_jobs != 1:
+                return _parallel.run_in_blocks(
+                    UniqueFeatures.check_uniqueness, data, n_jobs, approx=approx, precision=precision,
+                )
+        elif data.isna().any():
+            raise ValueError(err_message)
+        if approx:
+            n_unique, error = _sketches.approx_nunique(data, precision)
+            return UniqueFeatures._uniqueness_result(n_unique, data.shape[0], error)
+        if is_df:
+            n_unique = data.nunique(axis=0)
         else:
-            if data.isna().any():
-                raise ValueError(err_message)
-            count_dupes = data.shape[0] - data.nunique()
-            is_dupes = bool(count_dupes)
-            prop_dupes = count_dupes / data.shape[0]
+            n_unique = data.nunique()
+        return UniqueFeatures._uniqueness_result(n_unique, data.shape[0])
+
+    @staticmethod
+    @_profiling.profiled
+    def find_duplicates(
+            data: Union[pd.DataFrame, pd.Series],
+            composite: bool = False,
+            n_examples: int = 5,
+    ) -> pd.DataFrame:
+        """Finds duplicates in unique data using 64-bit fingerprints of each value.
+
+        Values are hashed natively by their logical kind (and rows by combining the hashes of
+        their values), so duplicates are found on fingerprints rather than Python objects.
+        Distinct values sharing a fingerprint are vanishingly unlikely, but would be reported as
+        duplicates.
+
+        Args:
+            data: Data to be checked for duplicates (a pandas, polars, or dask DataFrame or Series,
+                a pyarrow Table or RecordBatch, or a list of pandas partitions).
+            composite: If True: checks the columns of a DataFrame together as a single composite key.
+            n_examples: Maximum number of duplicated values to report, and of row positions
+                reported for each of them (at least 2, so a duplicate row is always reported).
+
+        Returns:
+            DataFrame with bool(s) indicating if data contains duplicates, the count of
+            duplicates present, the proportion of duplicates, lists of up to `n_examples`
+            duplicated values (tuples of values for composite keys) in order of first
+            appearance, and lists of the row positions where each of those values appears.
+
+        Raises:
+            ValueError: If unique data contains nulls.
+        """
+        if _columnar.is_columnar(data):
+            return _columnar.find_duplicates(data, composite, n_examples)
+        if _partitioned.is_partitioned(data):
+            return _partitioned.find_duplicates(data, composite, n_examples)
+        UniqueFeatures._validate_unique_dtype(data)
+        is_df = _utils.check_if_df(data)
+        if data.isna().to_numpy().any():
+            raise ValueError('Columns with unique data should not contain nulls.')
+        if is_df and not composite:
+            found = [UniqueFeatures._find_duplicates(data[column], n_examples) for column in data.columns]
+            count_dupes = pd.Series([count for count, _, _ in found], index=data.columns)
+            values = [values for _, values, _ in found]
+            positions = [positions for _, _, positions in found]
+        else:
+            count_dupes, values, positions = UniqueFeatures._find_duplicates(data, n_examples)
+            values, positions = [values], [positions]
+        result = UniqueFeatures._uniqueness_result(data.shape[0] - count_dupes, data.shape[0])
+        result['dupe_values'] = pd.Series(values, dtype=object)
+        result['dupe_positions'] = pd.Series(positions, dtype=object)
+        return result
+
+    @staticmethod
+    @_profiling.profiled
+    def check_many(
+            data: Union[Mapping[Hashable, pd.Series], Iterable[pd.Series]],
+            check: Union[str, Callable],
+            **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Runs a check over many independent Series, building a single output.
+
+        Dtypes are validated once per distinct dtype and the output is built once for all Series,
+        so each Series costs microseconds rather than the milliseconds of checking it directly.
+        Each Series is checked like a column of a DataFrame. Unlike the checks, a list of Series
+        is treated as separate Series rather than as partitions of a single Series.
+
+        Args:
+            data: Series to be checked, as a dict mapping names to Series or an iterable of Series
+                (named after their `name`, or their position if unnamed).
+            check: Check to be run: its name (e.g. 'check_uniqueness') or the check itself.
+            **kwargs: Arguments of the check (other than sampling arguments).
+
+        Returns:
+            DataFrame with a row per Series, as output by the check on a DataFrame with a column
+            per Series.
+        """
+        # imported here, since _batch imports this module
+        from datasurveyor._batch import check_many
+        return check_many(UniqueFeatures, data, check, **kwargs)
+
+    @staticmethod
+    def _find_duplicates(
+            data: Union[pd.DataFrame, pd.Series],
+            n_examples: int,
+    ) -> Tuple[int, List[Any], List[List[int]]]:
+        """Counts duplicates of a column (or composite key) and samples the duplicated values.
+
+        Args:
+            data: Column, or columns checked together as a composite key.
+            n_examples: Maximum number of duplicated values to sample.
+
+        Returns:
+            The count of duplicates, the sampled duplicated values, and their row positions.
+        """
+        count_dupes, positions = _sketches.duplicate_fingerprints(_sketches.fingerprints(data), n_examples)
+        first = [rows[0] for rows in positions]
+        if isinstance(data, pd.DataFrame):
+            values = list(data.iloc[first].itertuples(index=False, name=None))
+        else:
+            values = data.iloc[first].tolist()
+        return count_dupes, values, positions
+
+    @staticmethod
+    def _uniqueness_result(
+            n_unique: Union[pd.Series, int],
+            n_rows: int,
+            error: Optional[Union[pd.Series, float]] = None,
+    ) -> pd.DataFrame:
+        """Builds the check_uniqueness output from precomputed count(s) of unique values.
+
+        Args:
+            n_unique: Count(s) of unique values.
+            n_rows: Number of rows in the unique data.
+            error: Standard error(s) of estimated count(s) of unique values (omitted from the
+                output if None).
+
+        Returns:
+            DataFrame with bool(s) indicating if data contains duplicates (if estimated, only when
+            the count exceeds `DUPE_ERRORS` standard errors), the count of duplicates present,
+            the proportion of duplicates, and the standard error(s) of the count(s) of duplicates
+            if `error` is provided.
+        """
+        count_dupes = n_rows - n_unique
+        extra = {} if error is None else {'dupe_count_error': error}
+        # an estimate within a few standard errors of 0 is consistent with unique data
+        present = count_dupes > 0 if error is None else count_dupes > DUPE_ERRORS * error
         result = _utils.result_to_df(
-            data=is_dupes,
+            data=present,
             title='dupes_present',
             dupe_count=count_dupes,
-            prop_dupe=prop_dupes
+            prop_dupe=count_dupes / n_rows,
+            **extra,
         )
         return result
@@ -0,0 +1,104 @@
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import BinaryFeatures as bf
+from datasurveyor import CategoricalFeatures as cf
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import UniqueFeatures as uf
+
+
+# independent Series of a few rows, suited to each feature class
+binary = {
+    'flag': pd.Series((True, True, False, True, True, True, False)),
+    'lylty': pd.Series((0, 1, 0, 1, 1, 0, 0)),
+    'promo': pd.Series(pd.array((1, None, 0, 1, 1, None, 1), dtype='Int64')),
+}
+categorical = {
+    'state': pd.Series(('WA', 'OR', 'WA', None, None, None, 'OR')),
+    'tier': pd.Series(pd.Categorical(('a', 'b', 'a', 'a', None, 'b', 'b'))),
+}
+general = {
+    'state': pd.Series(('WA', 'Null', 'WA', None, ' null', 'ID', 'OR')),
+    'spend': pd.Series((0.0, np.nan, 10.0, 150.0, 12.0, 0.0, np.nan)),
+}
+
+
+def test_check_many_matches_frame():
+    # verifies that checking many Series matches checking a DataFrame with a column per Series
+    frame = pd.DataFrame(binary)
+    assert bf.check_many(binary, 'check_all_same').equals(bf.check_all_same(frame))
+    result = bf.check_many(binary, bf.check_mostly_same, thresh=0.6)
+    assert result.equals(bf.check_mostly_same(frame, thresh=0.6))
+    frame = pd.DataFrame(categorical)
+    result = cf.check_many(categorical, 'check_mostly_same', thresh=0.3, top_k=2)
+    assert result.equals(cf.check_mostly_same(frame, thresh=0.3, top_k=2))
+    assert cf.check_many(categorical, 'check_n_categories').equals(cf.check_n_categories(frame))
+    frame = pd.DataFrame(general)
+    assert gf.check_many(general, 'check_nulls').equals(gf.check_nulls(frame))
+    result = gf.check_many(general, 'check_fuzzy_nulls', normalize=True)
+    assert result.equals(gf.check_fuzzy_nulls(frame, normalize=True))
+
+
+def test_check_many_lengths():
+    # verifies that Series of different lengths are checked against their own number of rows
+    series = [pd.Series((1, 2, 3), name='id'), pd.Series(('a', 'a')), pd.Series([], dtype='int64')]
+    result = uf.check_many(series, 'check_uniqueness')
+    assert result['column'].tolist() == ['id', 1, 2]
+    assert result['dupe_count'].tolist() == [0, 1, 0]
+    assert result['prop_dupe'].iloc[:2].tolist() == [0.0, 0.5]
+
+
+def test_check_many_validates_dtype():
+    # checks that TypeError is raised when a Series has a dtype the check does not accept
+    with pytest.raises(TypeError) as excinfo:
+        bf.check_many(general, 'check_all_same')
+    # verifies TypeError contains appropriate message
+    assert 'should be of type bool or int64' in str(excinfo.value)
+
+
+def test_check_many_other_class():
+    # checks that ValueError is raised for checks of another feature class
+    with pytest.raises(ValueError) as excinfo:
+        bf.check_many(binary, gf.check_nulls)
+    # verifies ValueError contains appropriate message
+    assert 'is not a check of BinaryFeatures' in str(excinfo.value)
+
+
+def test_check_many_approx():
+    # checks that ValueError is raised for checks estimated with a sketch
+    with pytest.raises(ValueError) as excinfo:
+        cf.check_many(categorical, 'check_n_categories', approx=True, precision=10)
+    # verifies ValueError contains appropriate message
+    assert 'Approximate checks cannot be run' in str(excinfo.value)
+
+
+def test_check_many_frame():
+    # checks that TypeError is raised when a DataFrame is passed instead of many Series
+    with pytest.raises(TypeError) as excinfo:
+        gf.check_many(pd.DataFrame(general), 'check_nulls')
+    # verifies TypeError contains appropriate message
+    assert 'dict or an iterable of pandas Series' in str(excinfo.value)
+
+
+def test_check_many_shared_dtypes():
+    # verifies that Series sharing a dtype, which are computed together, match checking each alone
+    strings = [pd.Series(('b', 'a', 'b', 'a', None)), pd.Series((None, None, 'null', 'x')),
+               pd.Series(('N/A', 'c')), pd.Series([], dtype=object)]
+    numbers = [pd.Series((1, 2, 2)), pd.Series((3, 4)), pd.Series((5, 5, 5, 6))]
+    flags = [pd.Series((0, 1, 1)), pd.Series((0, 0)), pd.Series((1, 1, 1, 0))]
+    for feature_class, series, check, kwargs in (
+            (gf, strings, 'check_nulls', {}),
+            (gf, strings, 'check_fuzzy_nulls', {'normalize': True}),
+            (cf, strings, 'check_n_categories', {'dropna': False}),
+            (cf, strings, 'check_mostly_same', {'thresh': 0.3}),
+            (cf, strings, 'check_mostly_same', {'thresh': 0.3, 'dropna': True, 'top_k': 2}),
+            (uf, numbers, 'check_uniqueness', {}),
+            (bf, flags, 'check_mostly_same', {'thresh': 0.5}),
+            (bf, flags, 'check_all_same', {}),
+    ):
+        result = feature_class.check_many(series, check, **kwargs)
+        alone = [feature_class.check_many([column], check, **kwargs) for column in series]
+        alone = pd.concat(alone).assign(column=range(len(series))).reset_index(drop=True)
+        assert result.reset_index(drop=True).equals(alone)
@@ -0,0 +1,156 @@
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import CategoricalFeatures as cf
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import StreamingSurvey
+from datasurveyor import SummaryCache
+from datasurveyor import Survey
+from datasurveyor._cache import column_fingerprint
+
+
+# data split into partitions of three rows
+data = pd.DataFrame.from_dict({
+    'flag': (True, True, False, True, True, True, False, True, False),
+    'state': ('WA', 'OR', 'WA', 'Null', 'WA', 'ID', 'OR', 'WA', None),
+    'spend': (0.0, np.nan, 10.0, 150.0, 12.0, 0.0, np.nan, 3.0, 4.0),
+})
+
+checks = [
+    gf.check_nulls,
+    (gf.check_fuzzy_nulls, {'add_fuzzy_nulls': ['OR']}),
+    (cf.check_mostly_same, {'columns': ['state'], 'thresh': 0.4}),
+    (cf.check_n_categories, {'columns': ['state']}),
+]
+
+
+def partitions(df):
+    # splits a DataFrame into partitions of three rows
+    return [df.iloc[i:i + 3] for i in range(0, df.shape[0], 3)]
+
+
+def assert_results_equal(left, right):
+    # verifies two survey outputs contain identical frames
+    assert list(left) == list(right)
+    for name in left:
+        assert left[name].equals(right[name]), name
+
+
+def test_cache_get_put():
+    # verifies that stored entries are returned and hits and misses are counted
+    cache = SummaryCache()
+    assert cache.get('a') is None
+    cache.put('a', b'abc')
+    assert cache.get('a') == b'abc'
+    assert 'a' in cache
+    assert (len(cache), cache.n_bytes, cache.hits, cache.misses) == (1, 3, 1, 1)
+
+
+def test_cache_lru_eviction():
+    # verifies that the least recently used entries are evicted beyond max_bytes
+    cache = SummaryCache(max_bytes=6)
+    cache.put('a', b'aa')
+    cache.put('b', b'bb')
+    cache.get('a')
+    cache.put('c', b'cc')
+    cache.put('d', b'dd')
+    assert 'b' not in cache
+    assert ['a', 'c', 'd'] == [key for key in ('a', 'b', 'c', 'd') if key in cache]
+    assert cache.n_bytes == 6
+
+
+def test_cache_skips_oversized_entries():
+    # verifies that entries larger than max_bytes are not stored
+    cache = SummaryCache(max_bytes=2)
+    cache.put('a', b'abc')
+    assert len(cache) == 0
+
+
+def test_cache_disk(tmp_path):
+    # verifies that entries on disk persist between caches and are evicted in LRU order
+    cache = SummaryCache(max_bytes=6, directory=tmp_path)
+    cache.put('a', b'aa')
+    cache.put('b', b'bb')
+    cache.put('c', b'cc')
+    reopened = SummaryCache(max_bytes=4, directory=tmp_path)
+    assert 'a' not in reopened
+    assert reopened.get('c') == b'cc'
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['b.summary', 'c.summary']
+
+
+def test_cache_clear(tmp_path):
+    # verifies that clearing removes every entry from disk
+    cache = SummaryCache(directory=tmp_path)
+    cache.put('a', b'aa')
+    cache.clear()
+    assert (len(cache), cache.n_bytes) == (0, 0)
+    assert not list(tmp_path.iterdir())
+
+
+def test_cache_bad_max_bytes():
+    # verifies that a non-positive max_bytes raises a ValueError
+    with pytest.raises(ValueError) as excinfo:
+        SummaryCache(max_bytes=0)
+    assert 'max_bytes parameter' in str(excinfo.value)
+
+
+def test_column_fingerprint():
+    # verifies that fingerprints depend on the content and dtype of columns only
+    state = data['state']
+    assert column_fingerprint(state) == column_fingerprint(state.rename('other').reset_index(drop=True))
+    assert column_fingerprint(state) != column_fingerprint(state.replace('ID', 'MT'))
+    assert column_fingerprint(data['spend']) != column_fingerprint(data['spend'].astype('float32'))
+    # values that compare equal but differ in type (or nulls of different kinds) change the fingerprint
+    values = (1, 1.0, True, '1', None, np.nan)
+    mixed = [column_fingerprint(pd.Series((value, 'a'), dtype=object)) for value in values]
+    assert len(set(mixed)) == len(mixed)
+
+
+def test_incremental_survey_matches_survey():
+    # verifies that surveys served from the cache match surveying the full data
+    cache = SummaryCache()
+    expected = Survey(data, checks).run()
+    assert_results_equal(StreamingSurvey(partitions(data), checks, cache=cache).run(), expected)
+    assert cache.hits == 0
+    assert_results_equal(StreamingSurvey(partitions(data), checks, cache=cache).run(), expected)
+    assert cache.misses == cache.hits
+
+
+def test_incremental_survey_changed_chunk():
+    # verifies that only the column chunks that changed are summarized again
+    cache = SummaryCache()
+    StreamingSurvey(partitions(data), checks, cache=cache).run()
+    changed = data.copy()
+    changed.loc[4, 'state'] = 'MT'
+    misses = cache.misses
+    result = StreamingSurvey(partitions(changed), checks, cache=cache).run()
+    assert cache.misses - misses == 1
+    assert_results_equal(result, Survey(changed, checks).run())
+
+
+def test_incremental_survey_partition_ids(tmp_path):
+    # verifies that cached partitions are merged without being read again
+    cache = SummaryCache(directory=tmp_path / 'cache')
+    source = {}
+    for i, partition in enumerate(partitions(data)):
+        source[f'part-{i}'] = tmp_path / f'part-{i}.csv'
+        partition.to_csv(source[f'part-{i}'], index=False)
+    expected = StreamingSurvey(source, checks, cache=cache).run()
+    for path in source.values():
+        path.unlink()
+    reopened = SummaryCache(directory=tmp_path / 'cache')
+    result = StreamingSurvey(source, checks, cache=reopened).run()
+    assert_results_equal(result, expected)
+    assert reopened.hits == 3
+
+
+def test_incremental_survey_new_partition():
+    # verifies that a new partition is summarized and merged with the cached ones
+    cache = SummaryCache()
+    parts = dict(enumerate(partitions(data)))
+    StreamingSurvey({0: parts[0], 1: parts[1]}, checks, cache=cache).run()
+    result = StreamingSurvey(parts, checks, cache=cache).run()
+    assert (cache.hits, cache.misses) == (2, 3)
+    assert_results_equal(result, Survey(data, checks).run())
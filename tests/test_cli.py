@@ -0,0 +1,165 @@
+# standard library imports
+import json
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import BinaryFeatures as bf
+from datasurveyor import CategoricalFeatures as cf
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import UniqueFeatures as uf
+from datasurveyor._cli import expand_paths, main, parse_types
+
+
+# mixed data with a column suited to each feature type
+data = pd.DataFrame.from_dict({
+    'id': (1, 2, 3, 4, 5, 6, 7),
+    'lylty': (0, 1, 0, 1, 1, 0, 0),
+    'state': ('WA', 'OR', 'WA', 'Null', 'WA', 'ID', 'OR'),
+    'spend': (0.0, np.nan, 10.0, 150.0, 12.0, 0.0, np.nan),
+})
+
+types = ['-t', 'id=unique', '-t', 'lylty=binary', '-t', 'state=categorical', '-t', 'spend=general']
+
+
+def write_files(tmp_path):
+    # writes the data and its first rows as CSV files
+    data.to_csv(tmp_path / 'a.csv', index=False)
+    data.iloc[:4].to_csv(tmp_path / 'b.csv', index=False)
+    return [str(tmp_path / 'a.csv'), str(tmp_path / 'b.csv')]
+
+
+def test_parse_types(tmp_path):
+    # verifies that column types are read from pairs and a JSON file, with pairs taking precedence
+    path = tmp_path / 'types.json'
+    path.write_text(json.dumps({'id': 'unique', 'state': 'general'}))
+    result = parse_types(['state=categorical', 'a=b=binary'], str(path))
+    assert result == {'id': 'unique', 'state': 'categorical', 'a=b': 'binary'}
+
+
+def test_parse_types_bad_type():
+    # verifies that unknown feature types raise a ValueError
+    with pytest.raises(ValueError) as excinfo:
+        parse_types(['id=ordinal'])
+    assert 'Unknown feature type' in str(excinfo.value)
+
+
+def test_parse_types_bad_pair():
+    # verifies that pairs without a column raise a ValueError
+    with pytest.raises(ValueError) as excinfo:
+        parse_types(['unique'])
+    assert 'Expected COLUMN=TYPE' in str(excinfo.value)
+
+
+def test_expand_paths(tmp_path):
+    # verifies that globs are expanded in order without duplicates
+    paths = write_files(tmp_path)
+    assert expand_paths([str(tmp_path / '*.csv'), paths[0]]) == paths
+
+
+def test_expand_paths_no_match(tmp_path):
+    # verifies that patterns matching no files raise a FileNotFoundError
+    with pytest.raises(FileNotFoundError) as excinfo:
+        expand_paths([str(tmp_path / '*.parquet')])
+    assert 'No files match' in str(excinfo.value)
+
+
+def test_main_json(tmp_path):
+    # verifies that the JSON report matches calling the checks directly
+    paths = write_files(tmp_path)
+    output = tmp_path / 'report.json'
+    assert main([str(tmp_path / '*.csv'), *types, '-o', str(output)]) == 0
+    report = json.loads(output.read_text())
+    assert [entry['path'] for entry in report] == paths
+    results = report[0]['results']
+    assert results['BinaryFeatures.check_mostly_same'][0]['mean'] == pytest.approx(3 / 7)
+    assert results['CategoricalFeatures.check_mostly_same'][0]['most_common'] == 'WA'
+    assert results['UniqueFeatures.check_uniqueness'][0]['dupes_present'] is False
+    nulls = gf.check_nulls(data)
+    null_counts = [row['null_count'] for row in results['GeneralFeatures.check_nulls']]
+    assert null_counts == nulls['null_count'].tolist()
+    assert report[1]['results']['CategoricalFeatures.check_n_categories'][0]['n_categories'] == 3
+
+
+def test_main_json_stdout(tmp_path, capsys):
+    # verifies that JSON reports are printed without an output path
+    paths = write_files(tmp_path)
+    assert main([paths[0]]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert list(report[0]['results']) == ['GeneralFeatures.check_nulls', 'GeneralFeatures.check_fuzzy_nulls']
+
+
+def test_main_partial_types(tmp_path):
+    # verifies that general checks run on every column when only some columns are typed
+    paths = write_files(tmp_path)
+    output = tmp_path / 'report.json'
+    assert main([paths[0], '-t', 'lylty=binary', '-o', str(output)]) == 0
+    results = json.loads(output.read_text())[0]['results']
+    assert [row['column'] for row in results['GeneralFeatures.check_nulls']] == list(data.columns)
+    assert [row['column'] for row in results['BinaryFeatures.check_all_same']] == ['lylty']
+
+
+def test_main_infer(tmp_path):
+    # verifies that columns without a type are given the checks of their inferred type
+    paths = write_files(tmp_path)
+    output = tmp_path / 'report.json'
+    assert main([paths[0], '-t', 'lylty=categorical', '--infer', '-o', str(output)]) == 0
+    results = json.loads(output.read_text())[0]['results']
+    assert results['UniqueFeatures.check_uniqueness'][0]['column'] == 'id'
+    assert [row['column'] for row in results['CategoricalFeatures.check_n_categories']] == ['lylty', 'state']
+    assert 'BinaryFeatures.check_all_same' not in results
+    assert len(results['GeneralFeatures.check_nulls']) == 4
+
+
+def test_main_parquet_workers(tmp_path):
+    # verifies that a Parquet report from several workers holds a row per file, check, and column
+    pytest.importorskip('pyarrow')
+    paths = write_files(tmp_path)
+    output = tmp_path / 'report.parquet'
+    assert main([*paths, *types, '-o', str(output), '--workers', '2']) == 0
+    report = pd.read_parquet(output)
+    assert report['path'].unique().tolist() == paths
+    assert report.shape[0] == 2 * 14
+    row = report[(report['check'] == 'BinaryFeatures.check_all_same') & (report['path'] == paths[0])]
+    assert not row['all_same'].iloc[0]
+    assert str(report['dupe_count'].dtype) == 'Int64'
+    expected = bf.check_outside_range(data['lylty'])['outside_range'].iloc[0]
+    assert report['outside_range'].dropna().iloc[0] == expected
+    assert report['n_categories'].dropna().tolist() == [
+        cf.check_n_categories(data['state'])['n_categories'].iloc[0],
+        cf.check_n_categories(data['state'].iloc[:4])['n_categories'].iloc[0],
+    ]
+    prop_dupe = uf.check_uniqueness(data['id'])['prop_dupe'].iloc[0]
+    assert report['prop_dupe'].dropna().tolist() == [prop_dupe] * 2
+
+
+def test_main_metadata(tmp_path):
+    # verifies that surveying Parquet files from their footers gives the same report
+    pytest.importorskip('pyarrow')
+    paths = [str(tmp_path / 'a.parquet'), str(tmp_path / 'b.parquet')]
+    data.to_parquet(paths[0], index=False)
+    data.iloc[:4].to_parquet(paths[1], index=False)
+    assert main([*paths, *types, '-o', str(tmp_path / 'scan.json')]) == 0
+    assert main([*paths, *types, '--metadata', '--infer', '-o', str(tmp_path / 'footer.json')]) == 0
+    assert (tmp_path / 'footer.json').read_text() == (tmp_path / 'scan.json').read_text()
+
+
+def test_main_failed_file(tmp_path, capsys):
+    # verifies that files which cannot be surveyed are reported and fail the exit status
+    paths = write_files(tmp_path)
+    pd.DataFrame({'other': [1, 2]}).to_csv(tmp_path / 'c.csv', index=False)
+    output = tmp_path / 'report.json'
+    assert main([str(tmp_path / '*.csv'), *types, '-o', str(output)]) == 1
+    report = json.loads(output.read_text())
+    assert [entry['path'] for entry in report[:2]] == paths
+    assert 'KeyError' in report[2]['error']
+    assert 'unable to survey' in capsys.readouterr().err
+
+
+def test_main_bad_arguments(tmp_path, capsys):
+    # verifies that invalid arguments exit with a usage error
+    with pytest.raises(SystemExit) as excinfo:
+        main([str(tmp_path / 'missing.csv')])
+    assert excinfo.value.code == 2
+    assert 'No files match' in capsys.readouterr().err
@@ -0,0 +1,135 @@
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import BinaryFeatures as bf
+from datasurveyor import CategoricalFeatures as cf
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import UniqueFeatures as uf
+from datasurveyor._columnar import _fingerprints, count_fuzzy_nulls, is_columnar, value_counts
+from datasurveyor._fuzzy_nulls import FuzzyNullMatcher
+
+
+# mixed data with a column suited to each feature type
+data = pd.DataFrame.from_dict({
+    'flag': (0, 1, 1, 1, 0, 1, 1, 1, 1),
+    'lylty': (True, False, True, True, True, True, True, True, True),
+    'state': ('WA', 'OR', 'WA', 'Null', None, 'WA', 'ID', 'OR', 'WA'),
+    'id': (1, 2, 3, 4, 5, 2, 7, 8, 1),
+    'name': ('a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'a'),
+    'spend': (0.0, np.nan, 10.0, 150.0, 12.0, 0.0, np.nan, 3.0, 4.0),
+})
+
+
+def test_is_columnar():
+    # verifies that pyarrow tables and polars frames are columnar, but pandas frames are not
+    pa = pytest.importorskip('pyarrow')
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    assert is_columnar(table)
+    assert is_columnar(table.to_batches()[0])
+    assert not is_columnar(data)
+    assert not is_columnar(table.column('id'))
+
+
+def test_value_counts_arrow():
+    # verifies that nulls are dropped from the counts of distinct values
+    pa = pytest.importorskip('pyarrow')
+    counts = value_counts(pa.chunked_array([['WA', None], ['WA', 'OR']]))
+    assert counts.sort_index().to_dict() == {'OR': 1, 'WA': 2}
+
+
+def test_count_fuzzy_nulls():
+    # verifies that fuzzy nulls are counted from the counts of distinct values and the nulls
+    counts = pd.Series([3, 2, 1], index=['WA', 'null', ' NA '])
+    assert count_fuzzy_nulls(FuzzyNullMatcher(['null']), counts, 4) == 2
+    assert count_fuzzy_nulls(FuzzyNullMatcher(['null', None], ['na'], normalize=True), counts, 4) == 7
+
+
+def test_binary_checks_arrow():
+    # verifies that binary checks on a pyarrow Table match checking the pandas DataFrame
+    pa = pytest.importorskip('pyarrow')
+    binary = data[['flag', 'lylty']]
+    table = pa.Table.from_pandas(binary, preserve_index=False)
+    assert bf.check_all_same(table).equals(bf.check_all_same(binary))
+    assert bf.check_mostly_same(table, thresh=0.7).equals(bf.check_mostly_same(binary, thresh=0.7))
+    assert bf.check_outside_range(table.to_batches()[0]).equals(bf.check_outside_range(binary))
+
+
+def test_categorical_checks_arrow():
+    # verifies that categorical checks on a pyarrow Table match checking the pandas DataFrame
+    pa = pytest.importorskip('pyarrow')
+    categorical = data[['state', 'id']]
+    table = pa.Table.from_pandas(categorical, preserve_index=False)
+    assert cf.check_mostly_same(table, thresh=0.3).equals(cf.check_mostly_same(categorical, thresh=0.3))
+    assert cf.check_mostly_same(table, top_k=2, dropna=True).equals(
+        cf.check_mostly_same(categorical, top_k=2, dropna=True)
+    )
+    assert cf.check_n_categories(table).equals(cf.check_n_categories(categorical))
+    assert cf.check_n_categories(table, dropna=True, approx=True).equals(
+        cf.check_n_categories(categorical, dropna=True, approx=True)
+    )
+
+
+def test_general_checks_arrow():
+    # verifies that general checks on a pyarrow Table match checking the pandas DataFrame
+    pa = pytest.importorskip('pyarrow')
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    assert gf.check_nulls(table).equals(gf.check_nulls(data))
+    assert gf.check_fuzzy_nulls(table, patterns=['o.'], normalize=True).equals(
+        gf.check_fuzzy_nulls(data, patterns=['o.'], normalize=True)
+    )
+
+
+def test_unique_checks_arrow():
+    # verifies that duplicates in a pyarrow Table are counted and located like in pandas
+    pa = pytest.importorskip('pyarrow')
+    unique = data[['id', 'name']]
+    table = pa.Table.from_pandas(unique, preserve_index=False)
+    assert uf.check_uniqueness(table).equals(uf.check_uniqueness(unique))
+    assert uf.find_duplicates(table).equals(uf.find_duplicates(unique))
+    assert uf.find_duplicates(table, composite=True).equals(uf.find_duplicates(unique, composite=True))
+
+
+def test_composite_fingerprints_arrow():
+    # verifies that composite pyarrow keys are encoded exactly, equal only for equal rows
+    pa = pytest.importorskip('pyarrow')
+    table = pa.table({'a': [1, 1, 2, 2, 1], 'b': ['x', 'y', 'x', 'x', 'x']})
+    assert _fingerprints(table).tolist() == [0, 1, 2, 2, 0]
+    assert _fingerprints(table.slice(0, 0)).tolist() == []
+
+def test_checks_polars(monkeypatch):
+    # verifies that checks on polars data match pandas without converting the data to pandas
+    pl = pytest.importorskip('polars')
+    frame = pl.from_pandas(data)
+    monkeypatch.setattr(pl.DataFrame, 'to_pandas', None)
+    monkeypatch.setattr(pl.Series, 'to_pandas', None)
+    assert bf.check_mostly_same(frame.select('flag', 'lylty')).equals(
+        bf.check_mostly_same(data[['flag', 'lylty']])
+    )
+    assert cf.check_mostly_same(frame.get_column('state'), thresh=0.3).equals(
+        cf.check_mostly_same(data['state'], thresh=0.3)
+    )
+    assert cf.check_n_categories(frame.select('state')).equals(cf.check_n_categories(data[['state']]))
+    assert gf.check_fuzzy_nulls(frame, add_fuzzy_nulls=['OR']).equals(
+        gf.check_fuzzy_nulls(data, add_fuzzy_nulls=['OR'])
+    )
+    assert uf.check_uniqueness(frame.get_column('id'), approx=True).equals(
+        uf.check_uniqueness(data['id'], approx=True)
+    )
+    assert uf.find_duplicates(frame.get_column('name')).equals(uf.find_duplicates(data['name']))
+
+
+def test_columnar_errors():
+    # verifies that columnar data is validated like pandas data
+    pa = pytest.importorskip('pyarrow')
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    with pytest.raises(TypeError) as excinfo:
+        bf.check_all_same(table.select(['state']))
+    assert 'Binary feature columns' in str(excinfo.value)
+    with pytest.raises(ValueError) as excinfo:
+        uf.find_duplicates(table.select(['state']))
+    assert 'should not contain nulls' in str(excinfo.value)
+    with pytest.raises(ValueError) as excinfo:
+        gf.check_nulls(table, sample=5)
+    assert 'require a pandas DataFrame' in str(excinfo.value)
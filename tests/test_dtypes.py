@@ -0,0 +1,104 @@
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import BinaryFeatures as bf
+from datasurveyor import CategoricalFeatures as cf
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import StreamingSurvey
+from datasurveyor import Survey
+from datasurveyor import UniqueFeatures as uf
+from datasurveyor import _dtypes
+
+
+# binary data as numpy dtypes and as nullable or narrower dtypes
+binary = pd.DataFrame.from_dict({
+    'b1': (True, False, True, True, True, True),
+    'b2': (0, 1, 1, 1, 1, 1),
+})
+binary_ext = binary.astype({'b1': 'boolean', 'b2': 'Int64'})
+binary_narrow = binary.astype({'b2': 'int32'})
+
+# categorical data as numpy dtypes and as category or nullable dtypes
+categorical = pd.DataFrame.from_dict({
+    'c1': ('a', 'b', 'a', np.nan, 'c', 'a'),
+    'c2': (1, 2, 2, 3, 3, 3),
+})
+categorical_ext = categorical.astype({'c1': 'category', 'c2': 'Int64'})
+
+# unique data as numpy dtypes and as nullable or narrower dtypes
+unique = pd.DataFrame.from_dict({
+    'u1': ('a', 'b', 'c', 'd', 'e', 'e'),
+    'u2': (5, 4, 3, 2, 1, 0),
+})
+unique_ext = unique.astype({'u1': 'category', 'u2': 'uint8'})
+
+
+def test_binary_extension_dtypes():
+    # verifies that binary checks on nullable and narrow dtypes match checks on numpy dtypes
+    for data in (binary_ext, binary_narrow):
+        assert bf.check_all_same(data).equals(bf.check_all_same(binary))
+        assert bf.check_mostly_same(data, thresh=0.8).equals(bf.check_mostly_same(binary, thresh=0.8))
+        assert bf.check_outside_range(data).equals(bf.check_outside_range(binary))
+
+
+def test_categorical_extension_dtypes():
+    # verifies that categorical checks on category and nullable dtypes match checks on numpy dtypes
+    for dropna in (True, False):
+        expected = cf.check_mostly_same(categorical, thresh=0.4, dropna=dropna)
+        assert cf.check_mostly_same(categorical_ext, thresh=0.4, dropna=dropna).equals(expected)
+        expected = cf.check_n_categories(categorical, dropna=dropna)
+        assert cf.check_n_categories(categorical_ext, dropna=dropna).equals(expected)
+        expected = cf.check_mostly_same(categorical, thresh=0.4, dropna=dropna, top_k=2)
+        assert cf.check_mostly_same(categorical_ext, thresh=0.4, dropna=dropna, top_k=2).equals(expected)
+
+
+def test_categorical_unobserved_categories():
+    # verifies that categories without any rows are not counted
+    data = categorical_ext['c1'].cat.add_categories(['z'])
+    assert cf.check_n_categories(data, dropna=True).loc[0, 'n_categories'] == 3
+    assert _dtypes.value_counts(data).sort_index().to_dict() == {'a': 3, 'b': 1, 'c': 1}
+
+
+def test_unique_extension_dtypes():
+    # verifies that uniqueness checks on category and narrow dtypes match checks on numpy dtypes
+    assert uf.check_uniqueness(unique_ext).equals(uf.check_uniqueness(unique))
+    assert uf.find_duplicates(unique_ext).equals(uf.find_duplicates(unique))
+    assert uf.find_duplicates(unique_ext, composite=True).equals(uf.find_duplicates(unique, composite=True))
+
+
+def test_nulls_extension_dtypes():
+    # verifies that null checks on extension dtypes match checks on numpy dtypes
+    assert gf.check_nulls(categorical_ext).equals(gf.check_nulls(categorical))
+    assert gf.check_fuzzy_nulls(categorical_ext).equals(gf.check_fuzzy_nulls(categorical))
+
+
+def test_survey_extension_dtypes():
+    # verifies that surveys of extension dtypes match surveys of numpy dtypes
+    checks = [(cf.check_mostly_same, {'thresh': 0.4}), cf.check_n_categories, gf.check_nulls]
+    expected = Survey(categorical, checks).run()
+    chunks = [categorical_ext.iloc[:3], categorical_ext.iloc[3:]]
+    for results in (Survey(categorical_ext, checks).run(), StreamingSurvey(chunks, checks).run()):
+        for name in expected:
+            assert results[name].equals(expected[name]), name
+
+
+def test_arrow_dtypes():
+    # verifies that checks on pyarrow backed dtypes match checks on numpy dtypes
+    pytest.importorskip('pyarrow')
+    data = categorical.astype({'c1': 'string[pyarrow]'})
+    assert _dtypes.is_arrow(data['c1'].dtype)
+    assert gf.check_nulls(data).equals(gf.check_nulls(categorical))
+    assert cf.check_mostly_same(data, thresh=0.4).equals(cf.check_mostly_same(categorical, thresh=0.4))
+    assert cf.check_n_categories(data).equals(cf.check_n_categories(categorical))
+    ids = unique.astype({'u1': 'string[pyarrow]'})
+    assert uf.find_duplicates(ids).equals(uf.find_duplicates(unique))
+
+
+def test_extension_dtype_validation():
+    # checks that TypeError is raised for float extension dtypes
+    with pytest.raises(TypeError) as excinfo:
+        bf.check_all_same(binary.astype('Float64'))
+    # verifies TypeError contains appropriate message
+    assert 'should be of type bool or int64' in str(excinfo.value)
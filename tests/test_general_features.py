@@ -36,6 +36,12 @@ bad_fuzzy3 = pd.DataFrame.from_dict({
     'b2': (1, 0, 1, 0),
 })
 
+# should only fail fuzzy null check once normalized or matched against patterns
+bad_fuzzy4 = pd.DataFrame.from_dict({
+    'b1': ('True', '  Null ', 'N/A', 'n/a', np.nan, 'True'),
+    'b2': (1, 0, 1, 0, 1, 0),
+})
+
 
 # fail DataFrames for fuzzy nulls
 fail_fuzzy_df = pd.DataFrame.from_dict({
@@ -124,3 +130,30 @@ def test_fuzzy_nulls_bad3_df():
 def test_fuzzy_nulls_bad3_ser():
     # verifies that the fuzzy null check finds rows with added fuzzy nulls
     assert fail_fuzzy_ser.equals(gf.check_fuzzy_nulls(bad_fuzzy3['b1'], add_fuzzy_nulls=['foo']))
+
+
+def test_fuzzy_nulls_normalize():
+    # verifies that case and whitespace variants are found once normalized
+    assert gf.check_fuzzy_nulls(bad_fuzzy4['b1']).loc[0, 'fuzzy_null_count'] == 0
+    assert gf.check_fuzzy_nulls(bad_fuzzy4['b1'], normalize=True).loc[0, 'fuzzy_null_count'] == 1
+
+
+def test_fuzzy_nulls_patterns():
+    # verifies that strings fully matching a pattern are counted as fuzzy nulls
+    result = gf.check_fuzzy_nulls(bad_fuzzy4, patterns=[r'[Nn]/[Aa]', 'Tr'])
+    assert result.loc[:, 'fuzzy_null_count'].tolist() == [2, 0]
+    result = gf.check_fuzzy_nulls(bad_fuzzy4, patterns=['n/a'], normalize=True)
+    assert result.loc[:, 'fuzzy_null_count'].tolist() == [3, 0]
+
+
+def test_fuzzy_nulls_category():
+    # verifies that categorical columns are matched through their categories
+    expected = gf.check_fuzzy_nulls(bad_fuzzy4, patterns=['n/a'], normalize=True)
+    categorical = bad_fuzzy4.astype('category')
+    assert gf.check_fuzzy_nulls(categorical, patterns=['n/a'], normalize=True).equals(expected)
+
+
+def test_fuzzy_nulls_added_null():
+    # verifies that nulls are counted when added as fuzzy nulls, as with isin
+    result = gf.check_fuzzy_nulls(bad_fuzzy4['b1'], add_fuzzy_nulls=[np.nan])
+    assert result.loc[0, 'fuzzy_null_count'] == 1
@@ -0,0 +1,47 @@
+# standard library imports
+import subprocess
+import sys
+# third party imports
+import pytest
+# local imports
+import datasurveyor
+
+
+def run_fresh(code):
+    # runs code in a fresh interpreter and returns its output
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True)
+    return output.stdout.strip()
+
+
+def test_import_is_lazy():
+    # verifies that importing the package does not import pandas or the checks
+    code = (
+        'import sys, datasurveyor; '
+        'print([m for m in ("pandas", "numpy", "datasurveyor._survey") if m in sys.modules])'
+    )
+    assert run_fresh(code) == '[]'
+
+
+def test_import_feature_class_only():
+    # verifies that touching a feature class does not import the modules of other classes
+    code = (
+        'import sys, datasurveyor; datasurveyor.BinaryFeatures; '
+        'print(sorted(m for m in sys.modules if m.endswith(("_features", "_survey", "_streaming"))))'
+    )
+    assert run_fresh(code) == "['datasurveyor._binary_features']"
+
+
+def test_all_resolves():
+    # verifies that every name in __all__ is a string bound to a public class
+    assert sorted(datasurveyor.__all__) == sorted(datasurveyor._LAZY)
+    for name in datasurveyor.__all__:
+        assert isinstance(name, str)
+        assert getattr(datasurveyor, name).__name__ == name
+    assert set(datasurveyor.__all__) <= set(dir(datasurveyor))
+
+
+def test_unknown_attribute():
+    # verifies that unknown attributes raise an AttributeError
+    with pytest.raises(AttributeError) as excinfo:
+        datasurveyor.NotAClass
+    assert 'has no attribute' in str(excinfo.value)
@@ -0,0 +1,144 @@
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import BinaryFeatures as bf
+from datasurveyor import CategoricalFeatures as cf
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import Survey
+from datasurveyor import UniqueFeatures as uf
+from datasurveyor._inference import build_checks, infer_feature_type
+
+
+# mixed data with a column of each feature type
+data = pd.DataFrame.from_dict({
+    'id': (1, 2, 3, 4, 5, 6, 7, 8),
+    'name': ('Nick', 'Gina', 'Rob', 'Adam', 'Hanna', 'Susan', 'Quentin', 'Caitlyn'),
+    'app_inst': (True, True, False, True, True, False, True, True),
+    'lylty': (0, 1, 0, 1, 1, 0, 1, 0),
+    'state': ('WA', 'OR', 'WA', 'ID', 'WA', None, 'WA', 'unknown'),
+    'spend': (0.0, np.nan, 10.0, 150.0, 12.0, 0.0, np.nan, 8.0),
+})
+
+# data with more rows than the probes sample
+n_rows = 20_000
+rng = np.random.default_rng(0)
+big = pd.DataFrame.from_dict({
+    'id': pd.Series(rng.permutation(n_rows)).astype('Int64'),
+    'dupe_id': np.concatenate([np.arange(n_rows - 100), np.arange(100)]),
+    'mostly_binary': np.concatenate([rng.integers(0, 2, n_rows - 1), [2]]),
+    'platform': pd.Categorical(rng.choice(['ios', 'android', 'web'], n_rows)),
+    'count': rng.integers(0, 1_000, n_rows),
+})
+
+expected_types = {
+    'id': 'unique',
+    'name': 'unique',
+    'app_inst': 'binary',
+    'lylty': 'binary',
+    'state': 'categorical',
+    'spend': 'general',
+}
+
+
+def test_infer_feature_types():
+    # verifies that each column of the mixed data is given its feature type
+    assert Survey.infer_feature_types(data) == expected_types
+
+
+def test_infer_feature_types_sampled():
+    # verifies that sampled probes classify larger data, confirming binary ranges on every row
+    assert Survey.infer_feature_types(big, sample_size=1_000) == {
+        'id': 'unique',
+        'dupe_id': 'unique',
+        'mostly_binary': 'categorical',
+        'platform': 'categorical',
+        'count': 'general',
+    }
+
+
+def test_infer_feature_type_series():
+    # verifies that a Series is classified as a single column
+    assert Survey.infer_feature_types(data['lylty']) == {'lylty': 'binary'}
+
+
+def test_infer_feature_type_unique_with_nulls():
+    # verifies that distinct columns with nulls are not unique, since the uniqueness check rejects nulls
+    assert infer_feature_type(pd.Series([1.0, 2.0, 3.0, np.nan]).astype('Int64')) == 'categorical'
+    assert infer_feature_type(pd.Series(['a', 'b', 'c', None]), max_categories=2) == 'general'
+
+
+def test_infer_feature_type_all_null():
+    # verifies that columns without values are general
+    assert infer_feature_type(pd.Series([None, None], dtype=object)) == 'general'
+
+
+def test_infer_feature_types_max_categories():
+    # verifies that columns with more sampled categories than max_categories are general
+    types = Survey.infer_feature_types(data[['state']], max_categories=3)
+    assert types == {'state': 'general'}
+
+
+def test_infer_feature_types_bad_sample_size():
+    # verifies that a non-positive sample_size raises a ValueError
+    with pytest.raises(ValueError) as excinfo:
+        Survey.infer_feature_types(data, sample_size=0)
+    assert 'sample_size parameter' in str(excinfo.value)
+
+
+def test_infer_feature_types_bad_unique_thresh():
+    # verifies that a unique_thresh outside 0.0 and 1.0 raises a ValueError
+    with pytest.raises(ValueError) as excinfo:
+        Survey.infer_feature_types(data, unique_thresh=1.5)
+    assert 'unique_thresh parameter' in str(excinfo.value)
+
+
+def test_build_checks():
+    # verifies that each feature type gets its checks and general checks cover every column
+    checks = build_checks({'id': 'unique', 'state': 'categorical'})
+    assert [name for name, _ in checks] == [
+        'CategoricalFeatures.check_mostly_same',
+        'CategoricalFeatures.check_n_categories',
+        'UniqueFeatures.check_uniqueness',
+        'GeneralFeatures.check_nulls',
+        'GeneralFeatures.check_fuzzy_nulls',
+    ]
+    assert checks[-1][1] == {'columns': None}
+
+
+def test_build_checks_no_types():
+    # verifies that only general checks on every column are run without column types
+    assert build_checks({}) == [
+        ('GeneralFeatures.check_nulls', {'columns': None}),
+        ('GeneralFeatures.check_fuzzy_nulls', {'columns': None}),
+    ]
+
+
+def test_from_feature_types_matches_checks():
+    # verifies that the dispatched survey matches calling the checks of each type directly
+    results = Survey.from_feature_types(data).run()
+    binary = data[['app_inst', 'lylty']]
+    assert results['BinaryFeatures.check_all_same'].equals(bf.check_all_same(binary))
+    assert results['BinaryFeatures.check_mostly_same'].equals(bf.check_mostly_same(binary))
+    assert results['BinaryFeatures.check_outside_range'].equals(bf.check_outside_range(binary))
+    assert results['CategoricalFeatures.check_mostly_same'].equals(cf.check_mostly_same(data[['state']]))
+    assert results['CategoricalFeatures.check_n_categories'].equals(cf.check_n_categories(data[['state']]))
+    assert results['UniqueFeatures.check_uniqueness'].equals(uf.check_uniqueness(data[['id', 'name']]))
+    assert results['GeneralFeatures.check_nulls'].equals(gf.check_nulls(data))
+    assert results['GeneralFeatures.check_fuzzy_nulls'].equals(gf.check_fuzzy_nulls(data))
+
+
+def test_from_feature_types_overrides():
+    # verifies that given types override the inferred ones
+    results = Survey.from_feature_types(data, types={'lylty': 'categorical', 'name': 'general'}).run()
+    assert results['BinaryFeatures.check_all_same']['column'].tolist() == ['app_inst']
+    assert results['CategoricalFeatures.check_n_categories']['column'].tolist() == ['lylty', 'state']
+    assert results['UniqueFeatures.check_uniqueness']['column'].tolist() == ['id']
+
+
+def test_from_feature_types_bad_type():
+    # verifies that unknown feature types raise a ValueError
+    with pytest.raises(ValueError) as excinfo:
+        Survey.from_feature_types(data, types={'id': 'identifier'})
+    assert 'Unknown feature type' in str(excinfo.value)
@@ -0,0 +1,66 @@
+# third party imports
+import numpy as np
+import pandas as pd
+# local imports
+from datasurveyor import BinaryFeatures as bf
+from datasurveyor._kernels import count_missing, min_max_sum
+
+
+# binary data held in bool, int64, int8, uint8, and nullable blocks
+data = pd.DataFrame.from_dict({
+    'lylty': (True, False, True, True, True, True, True),
+    'flag': (0, 1, 1, 1, 0, 1, 1),
+    'small': np.array((1, 1, 1, 1, 1, 1, 1), dtype=np.int8),
+    'wide': np.array((0, 2, 1, 0, 0, 1, 1), dtype=np.uint8),
+    'promo': pd.array((1, None, 0, 1, 1, None, 1), dtype='Int64'),
+    'paid': pd.array((True, True, None, True, True, True, True), dtype='boolean'),
+})
+
+
+def test_min_max_sum():
+    # verifies that the kernel matches the pandas reductions of every block
+    reduced = min_max_sum(data)
+    assert reduced.min.equals(data.min(axis=0).infer_objects())
+    assert reduced.max.equals(data.max(axis=0).infer_objects())
+    assert reduced.mean.equals(data.mean(axis=0))
+    assert reduced.count.tolist() == [7, 7, 7, 7, 5, 6]
+
+
+def test_min_max_sum_chunks():
+    # verifies that reducing blocks a few rows at a time gives the same output as a single chunk
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(rng.integers(-3, 4, size=(1000, 3)), columns=['a', 'b', 'c'])
+    frame['d'] = rng.random(1000) > 0.5
+    chunked, whole = min_max_sum(frame, block_rows=7), min_max_sum(frame, block_rows=1000)
+    assert chunked.min.equals(whole.min)
+    assert chunked.max.equals(whole.max)
+    assert chunked.mean.equals(frame.mean(axis=0))
+
+
+def test_min_max_sum_empty():
+    # verifies that columns without values have no minimum, maximum, or mean
+    reduced = min_max_sum(data.iloc[:0])
+    assert reduced.min.isna().all()
+    assert reduced.mean.isna().all()
+    assert reduced.count.sum() == 0
+
+
+def test_binary_checks_kernel():
+    # verifies that the binary checks served by the kernel match the checks of each column
+    all_same = bf.check_all_same(data)
+    assert all_same['all_same'].tolist() == [False, False, True, False, False, True]
+    assert bf.check_outside_range(data)['outside_range'].tolist() == [False, False, False, True, False, False]
+    assert bf.check_mostly_same(data['promo'], thresh=0.8)['mean'].iloc[0] == 0.8
+
+
+def test_count_missing():
+    # verifies that counting a block a few rows at a time matches isna on each dtype
+    frame = pd.DataFrame.from_dict({
+        'spend': (0.0, np.nan, 10.0, np.nan, 12.0, 0.0, np.nan),
+        'state': ('WA', None, 'WA', np.nan, 'WA', 'ID', 'OR'),
+        'seen': pd.to_datetime(('2020-01-01', None, '2020-01-03', None, None, '2020-01-06', None)),
+    })
+    for column in frame:
+        values = frame[column].to_numpy().reshape(1, -1)
+        assert count_missing(values, block_rows=2).tolist() == [frame[column].isna().sum()]
+    assert count_missing(data[['flag']].to_numpy().T).tolist() == [0]
@@ -0,0 +1,82 @@
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import NullMask
+from datasurveyor._fuzzy_nulls import FuzzyNullMatcher
+
+
+# data with nulls in float, object, datetime, nullable, and category columns
+data = pd.DataFrame.from_dict({
+    'id': (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+    'spend': (0.0, np.nan, 10.0, 150.0, 12.0, 0.0, np.nan, 1.0, 2.0, np.nan, 3.0),
+    'state': ('WA', 'Null', None, 'WA', ' null ', 'ID', 'OR', '', 'WA', 'OR', 'WA'),
+    'seen': pd.to_datetime((None,) + ('2020-01-01',) * 10),
+    'promo': pd.array((1, None, 0, 1, 1, None, 1, 0, 0, 1, None), dtype='Int64'),
+    'tier': pd.Categorical(('a', 'NULL', 'b', None, 'a', 'a', 'b', 'NULL', 'a', 'b', 'a')),
+})
+
+
+def test_from_nulls():
+    # verifies that masks built a few rows at a time match isna
+    mask = NullMask.from_nulls(data, block_rows=8)
+    assert mask.count().equals(data.isna().sum(axis=0))
+    for column in data:
+        assert (mask.column(column) == data[column].isna().to_numpy()).all()
+    assert (mask.rows() == data.isna().any(axis=1).to_numpy()).all()
+    assert mask.shape == (11, 6)
+    assert mask.nbytes == 12
+
+
+def test_from_fuzzy_nulls():
+    # verifies that fuzzy null masks count the same fuzzy nulls as the check
+    mask = NullMask.from_fuzzy_nulls(data, patterns=['o.'], normalize=True, block_rows=8)
+    expected = gf.check_fuzzy_nulls(data, patterns=['o.'], normalize=True)['fuzzy_null_count']
+    assert mask.count().tolist() == expected.tolist()
+    assert mask.column('state').nonzero()[0].tolist() == [1, 4, 6, 7, 9]
+    assert NullMask.from_fuzzy_nulls(data['tier']).count().tolist() == [2]
+
+
+def test_fuzzy_nulls_matched_once(monkeypatch):
+    # verifies that the distinct values of a column are matched once, not once per slice of rows
+    calls = []
+    match_uniques = FuzzyNullMatcher._match_uniques
+
+    def counted(self, uniques):
+        calls.append(len(uniques))
+        return match_uniques(self, uniques)
+
+    monkeypatch.setattr(FuzzyNullMatcher, '_match_uniques', counted)
+    mask = NullMask.from_fuzzy_nulls(data[['state']], normalize=True, block_rows=8)
+    assert mask.column('state').nonzero()[0].tolist() == [1, 4, 7]
+    assert calls == [data['state'].nunique()]
+
+
+def test_combine():
+    # verifies that masks combine and invert without counting the padding bits
+    nulls, fuzzy = NullMask.from_nulls(data), NullMask.from_fuzzy_nulls(data)
+    combined = nulls | fuzzy
+    expected = data.isna().to_numpy() | np.column_stack([fuzzy.column(c) for c in data])
+    assert combined.count().tolist() == expected.sum(axis=0).tolist()
+    assert (~nulls).count().equals(data.notna().sum(axis=0))
+    assert (nulls & ~nulls).count().sum() == 0
+    assert data[~nulls.rows()].shape[0] == 3
+    assert nulls.rows('all').sum() == 0
+
+
+def test_combine_mismatch():
+    # checks that ValueError is raised when combining masks of different columns
+    with pytest.raises(ValueError) as excinfo:
+        NullMask.from_nulls(data) | NullMask.from_nulls(data[['id']])
+    # verifies ValueError contains appropriate message
+    assert 'same rows and columns' in str(excinfo.value)
+
+
+def test_block_rows():
+    # checks that ValueError is raised when slices do not pack into whole bytes
+    with pytest.raises(ValueError) as excinfo:
+        NullMask.from_nulls(data, block_rows=10)
+    # verifies ValueError contains appropriate message
+    assert 'positive multiple of 8' in str(excinfo.value)
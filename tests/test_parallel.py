@@ -0,0 +1,85 @@
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import BinaryFeatures as bf
+from datasurveyor import CategoricalFeatures as cf
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import UniqueFeatures as uf
+from datasurveyor._parallel import resolve_n_jobs, split_columns
+
+
+# wide binary data with a non-default index
+binary = pd.DataFrame.from_dict({
+    'b1': (True, True, True, False),
+    'b2': (0, 1, 0, 1),
+    'b3': (1, 1, 1, 1),
+    'b4': (False, True, False, True),
+    'b5': (0, 0, 2, 1),
+}).set_axis([10, 20, 30, 40])
+
+# mixed categorical data where numeric and object columns share blocks
+categorical = pd.DataFrame.from_dict({
+    'c1': ('a', 'b', 'a', 'a'),
+    'c2': (0, 1, 1, 1),
+    'c3': ('x', np.nan, 'y', 'null'),
+    'c4': (3, 3, 3, 3),
+}).set_axis([10, 20, 30, 40])
+
+# unique data mixing object and int columns
+unique = pd.DataFrame.from_dict({
+    'u1': ('foo', 'bar', 'baz', 'foo'),
+    'u2': (0, 1, 2, 3),
+    'u3': (5, 5, 6, 7),
+})
+
+
+def test_binary_checks_parallel():
+    # verifies that binary checks in parallel match the serial output
+    assert bf.check_all_same(binary, n_jobs=2).equals(bf.check_all_same(binary))
+    assert bf.check_mostly_same(binary, thresh=0.7, n_jobs=2).equals(bf.check_mostly_same(binary, thresh=0.7))
+    assert bf.check_outside_range(binary, n_jobs=3).equals(bf.check_outside_range(binary))
+
+
+def test_categorical_checks_parallel():
+    # verifies that categorical checks in parallel match the serial output
+    assert cf.check_mostly_same(categorical, thresh=0.5, n_jobs=2).equals(cf.check_mostly_same(categorical, 0.5))
+    assert cf.check_n_categories(categorical, dropna=True, n_jobs=4).equals(
+        cf.check_n_categories(categorical, dropna=True)
+    )
+
+
+def test_general_checks_parallel():
+    # verifies that general checks in parallel match the serial output
+    assert gf.check_nulls(categorical, n_jobs=2).equals(gf.check_nulls(categorical))
+    assert gf.check_fuzzy_nulls(categorical, add_fuzzy_nulls=['x'], n_jobs=2).equals(
+        gf.check_fuzzy_nulls(categorical, add_fuzzy_nulls=['x'])
+    )
+
+
+def test_unique_checks_parallel():
+    # verifies that unique checks in parallel match the serial output
+    assert uf.check_uniqueness(unique, n_jobs=-1).equals(uf.check_uniqueness(unique))
+
+
+def test_parallel_validates_before_dispatch():
+    # checks that TypeError is raised before any work is sent to the process pool
+    with pytest.raises(TypeError) as excinfo:
+        bf.check_all_same(categorical, n_jobs=2)
+    # verifies TypeError contains appropriate message
+    assert 'should be of type bool or int64' in str(excinfo.value)
+
+
+def test_resolve_n_jobs_bad():
+    # checks that ValueError is raised for invalid numbers of worker processes
+    with pytest.raises(ValueError) as excinfo:
+        resolve_n_jobs(0)
+    # verifies ValueError contains appropriate message
+    assert 'must be a positive integer or -1' in str(excinfo.value)
+
+
+def test_split_columns():
+    # verifies that columns are split into contiguous non-empty blocks
+    assert split_columns(['a', ('b', 1), 'c'], 2) == [['a', ('b', 1)], ['c']]
+    assert split_columns(['a'], 3) == [['a']]
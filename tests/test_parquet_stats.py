@@ -0,0 +1,103 @@
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import BinaryFeatures as bf
+from datasurveyor import CategoricalFeatures as cf
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import StreamingSurvey
+from datasurveyor import Survey
+from datasurveyor import UniqueFeatures as uf
+
+
+# mixed data with nulls, written in row groups of three rows below
+data = pd.DataFrame.from_dict({
+    'id': (1, 2, 3, 4, 5, 6, 7),
+    'flag': (True, True, False, True, True, True, False),
+    'lylty': np.array((0, 1, 0, 1, 1, 0, 2), dtype=np.uint8),
+    'promo': pd.array((1, None, 1, 1, None, 1, 1), dtype='Int64'),
+    'state': ('WA', 'OR', 'WA', None, 'WA', 'ID', 'OR'),
+    'spend': (0.0, np.nan, 10.0, 150.0, 12.0, 0.0, np.nan),
+})
+
+# checks answered from footer statistics alone
+footer_checks = [
+    gf.check_nulls,
+    (bf.check_all_same, {'columns': ['flag', 'lylty', 'promo']}),
+    (bf.check_outside_range, {'columns': ['flag', 'lylty', 'promo']}),
+]
+
+# checks needing a scan of some columns
+scan_checks = footer_checks + [
+    (bf.check_mostly_same, {'columns': ['flag'], 'thresh': 0.7}),
+    (cf.check_n_categories, {'columns': ['state']}),
+    (uf.check_uniqueness, {'columns': ['id']}),
+]
+
+
+def write(df, path, **kwargs):
+    # writes a DataFrame to a Parquet file in row groups of three rows
+    pq = pytest.importorskip('pyarrow.parquet')
+    pa = pytest.importorskip('pyarrow')
+    pq.write_table(pa.Table.from_pandas(df), path, row_group_size=3, **kwargs)
+    return path
+
+
+def no_scans(monkeypatch):
+    # makes reading data pages from a Parquet file fail
+    pq = pytest.importorskip('pyarrow.parquet')
+
+    def fail(*args, **kwargs):
+        raise AssertionError('Data pages were read.')
+
+    monkeypatch.setattr(pq.ParquetFile, 'iter_batches', fail)
+
+
+def assert_results_equal(left, right):
+    # verifies two survey outputs contain identical frames
+    assert list(left) == list(right)
+    for name in left:
+        assert left[name].equals(right[name]), name
+
+
+def test_metadata_footer_only(tmp_path, monkeypatch):
+    # verifies that null, all same, and range checks are answered without reading data pages
+    path = write(data, tmp_path / 'data.parquet')
+    no_scans(monkeypatch)
+    result = StreamingSurvey(path, footer_checks, metadata=True).run()
+    assert_results_equal(result, Survey(data, footer_checks).run())
+
+
+def test_metadata_scans_needed_columns(tmp_path):
+    # verifies that checks the footer cannot answer match scanning the whole file
+    path = write(data, tmp_path / 'data.parquet')
+    result = StreamingSurvey(path, scan_checks, chunksize=2, metadata=True).run()
+    assert_results_equal(result, Survey(data, scan_checks).run())
+
+
+def test_metadata_missing_statistics(tmp_path):
+    # verifies that row groups written without statistics are scanned
+    path = write(data, tmp_path / 'data.parquet', write_statistics=['flag'])
+    result = StreamingSurvey(path, footer_checks, metadata=True).run()
+    assert_results_equal(result, Survey(data, footer_checks).run())
+
+
+def test_metadata_dataset(tmp_path, monkeypatch):
+    # verifies that the footers of every file of a dataset are aggregated
+    paths = {i: write(data.iloc[i:i + 4], tmp_path / f'part-{i}.parquet') for i in (0, 4)}
+    no_scans(monkeypatch)
+    result = StreamingSurvey(paths, footer_checks, metadata=True).run()
+    assert_results_equal(result, Survey(data, footer_checks).run())
+
+
+def test_metadata_rejects_nulls(tmp_path, monkeypatch):
+    # verifies that nulls in unique columns are rejected from the footer before reading data
+    path = write(data, tmp_path / 'data.parquet')
+    no_scans(monkeypatch)
+    with pytest.raises(ValueError) as excinfo:
+        StreamingSurvey(path, [(uf.check_uniqueness, {'columns': ['promo']})], metadata=True).run()
+    assert 'should not contain nulls' in str(excinfo.value)
+    with pytest.raises(TypeError) as excinfo:
+        StreamingSurvey(path, [(bf.check_all_same, {'columns': ['state']})], metadata=True).run()
+    assert 'Binary feature columns' in str(excinfo.value)
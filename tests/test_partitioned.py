@@ -0,0 +1,137 @@
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import BinaryFeatures as bf
+from datasurveyor import CategoricalFeatures as cf
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import UniqueFeatures as uf
+from datasurveyor._partitioned import is_partitioned, map_reduce
+
+
+# mixed data split into uneven partitions below
+data = pd.DataFrame.from_dict({
+    'flag': (0, 1, 1, 1, 0, 1, 1, 1, 1, 1),
+    'state': ('WA', 'OR', 'WA', 'Null', None, 'WA', 'ID', 'OR', 'WA', 'WA'),
+    'id': (1, 2, 3, 4, 5, 2, 7, 8, 1, 10),
+    'name': ('a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'a', 'j'),
+})
+
+
+def partitions(df):
+    # splits data into partitions of three rows (the last holding one)
+    return [df.iloc[i:i + 3] for i in range(0, df.shape[0], 3)]
+
+
+def test_is_partitioned():
+    # verifies that only lists of pandas partitions and dask collections are partitioned
+    assert is_partitioned(partitions(data))
+    assert is_partitioned(tuple(partitions(data['id'])))
+    assert not is_partitioned(data)
+    assert not is_partitioned([])
+    assert not is_partitioned([1, 2])
+
+
+def test_map_reduce_tree():
+    # verifies that partials are combined in order over several levels of the tree
+    parts = [pd.Series([i]) for i in range(20)]
+    result = map_reduce(parts, lambda part: [part.iloc[0]], lambda partials: sum(partials, []))
+    assert result == list(range(20))
+
+
+def test_binary_checks_partitioned():
+    # verifies that binary checks over partitions match checking the concatenated data
+    parts = partitions(data[['flag']])
+    assert bf.check_all_same(parts).equals(bf.check_all_same(data[['flag']]))
+    assert bf.check_mostly_same(parts, thresh=0.7).equals(bf.check_mostly_same(data[['flag']], thresh=0.7))
+    assert bf.check_outside_range(partitions(data['flag'])).equals(bf.check_outside_range(data['flag']))
+
+
+def test_categorical_checks_partitioned():
+    # verifies that categorical checks over partitions match checking the concatenated data
+    parts = partitions(data[['state', 'flag']])
+    assert cf.check_mostly_same(parts, thresh=0.4).equals(cf.check_mostly_same(data[['state', 'flag']], 0.4))
+    assert cf.check_mostly_same(partitions(data['state']), top_k=2).equals(
+        cf.check_mostly_same(data['state'], top_k=2)
+    )
+    assert cf.check_n_categories(parts, dropna=True).equals(
+        cf.check_n_categories(data[['state', 'flag']], dropna=True)
+    )
+
+
+def test_approx_checks_partitioned():
+    # verifies that merged sketches give the same estimates as sketching the concatenated data
+    parts = partitions(data[['state', 'flag']])
+    assert cf.check_n_categories(parts, approx=True).equals(
+        cf.check_n_categories(data[['state', 'flag']], approx=True)
+    )
+    assert uf.check_uniqueness(partitions(data['id']), approx=True, precision=10).equals(
+        uf.check_uniqueness(data['id'], approx=True, precision=10)
+    )
+
+
+def test_general_checks_partitioned():
+    # verifies that general checks over partitions match checking the concatenated data
+    parts = partitions(data)
+    assert gf.check_nulls(parts).equals(gf.check_nulls(data))
+    assert gf.check_fuzzy_nulls(parts, add_fuzzy_nulls=['OR']).equals(
+        gf.check_fuzzy_nulls(data, add_fuzzy_nulls=['OR'])
+    )
+
+
+def test_unique_checks_partitioned():
+    # verifies that duplicates are counted and located across partitions
+    unique = data[['id', 'name']]
+    assert uf.check_uniqueness(partitions(unique)).equals(uf.check_uniqueness(unique))
+    assert uf.find_duplicates(partitions(unique)).equals(uf.find_duplicates(unique))
+    assert uf.find_duplicates(partitions(unique), composite=True).equals(
+        uf.find_duplicates(unique, composite=True)
+    )
+    result = uf.find_duplicates(partitions(data['id']))
+    assert result['dupe_positions'].iloc[0] == [[0, 8], [1, 5]]
+
+
+def test_checks_partitioned_processes():
+    # verifies that partitions mapped by worker processes give the same output
+    parts = partitions(data)
+    assert gf.check_nulls(parts, n_jobs=2).equals(gf.check_nulls(data))
+
+
+def test_partitioned_errors():
+    # verifies that partitions are validated like the concatenated data
+    with pytest.raises(TypeError) as excinfo:
+        bf.check_all_same(partitions(data[['state']]))
+    assert 'Binary feature columns' in str(excinfo.value)
+    with pytest.raises(ValueError) as excinfo:
+        uf.check_uniqueness(partitions(data['state']))
+    assert 'should not contain nulls' in str(excinfo.value)
+    with pytest.raises(ValueError) as excinfo:
+        gf.check_nulls(partitions(data), sample=5)
+    assert 'require a pandas DataFrame' in str(excinfo.value)
+    with pytest.raises(ValueError) as excinfo:
+        gf.check_nulls([data[['id']], data[['name']]])
+    assert 'same columns' in str(excinfo.value)
+
+
+def test_dask_threads():
+    # verifies that checks on a dask DataFrame match the pandas output with the threaded scheduler
+    dask = pytest.importorskip('dask')
+    dd = pytest.importorskip('dask.dataframe')
+    ddf = dd.from_pandas(data, npartitions=4)
+    with dask.config.set(scheduler='threads'):
+        assert cf.check_mostly_same(ddf[['state']], thresh=0.4).equals(
+            cf.check_mostly_same(data[['state']], 0.4)
+        )
+        assert gf.check_nulls(ddf).equals(gf.check_nulls(data))
+        assert uf.find_duplicates(ddf['name']).equals(uf.find_duplicates(data['name']))
+
+
+def test_dask_processes():
+    # verifies that checks on a dask Series match the pandas output with the process scheduler
+    dask = pytest.importorskip('dask')
+    dd = pytest.importorskip('dask.dataframe')
+    flag = dd.from_pandas(data['flag'].astype(np.int64), npartitions=3)
+    with dask.config.set(scheduler='processes'):
+        assert bf.check_mostly_same(flag, thresh=0.7).equals(bf.check_mostly_same(data['flag'], thresh=0.7))
+        assert uf.check_uniqueness(flag).equals(uf.check_uniqueness(data['flag']))
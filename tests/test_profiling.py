@@ -0,0 +1,79 @@
+# standard library imports
+import json
+# third party imports
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import BinaryFeatures as bf
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import Profiler
+from datasurveyor import UniqueFeatures as uf
+from datasurveyor._profiling import data_size
+
+
+# mixed data of four rows
+data = pd.DataFrame.from_dict({
+    'flag': (0, 1, 1, 1),
+    'state': ('WA', None, 'WA', 'OR'),
+    'id': (1, 2, 3, 4),
+})
+
+
+def test_profiler_records():
+    # verifies that each check run within the profiler is recorded once with its measurements
+    with Profiler() as profiler:
+        gf.check_nulls(data)
+        bf.check_all_same(data[['flag']], n_jobs=2)
+    gf.check_nulls(data)
+    frame = profiler.to_frame()
+    assert frame['check'].tolist() == ['GeneralFeatures.check_nulls', 'BinaryFeatures.check_all_same']
+    assert frame['column'].isna().all()
+    assert frame['n_rows'].tolist() == [4, 4]
+    assert frame['bytes_scanned'].iloc[0] == data.memory_usage(index=False).sum()
+    assert (frame['wall_time'] > 0).all()
+    assert (frame['peak_memory'] >= 0).all()
+    assert (frame['rows_per_second'] > 0).all()
+
+
+def test_profiler_per_column():
+    # verifies that each column is checked and recorded on its own after the check
+    records = []
+    with Profiler(callback=records.append, per_column=True, trace_memory=False) as profiler:
+        uf.check_uniqueness(data[['flag', 'id']])
+    assert [record.column for record in records] == [None, 'flag', 'id']
+    assert records == profiler.records
+    assert records[0].peak_memory is None
+
+
+def test_profiler_errors():
+    # verifies that failed runs are recorded with their exception before it is raised
+    profiler = Profiler().start()
+    with pytest.raises(TypeError):
+        bf.check_all_same(data)
+    profiler.stop()
+    assert profiler.records[0].error == 'TypeError'
+
+
+def test_profiler_spans():
+    # verifies that records are exported as OTLP JSON spans with the columns as child spans
+    with Profiler(per_column=True) as profiler:
+        gf.check_nulls(data[['state', 'id']])
+    payload = json.loads(json.dumps(profiler.to_spans()))
+    spans = payload['resourceSpans'][0]['scopeSpans'][0]['spans']
+    assert [span['name'] for span in spans] == ['GeneralFeatures.check_nulls'] * 3
+    assert spans[0]['parentSpanId'] == ''
+    assert spans[1]['parentSpanId'] == spans[2]['parentSpanId'] == spans[0]['spanId']
+    assert len({span['traceId'] for span in spans}) == 1
+    assert int(spans[0]['endTimeUnixNano']) >= int(spans[0]['startTimeUnixNano'])
+    attributes = {item['key']: item['value'] for item in spans[1]['attributes']}
+    assert attributes['datasurveyor.column'] == {'stringValue': 'state'}
+    assert attributes['datasurveyor.rows'] == {'intValue': '4'}
+
+
+def test_data_size():
+    # verifies that rows and bytes are summed over partitions and read from pyarrow tables
+    assert data_size([data, data.iloc[:2]]) == (6, data.memory_usage(index=False).sum() * 3 // 2)
+    assert data_size(data['id']) == (4, 32)
+    pa = pytest.importorskip('pyarrow')
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    assert data_size(table) == (4, table.nbytes)
@@ -0,0 +1,145 @@
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import BinaryFeatures as bf
+from datasurveyor import CategoricalFeatures as cf
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import Sampler
+from datasurveyor import Survey
+from datasurveyor._sampling import wilson_interval
+
+
+# large mixed data with known proportions
+rng = np.random.default_rng(0)
+n_rows = 100_000
+data = pd.DataFrame.from_dict({
+    'flag': rng.random(n_rows) < 0.98,
+    'lylty': (rng.random(n_rows) < 0.5).astype('int64'),
+    'state': rng.choice(['WA', 'OR', 'ID'], size=n_rows, p=[0.8, 0.15, 0.05]),
+    'spend': np.where(rng.random(n_rows) < 0.02, np.nan, 1.0),
+    'region': np.where(rng.random(n_rows) < 0.1, 'east', 'west'),
+})
+
+# small data where sampling every row must reproduce the exact check
+small = pd.DataFrame.from_dict({
+    'flag': (True, True, False, True),
+    'state': ('WA', 'WA', np.nan, 'OR'),
+})
+
+
+def test_wilson_interval():
+    # verifies the Wilson interval against a known value and at the edges
+    lower, upper = wilson_interval(0.5, 100, 0.95)
+    assert lower == pytest.approx(0.4038, abs=1e-4)
+    assert upper == pytest.approx(0.5962, abs=1e-4)
+    assert wilson_interval(0.0, 100, 0.95)[0] == 0.0
+    assert wilson_interval(1.0, 100, 0.95)[1] == 1.0
+
+
+def test_sampler_size():
+    # verifies that a fixed size sample draws that many rows with equal weights
+    sampled, weights = Sampler(size=1000, seed=0).draw(data)
+    assert sampled.shape[0] == 1000
+    assert sampled.index.is_monotonic_increasing
+    assert np.allclose(weights, n_rows / 1000)
+
+
+def test_sampler_frac():
+    # verifies that Bernoulli sampling keeps about the requested proportion of rows
+    sampled, weights = Sampler(frac=0.1, seed=0).draw(data)
+    assert 9_000 < sampled.shape[0] < 11_000
+    assert weights.sum() == pytest.approx(n_rows)
+
+
+def test_sampler_stratified():
+    # verifies that stratified samples draw from each stratum and weight rows by stratum size
+    sampled, weights = Sampler(size=100, by='region', seed=0).draw(data)
+    assert sampled['region'].value_counts().to_dict() == {'east': 100, 'west': 100}
+    assert weights.sum() == pytest.approx(n_rows)
+    sampled, weights = Sampler(frac=0.01, by=data['region'].to_numpy(), seed=0).draw(data)
+    assert weights.sum() == pytest.approx(n_rows)
+
+
+def test_sampler_frac_keeps_a_row():
+    # verifies that a Bernoulli sample keeping no row falls back to a single row
+    sampled, weights = Sampler(frac=0.001, seed=0).draw(small)
+    assert sampled.shape[0] == 1
+    assert weights.tolist() == [len(small)]
+    result = gf.check_nulls(small, sample=0.001)
+    assert result['null_count'].isin([0, len(small)]).all()
+    assert result['prop_null_lower'].notna().all()
+
+
+def test_sampled_checks_cover_truth():
+    # verifies that the intervals of sampled checks contain the exact proportions
+    sample = Sampler(size=5000, seed=1)
+    result = bf.check_mostly_same(data[['flag', 'lylty']], thresh=0.9, sample=sample)
+    exact = bf.check_mostly_same(data[['flag', 'lylty']], thresh=0.9)
+    assert ((result['mean_lower'] <= exact['mean']) & (exact['mean'] <= result['mean_upper'])).all()
+    assert result['mostly_same'].tolist() == exact['mostly_same'].tolist()
+    result = gf.check_nulls(data['spend'], sample=sample)
+    exact = gf.check_nulls(data['spend'])
+    assert result.loc[0, 'prop_null_lower'] <= exact.loc[0, 'prop_null'] <= result.loc[0, 'prop_null_upper']
+    result = cf.check_mostly_same(data['state'], thresh=0.5, sample=Sampler(frac=0.05, by=data['region'], seed=1))
+    exact = cf.check_mostly_same(data['state'], thresh=0.5)
+    assert result.loc[0, 'most_common'] == 'WA'
+    assert result.loc[0, 'prop_lower'] <= exact.loc[0, 'prop'] <= result.loc[0, 'prop_upper']
+
+
+def test_sampled_checks_full_sample():
+    # verifies that sampling every row reproduces the exact check
+    columns = ['column', 'mostly_same', 'thresh', 'most_common', 'count', 'prop']
+    result = cf.check_mostly_same(small[['state']], thresh=0.4, sample=len(small))
+    assert result.loc[:, columns].equals(cf.check_mostly_same(small[['state']], thresh=0.4))
+    result = gf.check_nulls(small, sample=1.0)
+    assert result.loc[:, ['column', 'nulls_present', 'null_count', 'prop_null']].equals(gf.check_nulls(small))
+
+
+def test_sampled_checks_uncertain():
+    # verifies that checks are flagged uncertain when the interval contains the threshold
+    result = bf.check_mostly_same(data['flag'], thresh=0.98, sample=Sampler(size=500, seed=2))
+    assert result.loc[0, 'uncertain']
+    result = gf.check_nulls(data[['flag', 'spend']], sample=Sampler(size=2000, seed=2))
+    assert result['uncertain'].tolist() == [True, False]
+
+
+def test_sampled_checks_bad_sample():
+    # checks that ValueError is raised for a sample that is neither a size nor a proportion
+    with pytest.raises(ValueError) as excinfo:
+        gf.check_nulls(data, sample='10%')
+    # verifies ValueError contains appropriate message
+    assert 'must be a positive integer, a proportion, or a Sampler' in str(excinfo.value)
+
+
+def test_sampled_checks_bad_confidence():
+    # checks that ValueError is raised when the confidence level is out of range
+    with pytest.raises(ValueError) as excinfo:
+        gf.check_nulls(data, sample=100, confidence=95)
+    # verifies ValueError contains appropriate message
+    assert 'must be greater than 0.0 and less than 1.0' in str(excinfo.value)
+
+
+def test_sampler_bad_arguments():
+    # checks that ValueError is raised unless exactly one of size and frac is set
+    with pytest.raises(ValueError) as excinfo:
+        Sampler(size=10, frac=0.1)
+    # verifies ValueError contains appropriate message
+    assert 'Exactly one of the size and frac parameters' in str(excinfo.value)
+
+
+def test_sampler_empty_data():
+    # checks that ValueError is raised when sampling data with no rows
+    with pytest.raises(ValueError) as excinfo:
+        gf.check_nulls(small.iloc[:0], sample=0.5)
+    # verifies ValueError contains appropriate message
+    assert 'no rows cannot be sampled' in str(excinfo.value)
+
+
+def test_sampled_checks_not_surveyed():
+    # checks that ValueError is raised when a sampled check is requested in a survey
+    with pytest.raises(ValueError) as excinfo:
+        Survey(data, [(gf.check_nulls, {'sample': 100})])
+    # verifies ValueError contains appropriate message
+    assert 'Sampled checks cannot be surveyed' in str(excinfo.value)
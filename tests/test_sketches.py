@@ -0,0 +1,163 @@
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import CategoricalFeatures as cf
+from datasurveyor import StreamingSurvey
+from datasurveyor import Survey
+from datasurveyor import UniqueFeatures as uf
+from datasurveyor._sketches import HyperLogLog, MisraGries, fingerprints
+
+
+rng = np.random.default_rng(0)
+
+# large id columns with a known number of duplicates
+ids = pd.DataFrame.from_dict({
+    'i1': np.arange(50_000),
+    'i2': np.concatenate([np.arange(45_000), np.arange(5_000)]).astype(str).astype(object),
+})
+
+# categorical data with nulls
+cats = pd.DataFrame.from_dict({
+    'c1': ('a', 'b', np.nan, 'a'),
+    'c2': (0, 1, 2, 3),
+})
+
+# skewed categorical data with a long tail of rare categories
+skewed = pd.DataFrame.from_dict({
+    's1': np.concatenate([np.full(900, 'WA'), np.arange(100).astype(str)]).astype(object),
+    's2': np.concatenate([np.full(400, 7), np.full(350, 8), np.arange(10, 260)]),
+})
+
+
+def test_hyperloglog_estimate():
+    # verifies that the estimate is within a few standard errors of the true count
+    values = rng.integers(0, 200_000, size=300_000)
+    sketch = HyperLogLog(14).update(values)
+    n_unique = np.unique(values).shape[0]
+    assert abs(sketch.estimate() - n_unique) < 4 * sketch.rel_error * n_unique
+
+
+def test_hyperloglog_merge():
+    # verifies that merging sketches matches sketching all of the values
+    values = rng.integers(0, 10_000, size=20_000)
+    left = HyperLogLog(10).update(values[:10_000])
+    right = HyperLogLog(10).update(values[10_000:])
+    assert left.merge(right).estimate() == HyperLogLog(10).update(values).estimate()
+
+
+def test_fingerprints_match_across_dtypes():
+    # verifies that a value gets the same fingerprint in columns of any dtype holding it
+    expected = fingerprints(pd.Series((1, -2, None, 3), dtype=object))
+    for dtype in ('float64', 'float32', 'Int64', 'Int32', 'int64[pyarrow]'):
+        assert (fingerprints(pd.Series((1, -2, None, 3), dtype=dtype)) == expected).all()
+    expected = fingerprints(pd.Series(('a', 'é', None, ''), dtype=object))
+    for dtype in ('string', 'string[pyarrow]', 'category'):
+        assert (fingerprints(pd.Series(('a', 'é', None, ''), dtype=dtype)) == expected).all()
+    assert np.unique(fingerprints(pd.Series(('a', 'é', '', 'ab', 'ba')))).shape[0] == 5
+
+
+def test_hyperloglog_merge_mixed_dtypes():
+    # verifies that sketches of partitions of different dtypes merge like a single sketch
+    values = pd.Series(rng.integers(0, 10_000, size=20_000))
+    left = HyperLogLog(10).update(values.iloc[:10_000].astype('Int64'))
+    right = HyperLogLog(10).update(values.iloc[10_000:])
+    assert left.merge(right).estimate() == HyperLogLog(10).update(values).estimate()
+
+
+def test_hyperloglog_bad_precision():
+    # checks that ValueError is raised for out of range precision
+    with pytest.raises(ValueError) as excinfo:
+        HyperLogLog(20)
+    # verifies ValueError contains appropriate message
+    assert 'must be an integer between 4 and 18' in str(excinfo.value)
+
+
+def test_check_uniqueness_approx_df():
+    # verifies that approximate duplicate counts are close to the exact counts
+    result = uf.check_uniqueness(ids, approx=True)
+    exact = uf.check_uniqueness(ids)
+    assert list(result.columns) == list(exact.columns) + ['dupe_count_error']
+    assert result['dupes_present'].tolist() == [False, True]
+    assert (result['dupe_count'] - exact['dupe_count']).abs().le(4 * result['dupe_count_error']).all()
+
+
+def test_check_uniqueness_approx_ser():
+    # verifies that approximate uniqueness reports an error bound for a series
+    result = uf.check_uniqueness(ids['i1'], approx=True, precision=12)
+    assert list(result.columns) == ['dupes_present', 'dupe_count', 'prop_dupe', 'dupe_count_error']
+
+
+def test_check_n_categories_approx_df():
+    # verifies that small cardinalities are estimated exactly, with and without nulls
+    result = cf.check_n_categories(cats, approx=True)
+    assert result['n_categories'].tolist() == [3, 4]
+    assert cf.check_n_categories(cats, dropna=True, approx=True)['n_categories'].tolist() == [2, 4]
+
+
+def test_check_n_categories_approx_ser():
+    # verifies that approximate category counts report an error bound for a series
+    result = cf.check_n_categories(cats['c1'], approx=True)
+    assert list(result.columns) == ['n_categories', 'n_categories_error']
+    assert result.loc[0, 'n_categories'] == 3
+
+
+def test_misra_gries_keeps_heavy_hitters():
+    # verifies that frequent values are kept with counts within the error bound
+    values = pd.Series(np.concatenate([np.full(600, 'x'), np.full(300, 'y'), np.arange(100).astype(str)]))
+    sketch = MisraGries(capacity=4).update(values.sample(frac=1, random_state=0))
+    top = dict(sketch.top(2))
+    assert list(top) == ['x', 'y']
+    assert 600 - sketch.error <= top['x'] <= 600
+    assert 300 - sketch.error <= top['y'] <= 300
+
+
+def test_misra_gries_merge():
+    # verifies that merged sketches keep frequent values from both parts
+    left = MisraGries(capacity=2).update(pd.Series(['a'] * 5 + ['b', 'c']))
+    right = MisraGries(capacity=2).update(pd.Series(['a'] * 3 + ['d'] * 4))
+    assert left.merge(right).top(1)[0][0] == 'a'
+
+
+def test_misra_gries_bad_capacity():
+    # checks that ValueError is raised for capacities less than 1
+    with pytest.raises(ValueError) as excinfo:
+        MisraGries(capacity=0)
+    # verifies ValueError contains appropriate message
+    assert 'must be a positive integer' in str(excinfo.value)
+
+
+def test_mostly_same_heavy_hitters_df():
+    # verifies that heavy hitters find the same dominant categories as the exact check
+    exact = cf.check_mostly_same(skewed, thresh=0.85)
+    result = cf.check_mostly_same(skewed, thresh=0.85, heavy_hitters=True, capacity=10)
+    assert result.loc[:, ['column', 'mostly_same', 'most_common']].equals(
+        exact.loc[:, ['column', 'mostly_same', 'most_common']]
+    )
+    assert result['count'].le(exact['count']).all()
+
+
+def test_mostly_same_top_k_ser():
+    # verifies that the top categories are listed from most to least common
+    result = cf.check_mostly_same(skewed['s2'], thresh=0.5, top_k=2)
+    assert result.loc[0, 'top_categories'] == [(7, 400), (8, 350)]
+    assert result.loc[0, 'most_common'] == 7
+
+
+def test_mostly_same_top_k_nulls():
+    # verifies that nulls are listed as a category unless dropped
+    assert cf.check_mostly_same(cats['c1'], top_k=3).loc[0, 'top_categories'][-1][1] == 1
+    assert cf.check_mostly_same(cats['c1'], top_k=3, dropna=True).loc[0, 'top_categories'] == [('a', 2), ('b', 1)]
+
+
+def test_mostly_same_heavy_hitters_survey_and_stream():
+    # verifies that surveys and chunked streams serve heavy hitters like the direct check
+    check = (cf.check_mostly_same, {'thresh': 0.85, 'heavy_hitters': True, 'capacity': 10, 'top_k': 3})
+    expected = cf.check_mostly_same(skewed, thresh=0.85, heavy_hitters=True, capacity=10, top_k=3)
+    result = Survey(skewed, [check]).run()['CategoricalFeatures.check_mostly_same']
+    assert result.equals(expected)
+    chunks = (skewed.iloc[i:i + 100] for i in range(0, skewed.shape[0], 100))
+    streamed = StreamingSurvey(chunks, [check]).run()['CategoricalFeatures.check_mostly_same']
+    assert streamed['most_common'].tolist() == ['WA', 7]
+    assert streamed['mostly_same'].tolist() == [True, False]
@@ -0,0 +1,103 @@
+# standard library imports
+import sqlite3
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import BinaryFeatures as bf
+from datasurveyor import CategoricalFeatures as cf
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import SqlSurvey
+from datasurveyor import Survey
+from datasurveyor import UniqueFeatures as uf
+from datasurveyor._sql import quote_identifier, to_literal
+
+
+# mixed data with nulls and tied categories
+data = pd.DataFrame.from_dict({
+    'id': (1, 2, 3, 4, 5, 6, 7, 8),
+    'lylty': (0, 1, 0, 1, 1, 0, 0, 0),
+    'state': ('WA', 'OR', 'WA', 'Null', None, 'ID', 'OR', ' null '),
+    'spend': (0.0, np.nan, 10.0, 150.0, 12.0, 0.0, np.nan, 3.0),
+})
+
+checks = [
+    (bf.check_all_same, {'columns': ['lylty']}),
+    (bf.check_mostly_same, {'columns': ['lylty'], 'thresh': 0.6}),
+    (bf.check_outside_range, {'columns': ['lylty']}),
+    (cf.check_mostly_same, {'columns': ['state', 'lylty'], 'thresh': 0.4, 'top_k': 2}),
+    (cf.check_n_categories, {'columns': ['state', 'lylty']}),
+    gf.check_nulls,
+    (gf.check_fuzzy_nulls, {'add_fuzzy_nulls': ['OR', 0.0]}),
+    (uf.check_uniqueness, {'columns': ['id']}),
+]
+
+
+def connect(df):
+    # writes a DataFrame to a table of an in-memory sqlite database
+    connection = sqlite3.connect(':memory:')
+    df.to_sql('customers', connection, index=False)
+    return connection
+
+
+def assert_results_equal(left, right):
+    # verifies two survey outputs contain identical frames
+    assert list(left) == list(right)
+    for name in left:
+        assert left[name].equals(right[name]), name
+
+
+def test_sql_matches_survey():
+    # verifies that checks compiled into SQL match surveying the data in pandas
+    result = SqlSurvey(connect(data), 'customers', checks).run()
+    assert_results_equal(result, Survey(data, checks).run())
+
+
+def test_sql_modes():
+    # verifies that the modes of columns whose nulls or ties are most common match pandas
+    df = pd.DataFrame({'tied': ['b', 'a', 'b', 'a', None], 'nulls': [None, None, None, 'a', 'b']})
+    requests = [(cf.check_mostly_same, {'thresh': 0.3}), (cf.check_n_categories, {'dropna': True})]
+    assert_results_equal(SqlSurvey(connect(df), 'customers', requests).run(), Survey(df, requests).run())
+
+
+def test_sql_fuzzy_patterns():
+    # verifies that fuzzy nulls matched by patterns or normalization are counted from distinct values
+    requests = [(gf.check_fuzzy_nulls, {'patterns': ['O.'], 'normalize': True})]
+    survey = SqlSurvey(connect(data), 'customers', requests)
+    assert 'CASE' not in survey.compile()
+    assert_results_equal(survey.run(), Survey(data, requests).run())
+
+
+def test_sql_single_query():
+    # verifies that the aggregates of every check are compiled into one query
+    requests = [gf.check_nulls, (bf.check_all_same, {'columns': ['lylty']})]
+    survey = SqlSurvey(connect(data), 'customers', requests)
+    assert survey.compile() == (
+        'SELECT COUNT(*), COUNT(*) - COUNT("id"), COUNT(*) - COUNT("lylty"), COUNT(*) - COUNT("state"), '
+        'COUNT(*) - COUNT("spend"), MIN("lylty"), MAX("lylty") FROM "customers"'
+    )
+
+
+def test_sql_literals():
+    # verifies that identifiers and literals are quoted and escaped
+    assert quote_identifier('a"b') == '"a""b"'
+    assert to_literal("it's") == "'it''s'"
+    assert to_literal(True) == '1'
+    assert to_literal(np.int64(3)) == '3'
+    assert to_literal(float('nan')) is None
+    assert to_literal([1]) is None
+
+
+def test_sql_errors():
+    # verifies that missing columns, invalid arguments, and nulls in unique columns are rejected
+    connection = connect(data)
+    with pytest.raises(KeyError) as excinfo:
+        SqlSurvey(connection, 'customers', [(gf.check_nulls, {'columns': ['zip']})]).run()
+    assert 'zip' in str(excinfo.value)
+    with pytest.raises(ValueError) as excinfo:
+        SqlSurvey(connection, 'customers', [(bf.check_mostly_same, {'thresh': 1.5})]).run()
+    assert 'thresh' in str(excinfo.value)
+    with pytest.raises(ValueError) as excinfo:
+        SqlSurvey(connection, 'customers', [(uf.check_uniqueness, {'columns': ['state']})]).run()
+    assert 'should not contain nulls' in str(excinfo.value)
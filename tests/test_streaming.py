@@ -0,0 +1,161 @@
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import BinaryFeatures as bf
+from datasurveyor import CategoricalFeatures as cf
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import StreamingSurvey
+from datasurveyor import Survey
+from datasurveyor import UniqueFeatures as uf
+from datasurveyor._streaming import iter_chunks
+
+
+# mixed data with a column suited to each feature class
+data = pd.DataFrame.from_dict({
+    'id': (1, 2, 3, 4, 5, 6, 7),
+    'flag': (True, True, False, True, True, True, False),
+    'lylty': (0, 1, 0, 1, 1, 0, 0),
+    'state': ('WA', 'OR', 'WA', 'Null', 'WA', 'ID', 'OR'),
+    'spend': (0.0, np.nan, 10.0, 150.0, 12.0, 0.0, np.nan),
+})
+
+checks = [
+    (bf.check_all_same, {'columns': ['flag', 'lylty']}),
+    (bf.check_mostly_same, {'columns': ['flag', 'lylty'], 'thresh': 0.7}),
+    (bf.check_outside_range, {'columns': ['flag', 'lylty']}),
+    (cf.check_mostly_same, {'columns': ['state', 'lylty'], 'thresh': 0.4}),
+    (cf.check_n_categories, {'columns': ['state', 'lylty']}),
+    gf.check_nulls,
+    (gf.check_fuzzy_nulls, {'add_fuzzy_nulls': ['OR']}),
+    (uf.check_uniqueness, {'columns': ['id']}),
+]
+
+
+# checks reading only the minimum, maximum, and sum of each column
+binary_checks = [bf.check_all_same, (bf.check_mostly_same, {'thresh': 0.7}), bf.check_outside_range]
+
+
+def chunks(df, size):
+    # splits a DataFrame into chunks of the given number of rows
+    return (df.iloc[i:i + size] for i in range(0, df.shape[0], size))
+
+
+def assert_results_equal(left, right):
+    # verifies two survey outputs contain identical frames
+    assert list(left) == list(right)
+    for name in left:
+        assert left[name].equals(right[name]), name
+
+
+def test_streaming_matches_survey_chunks():
+    # verifies that surveying chunks matches surveying the full data
+    expected = Survey(data, checks).run()
+    assert_results_equal(StreamingSurvey(chunks(data, 3), checks).run(), expected)
+
+
+def test_streaming_matches_survey_csv(tmp_path):
+    # verifies that surveying a CSV file in chunks matches surveying the full data
+    path = tmp_path / 'data.csv'
+    data.to_csv(path, index=False)
+    expected = Survey(data, checks).run()
+    assert_results_equal(StreamingSurvey(path, checks, chunksize=2).run(), expected)
+
+
+def test_streaming_matches_survey_json_lines(tmp_path):
+    # verifies that surveying a JSON lines file in chunks matches surveying the full data
+    path = tmp_path / 'data.jsonl'
+    data.to_json(path, orient='records', lines=True)
+    expected = Survey(data, [gf.check_nulls, (cf.check_n_categories, {'columns': ['state']})]).run()
+    result = StreamingSurvey(path, [gf.check_nulls, (cf.check_n_categories, {'columns': ['state']})], chunksize=4)
+    assert_results_equal(result.run(), expected)
+
+
+def test_streaming_matches_survey_parquet(tmp_path):
+    # verifies that surveying a Parquet file in batches matches surveying the full data
+    pytest.importorskip('pyarrow')
+    path = tmp_path / 'data.parquet'
+    data.to_parquet(path, index=False)
+    expected = Survey(data, checks).run()
+    assert_results_equal(StreamingSurvey(path, checks, chunksize=3).run(), expected)
+
+
+def test_streaming_matches_survey_npy(tmp_path):
+    # verifies that surveying a memory-mapped NumPy array in chunks matches surveying it in memory
+    path = tmp_path / 'data.npy'
+    array = data[['flag', 'lylty']].to_numpy(dtype='int8')
+    np.save(path, array)
+    expected = Survey(pd.DataFrame(array), binary_checks).run()
+    assert_results_equal(StreamingSurvey(path, binary_checks, chunksize=3).run(), expected)
+    np.save(path, np.asfortranarray(array))
+    assert_results_equal(StreamingSurvey(path, binary_checks, chunksize=3).run(), expected)
+
+
+def test_iter_chunks_npy_views(tmp_path):
+    # verifies that chunks of a NumPy array are read-only views of the mapped file
+    path = tmp_path / 'data.npy'
+    np.save(path, np.arange(10))
+    result = list(iter_chunks(path, chunksize=4))
+    assert [chunk[0].tolist() for chunk in result] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert not result[1].to_numpy().flags.writeable
+
+
+def test_iter_chunks_npy_dimensions(tmp_path):
+    # checks that ValueError is raised for arrays of more than 2 dimensions
+    path = tmp_path / 'data.npy'
+    np.save(path, np.zeros((2, 2, 2)))
+    with pytest.raises(ValueError) as excinfo:
+        list(iter_chunks(path))
+    # verifies ValueError contains appropriate message
+    assert 'with 3 dimensions' in str(excinfo.value)
+
+
+def test_streaming_matches_survey_arrow_ipc(tmp_path):
+    # verifies that surveying a memory-mapped Arrow IPC file matches surveying the full data
+    feather = pytest.importorskip('pyarrow.feather')
+    path = tmp_path / 'data.feather'
+    feather.write_feather(data, path, chunksize=4, compression='uncompressed')
+    expected = Survey(data, checks).run()
+    assert_results_equal(StreamingSurvey(path, checks, chunksize=3).run(), expected)
+
+
+def test_streaming_fuzzy_patterns():
+    # verifies that normalized and pattern matched fuzzy nulls stream like the direct check
+    fuzzy = [(gf.check_fuzzy_nulls, {'patterns': ['o.'], 'normalize': True})]
+    result = StreamingSurvey(chunks(data, 2), fuzzy).run()['GeneralFeatures.check_fuzzy_nulls']
+    assert result.equals(gf.check_fuzzy_nulls(data, patterns=['o.'], normalize=True))
+    assert result.loc[:, 'fuzzy_null_count'].tolist() == [0, 0, 0, 3, 0]
+
+
+def test_streaming_validates_dtype():
+    # checks that TypeError is raised when a check is applied to the wrong dtype
+    with pytest.raises(TypeError) as excinfo:
+        StreamingSurvey(chunks(data, 3), [bf.check_all_same]).run()
+    # verifies TypeError contains appropriate message
+    assert 'should be of type bool or int64' in str(excinfo.value)
+
+
+def test_streaming_detects_nan_unique():
+    # checks that ValueError is raised when unique data contains nulls in a later chunk
+    nan_ids = pd.DataFrame.from_dict({'id': ('a', 'b', 'c', np.nan)})
+    with pytest.raises(ValueError) as excinfo:
+        StreamingSurvey(chunks(nan_ids, 2), [uf.check_uniqueness]).run()
+    # verifies ValueError contains appropriate message
+    assert 'should not contain nulls' in str(excinfo.value)
+
+
+def test_streaming_empty_source():
+    # checks that ValueError is raised when there are no chunks to survey
+    with pytest.raises(ValueError) as excinfo:
+        StreamingSurvey([], [gf.check_nulls]).run()
+    # verifies ValueError contains appropriate message
+    assert 'did not contain any data' in str(excinfo.value)
+
+
+def test_streaming_unknown_file_type(tmp_path):
+    # checks that ValueError is raised for unsupported file types
+    with pytest.raises(ValueError) as excinfo:
+        StreamingSurvey(tmp_path / 'data.xlsx', [gf.check_nulls]).run()
+    # verifies ValueError contains appropriate message
+    assert 'Unable to survey files of type .xlsx' in str(excinfo.value)
@@ -0,0 +1,116 @@
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import BinaryFeatures as bf
+from datasurveyor import CategoricalFeatures as cf
+from datasurveyor import ColumnSummary
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import StreamingSurvey
+
+
+# data sharded by date into three partitions
+shards = [
+    pd.DataFrame.from_dict({
+        'flag': (True, True, False),
+        'state': ('WA', 'OR', np.nan),
+        'spend': (0.0, np.nan, 10.0),
+    }),
+    pd.DataFrame.from_dict({
+        'flag': (True, True),
+        'state': ('WA', 'WA'),
+        'spend': (150.0, 12.0),
+    }),
+    pd.DataFrame.from_dict({
+        'flag': (True, False, True),
+        'state': ('OR', 'ID', 'WA'),
+        'spend': (np.nan, 0.0, -10.0),
+    }),
+]
+full = pd.concat(shards, ignore_index=True)
+
+checks = [
+    (bf.check_mostly_same, {'columns': ['flag'], 'thresh': 0.7}),
+    (cf.check_mostly_same, {'columns': ['state'], 'thresh': 0.4}),
+    gf.check_nulls,
+]
+
+
+def test_merged_partitions_match_full_data():
+    # verifies that merging partition summaries matches checking the concatenated data
+    partials = [StreamingSurvey([shard], checks).summarize() for shard in shards]
+    results = StreamingSurvey.from_summaries(StreamingSurvey.merge_summaries(partials), checks)
+    assert results['BinaryFeatures.check_mostly_same'].equals(bf.check_mostly_same(full[['flag']], 0.7))
+    assert results['CategoricalFeatures.check_mostly_same'].equals(cf.check_mostly_same(full[['state']], 0.4))
+    assert results['GeneralFeatures.check_nulls'].equals(gf.check_nulls(full))
+
+
+def test_null_dominant_modes_match_full_data():
+    # verifies that columns where nulls win the mode count it as 0, like checking the data directly
+    df = pd.DataFrame.from_dict({
+        'a': ('x', None, None, None, 'y'),
+        'b': (None, None, None, None, None),
+    }, dtype=object)
+    parts = [df.iloc[:2], df.iloc[2:]]
+    partials = [StreamingSurvey([part], [cf.check_mostly_same]).summarize() for part in parts]
+    merged = StreamingSurvey.merge_summaries(partials)
+    results = StreamingSurvey.from_summaries(merged, [(cf.check_mostly_same, {'thresh': 0.5})])
+    expected = cf.check_mostly_same(df, 0.5)
+    # the direct check keeps the null of the object column, while summaries report NaN
+    for result in (results['CategoricalFeatures.check_mostly_same'], cf.check_mostly_same(parts, 0.5)):
+        assert result['most_common'].isna().all()
+        assert result.drop(columns='most_common').equals(expected.drop(columns='most_common'))
+    assert expected['count'].tolist() == [0, 0]
+
+
+def test_serialized_partitions_match_full_data():
+    # verifies that summaries survive a round trip through bytes before being merged
+    partials = [
+        {column: ColumnSummary.from_bytes(summary.to_bytes()) for column, summary in partial.items()}
+        for partial in (StreamingSurvey([shard], checks).summarize() for shard in shards)
+    ]
+    results = StreamingSurvey.from_summaries(StreamingSurvey.merge_summaries(partials), checks)
+    assert results['GeneralFeatures.check_nulls'].equals(gf.check_nulls(full))
+
+
+def test_summary_merge():
+    # verifies that merging summaries matches summarizing the concatenated column
+    left = ColumnSummary(track_min_max=True, track_sum=True, track_counts=True).update(full['spend'].iloc[:4])
+    right = ColumnSummary(track_min_max=True, track_sum=True, track_counts=True).update(full['spend'].iloc[4:])
+    merged = left.merge(right)
+    assert merged.n_rows == 8
+    assert merged.null_count == 2
+    assert merged.min == -10.0
+    assert merged.max == 150.0
+    assert merged.stat(('mean',)) == full['spend'].mean()
+    assert merged.stat(('nunique', False)) == full['spend'].nunique(dropna=False)
+    assert merged.stat(('mode', True)) == (0.0, 2)
+
+
+def test_summary_merge_mismatched():
+    # checks that ValueError is raised when merging summaries tracking different statistics
+    with pytest.raises(ValueError) as excinfo:
+        ColumnSummary(track_sum=True).merge(ColumnSummary(track_counts=True))
+    # verifies ValueError contains appropriate message
+    assert 'tracking the same statistics' in str(excinfo.value)
+
+
+def test_summary_untracked_stat():
+    # checks that ValueError is raised when asking for a statistic that was not tracked
+    with pytest.raises(ValueError) as excinfo:
+        ColumnSummary().update(full['spend']).stat(('min',))
+    # verifies ValueError contains appropriate message
+    assert 'is not tracked' in str(excinfo.value)
+
+
+def test_merge_summaries_mismatched_columns():
+    # checks that ValueError is raised when partitions do not share the same columns
+    partials = [
+        StreamingSurvey([shards[0]], [gf.check_nulls]).summarize(),
+        StreamingSurvey([shards[1][['flag']]], [gf.check_nulls]).summarize(),
+    ]
+    with pytest.raises(ValueError) as excinfo:
+        StreamingSurvey.merge_summaries(partials)
+    # verifies ValueError contains appropriate message
+    assert 'with the same columns' in str(excinfo.value)
@@ -0,0 +1,191 @@
+# third party imports
+import numpy as np
+import pandas as pd
+import pytest
+# local imports
+from datasurveyor import BinaryFeatures as bf
+from datasurveyor import CategoricalFeatures as cf
+from datasurveyor import GeneralFeatures as gf
+from datasurveyor import Survey
+from datasurveyor import UniqueFeatures as uf
+
+
+# mixed data with a column suited to each feature class
+data = pd.DataFrame.from_dict({
+    'id': (1, 2, 3, 4, 5, 6),
+    'flag': (True, True, False, True, True, True),
+    'lylty': (0, 1, 0, 1, 1, 0),
+    'state': ('WA', 'OR', 'WA', 'Null', 'WA', np.nan),
+    'spend': (0.0, np.nan, 10.0, 150.0, 12.0, 0.0),
+})
+
+binary = ['flag', 'lylty']
+categorical = ['state', 'lylty']
+
+# segmented data, with a row of no segment that is dropped when grouping
+segments = pd.DataFrame.from_dict({
+    'seg': ('a', 'a', 'b', 'b', 'b', 'c', 'c', 'a', 'b', None),
+    'day': (1, 1, 1, 2, 2, 1, 1, 2, 2, 1),
+    'id': (1, 2, 3, 4, 5, 6, 7, 8, 9, 10),
+    'flag': (True, True, False, True, True, True, False, True, False, True),
+    'lylty': (0, 1, 0, 1, 1, 0, 0, 1, 1, 1),
+    'state': ('WA', 'WA', 'OR', 'Null', None, 'ID', 'ID', None, 'OR', 'WA'),
+    'spend': (0.0, np.nan, 10.0, 150.0, 12.0, 0.0, np.nan, 3.0, 4.0, 5.0),
+})
+
+# should raise ValueError when surveyed for uniqueness
+nan_ids = pd.DataFrame.from_dict({'id': ('a', 'b', np.nan)})
+
+
+def test_survey_matches_checks_df():
+    # verifies that every survey output matches the output of the direct check
+    checks = [
+        (bf.check_all_same, {'columns': binary}),
+        (bf.check_mostly_same, {'columns': binary, 'thresh': 0.7}),
+        (bf.check_outside_range, {'columns': binary}),
+        (cf.check_mostly_same, {'columns': categorical, 'thresh': 0.4}),
+        (cf.check_n_categories, {'columns': categorical, 'dropna': True}),
+        gf.check_nulls,
+        (gf.check_fuzzy_nulls, {'add_fuzzy_nulls': ['OR']}),
+        (uf.check_uniqueness, {'columns': ['id']}),
+    ]
+    results = Survey(data, checks).run()
+    assert results['BinaryFeatures.check_all_same'].equals(bf.check_all_same(data[binary]))
+    assert results['BinaryFeatures.check_mostly_same'].equals(bf.check_mostly_same(data[binary], 0.7))
+    assert results['BinaryFeatures.check_outside_range'].equals(bf.check_outside_range(data[binary]))
+    assert results['CategoricalFeatures.check_mostly_same'].equals(cf.check_mostly_same(data[categorical], 0.4))
+    assert results['CategoricalFeatures.check_n_categories'].equals(
+        cf.check_n_categories(data[categorical], dropna=True)
+    )
+    assert results['GeneralFeatures.check_nulls'].equals(gf.check_nulls(data))
+    assert results['GeneralFeatures.check_fuzzy_nulls'].equals(gf.check_fuzzy_nulls(data, add_fuzzy_nulls=['OR']))
+    assert results['UniqueFeatures.check_uniqueness'].equals(uf.check_uniqueness(data[['id']]))
+
+
+def test_survey_matches_checks_ser():
+    # verifies that surveying a series matches the output of the direct checks
+    results = Survey(data['lylty'], [bf.check_all_same, 'GeneralFeatures.check_nulls']).run()
+    assert results['BinaryFeatures.check_all_same'].equals(bf.check_all_same(data['lylty']))
+    assert results['GeneralFeatures.check_nulls'].equals(gf.check_nulls(data['lylty']))
+
+
+def test_survey_mode_ser():
+    # verifies that surveying a series ignores nulls when finding its most common category
+    states = pd.Series(['x', None, None, None, 'y', 'x'])
+    results = Survey(states, [(cf.check_mostly_same, {'thresh': 0.3})]).run()
+    expected = cf.check_mostly_same(states, 0.3)
+    assert results['CategoricalFeatures.check_mostly_same'].equals(expected)
+    assert expected.loc[0, 'most_common'] == 'x'
+
+
+def test_survey_preserves_check_order():
+    # verifies that results are returned in the order the checks were requested
+    results = Survey(data, [gf.check_nulls, (bf.check_all_same, {'columns': binary})]).run()
+    assert list(results) == ['GeneralFeatures.check_nulls', 'BinaryFeatures.check_all_same']
+
+
+def test_survey_validates_dtype():
+    # checks that TypeError is raised when a check is applied to the wrong dtype
+    with pytest.raises(TypeError) as excinfo:
+        Survey(data, [bf.check_all_same]).run()
+    # verifies TypeError contains appropriate message
+    assert 'should be of type bool or int64' in str(excinfo.value)
+
+
+def test_survey_validates_thresh():
+    # checks that ValueError is raised when thresh is out of range
+    with pytest.raises(ValueError) as excinfo:
+        Survey(data, [(bf.check_mostly_same, {'columns': binary, 'thresh': 1.5})]).run()
+    # verifies ValueError contains appropriate message
+    assert 'must be greater than 0.0 and less than 1.0' in str(excinfo.value)
+
+
+def test_survey_detects_nan_unique():
+    # checks that ValueError is raised when unique data contains nulls
+    with pytest.raises(ValueError) as excinfo:
+        Survey(nan_ids, [uf.check_uniqueness]).run()
+    # verifies ValueError contains appropriate message
+    assert 'should not contain nulls' in str(excinfo.value)
+
+
+def test_survey_unknown_check():
+    # checks that ValueError is raised for checks outside of the feature classes
+    with pytest.raises(ValueError) as excinfo:
+        Survey(data, [pd.DataFrame.isna])
+    # verifies ValueError contains appropriate message
+    assert 'Unknown check' in str(excinfo.value)
+
+
+def test_survey_bad_argument():
+    # checks that TypeError is raised for arguments the check does not accept
+    with pytest.raises(TypeError):
+        Survey(data, [(gf.check_nulls, {'thresh': 0.5})])
+
+
+def test_survey_duplicate_check():
+    # checks that ValueError is raised when a check is requested twice
+    with pytest.raises(ValueError) as excinfo:
+        Survey(data, [gf.check_nulls, 'GeneralFeatures.check_nulls'])
+    # verifies ValueError contains appropriate message
+    assert 'only be requested once' in str(excinfo.value)
+
+
+def test_survey_approx_check():
+    # checks that ValueError is raised for checks estimated with a sketch
+    with pytest.raises(ValueError) as excinfo:
+        Survey(data, [(uf.check_uniqueness, {'approx': True})])
+    # verifies ValueError contains appropriate message
+    assert 'Approximate checks cannot be surveyed' in str(excinfo.value)
+
+
+def test_survey_grouped_matches_groups():
+    # verifies that the rows of each group match the direct checks on the rows of the group
+    checks = [
+        (bf.check_all_same, {'columns': binary}),
+        (bf.check_mostly_same, {'columns': binary, 'thresh': 0.7}),
+        (cf.check_mostly_same, {'columns': ['state'], 'thresh': 0.4, 'top_k': 2}),
+        (cf.check_n_categories, {'columns': categorical}),
+        (gf.check_nulls, {'columns': ['state', 'spend']}),
+        (gf.check_fuzzy_nulls, {'columns': ['state'], 'add_fuzzy_nulls': ['OR']}),
+        (uf.check_uniqueness, {'columns': ['id']}),
+    ]
+    results = Survey(segments.drop(columns='day'), checks, by='seg').run()
+    for seg, part in segments.groupby('seg'):
+        expected = {
+            'BinaryFeatures.check_all_same': bf.check_all_same(part[binary]),
+            'BinaryFeatures.check_mostly_same': bf.check_mostly_same(part[binary], 0.7),
+            'CategoricalFeatures.check_mostly_same': cf.check_mostly_same(part[['state']], 0.4, top_k=2),
+            'CategoricalFeatures.check_n_categories': cf.check_n_categories(part[categorical]),
+            'GeneralFeatures.check_nulls': gf.check_nulls(part[['state', 'spend']]),
+            'GeneralFeatures.check_fuzzy_nulls': gf.check_fuzzy_nulls(part[['state']], ['OR']),
+            'UniqueFeatures.check_uniqueness': uf.check_uniqueness(part[['id']]),
+        }
+        for name, result in results.items():
+            rows = result.loc[result['seg'] == seg].drop(columns='seg').reset_index(drop=True)
+            assert rows.equals(expected[name]), name
+
+
+def test_survey_grouped_keys():
+    # verifies that outputs lead with the keys of each group, dropping rows of null keys
+    result = Survey(segments, [gf.check_nulls], by=['seg', 'day']).run()['GeneralFeatures.check_nulls']
+    assert list(result.columns[:3]) == ['seg', 'day', 'column']
+    groups = result[['seg', 'day']].drop_duplicates().values.tolist()
+    assert groups == [['a', 1], ['a', 2], ['b', 1], ['b', 2], ['c', 1]]
+    assert result['column'].tolist()[:5] == ['id', 'flag', 'lylty', 'state', 'spend']
+    assert result.loc[result['column'] == 'state', 'null_count'].tolist() == [0, 1, 0, 1, 0]
+
+
+def test_survey_grouped_checks_key():
+    # checks that ValueError is raised when a column grouped by is checked
+    with pytest.raises(ValueError) as excinfo:
+        Survey(segments, [(gf.check_nulls, {'columns': ['seg']})], by='seg').run()
+    # verifies ValueError contains appropriate message
+    assert 'cannot be checked' in str(excinfo.value)
+
+
+def test_survey_grouped_series():
+    # checks that ValueError is raised when grouping a Series
+    with pytest.raises(ValueError) as excinfo:
+        Survey(segments['state'], [gf.check_nulls], by='seg')
+    # verifies ValueError contains appropriate message
+    assert 'Only the rows of a DataFrame' in str(excinfo.value)
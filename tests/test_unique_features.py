@@ -108,3 +108,51 @@ def test_check_uniques_bad_df():
 def test_check_uniques_bad_ser():
     # verifies that the uniqueness check find duplicates (bool)
     assert fail_dupe_ser.equals(uf.check_uniqueness(bad_unique['b1']))
+
+
+def test_check_uniqueness_approx_large_unique():
+    # verifies that estimated duplicates within the error of the sketch are not flagged
+    unique = pd.Series(np.arange(200_000))
+    result = uf.check_uniqueness(unique, approx=True)
+    assert result.loc[0, 'dupe_count'] != 0
+    assert not result.loc[0, 'dupes_present']
+    duped = pd.Series(np.concatenate([np.arange(200_000), np.arange(20_000)]))
+    assert uf.check_uniqueness(duped, approx=True).loc[0, 'dupes_present']
+
+
+def test_find_duplicates_df():
+    # verifies that duplicate counts match the uniqueness check and duplicates are located
+    result = uf.find_duplicates(bad_unique)
+    assert result.loc[:, fail_dupe_df.columns].equals(fail_dupe_df)
+    assert result.loc[0, 'dupe_values'] == [0, 1]
+    assert result.loc[0, 'dupe_positions'] == [[0, 2], [1, 3]]
+    assert result.loc[1, 'dupe_values'] == []
+
+
+def test_find_duplicates_ser():
+    # verifies that duplicates are found in a series, listing a duplicate row of each value
+    result = uf.find_duplicates(bad_unique['b1'], n_examples=1)
+    assert result.loc[:, fail_dupe_ser.columns].equals(fail_dupe_ser)
+    assert result.loc[0, 'dupe_values'] == [0]
+    assert result.loc[0, 'dupe_positions'] == [[0, 2]]
+
+
+def test_find_duplicates_composite():
+    # verifies that columns can be checked together as a composite key
+    keys = pd.DataFrame.from_dict({
+        'k1': (0, 1, 0, 0),
+        'k2': ('foo', 'bar', 'baz', 'foo'),
+    })
+    result = uf.find_duplicates(keys, composite=True)
+    assert 'column' not in result.columns
+    assert result.loc[0, 'dupe_count'] == 1
+    assert result.loc[0, 'dupe_values'] == [(0, 'foo')]
+    assert result.loc[0, 'dupe_positions'] == [[0, 3]]
+
+
+def test_find_duplicates_detect_nan():
+    # checks that ValueError is raised when unique data contains nulls
+    with pytest.raises(ValueError) as excinfo:
+        uf.find_duplicates(bad_unique_nan)
+    # verifies ValueError contains appropriate message
+    assert 'should not contain nulls' in str(excinfo.value)